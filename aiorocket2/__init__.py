@@ -52,6 +52,60 @@ from .enums import *
 from .enums import __all__ as __enums_all__
 from .utils import *
 from .utils import __all__ as __utils_all__
+from .pool import *
+from .pool import __all__ as __pool_all__
+from .ratelimit import *
+from .ratelimit import __all__ as __ratelimit_all__
+from .coalesce import *
+from .coalesce import __all__ as __coalesce_all__
+from .metrics import *
+from .metrics import __all__ as __metrics_all__
+from .hedging import *
+from .hedging import __all__ as __hedging_all__
+from .timeouts import *
+from .timeouts import __all__ as __timeouts_all__
+from .breaker import *
+from .breaker import __all__ as __breaker_all__
+from .retry import *
+from .retry import __all__ as __retry_all__
+from .bulkhead import *
+from .bulkhead import __all__ as __bulkhead_all__
+from .scheduler import *
+from .scheduler import __all__ as __scheduler_all__
+from .deadline import *
+from .deadline import __all__ as __deadline_all__
+from .admission import *
+from .admission import __all__ as __admission_all__
+from .transport import *
+from .transport import __all__ as __transport_all__
+from .compression import *
+from .compression import __all__ as __compression_all__
+from .codec import *
+from .codec import __all__ as __codec_all__
+from .callinfo import *
+from .callinfo import __all__ as __callinfo_all__
+from .tenants import *
+from .tenants import __all__ as __tenants_all__
+from .sharding import *
+from .sharding import __all__ as __sharding_all__
+from .sync import *
+from .sync import __all__ as __sync_all__
+from .batching import *
+from .batching import __all__ as __batching_all__
+from .cache import *
+from .cache import __all__ as __cache_all__
+from . import runtime
 
 __all__ = __client_all__ + __exceptions_all__ \
-    + __models_all__ + __enums_all__ + __utils_all__ # type: ignore
+    + __models_all__ + __enums_all__ + __utils_all__ \
+    + __pool_all__ + __ratelimit_all__ \
+    + __coalesce_all__ + __metrics_all__ + __hedging_all__ \
+    + __timeouts_all__ + __breaker_all__ \
+    + __retry_all__ + __bulkhead_all__ \
+    + __scheduler_all__ + __deadline_all__ \
+    + __admission_all__ + __transport_all__ \
+    + __compression_all__ + __codec_all__ \
+    + __callinfo_all__ + __tenants_all__ \
+    + __sharding_all__ + __sync_all__ \
+    + __batching_all__ + __cache_all__ \
+    + ["runtime"] # type: ignore
@@ -0,0 +1,225 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Admission control and load shedding.
+
+During a traffic spike it is better to refuse some calls at once than to let
+all of them queue behind the connection pool and time out together.
+:class:`AdmissionControl` gives endpoints a maximum number of requests in
+flight and a maximum queue depth; a request arriving when both are full
+raises :class:`~aiorocket2.exceptions.RequestRejected` without waiting.
+
+With ``adaptive=True`` the in-flight limit follows observed latency (AIMD):
+it grows by one per window of fast, successful requests and shrinks by
+``decrease_factor`` whenever a request is slow or fails with a timeout, 429
+or 5xx. Failures that say nothing about the endpoint's load — an open
+circuit breaker, a spent caller deadline, a refused connection — leave the
+limit alone.
+
+Example::
+
+    admission = AdmissionControl(
+        # (max_in_flight, max_queue)
+        per_endpoint={"POST tg-invoices": (50, 100)},
+        adaptive=True,
+    )
+    async with xRocketClient(api_key="KEY", admission=admission) as client:
+        try:
+            await client.create_invoice(currency="TON", amount=1)
+        except RequestRejected:
+            ...  # tell the user to retry in a moment
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Mapping, Optional, Tuple
+
+from .bulkhead import ConcurrencyLimit
+from .deadline import remaining_time
+from .exceptions import (
+    CircuitOpenError, DeadlineExceeded, RequestRejected, xRocketAPIError
+)
+from .metrics import LatencyWindow
+
+
+__all__ = [
+    "AdmissionControl",
+    "AdmissionStats",
+]
+
+
+@dataclass
+class AdmissionStats:
+    """Admission metrics of one endpoint.
+
+    Attributes:
+        limit: Current in-flight limit (moves when adaptive).
+        max_queue: Maximum queue depth.
+        in_flight: Requests currently admitted.
+        waiting: Requests currently queued.
+        admitted: Requests admitted so far.
+        rejected: Requests shed so far.
+        max_waiting: Deepest queue observed.
+        wait_avg: Mean queue wait per admitted request (seconds).
+    """
+    limit: int
+    max_queue: int
+    in_flight: int
+    waiting: int
+    admitted: int
+    rejected: int
+    max_waiting: int
+    wait_avg: float
+
+
+def _overloaded(error: xRocketAPIError) -> Optional[bool]:
+    """Whether a failed request means the endpoint is overloaded.
+
+    ``True`` for 429, 5xx and attempt timeouts; ``None`` for failures that do
+    not reflect the endpoint's latency and must not move the AIMD limit.
+    """
+    if isinstance(error, (RequestRejected, CircuitOpenError, DeadlineExceeded)):
+        return None
+    if error.status is not None:
+        return error.status == 429 or error.status >= 500
+    if not isinstance(error.__cause__, asyncio.TimeoutError):
+        return None
+    # an attempt cut short by the caller's own deadline says nothing either
+    remaining = remaining_time()
+    return True if remaining is None or remaining > 0 else None
+
+
+class _Gate:
+    def __init__(self, max_in_flight: int, max_queue: int) -> None:
+        self.limit = ConcurrencyLimit(max_in_flight)
+        self.max_limit = max_in_flight
+        self.max_queue = max_queue
+        self.rejected = 0
+        self.window = LatencyWindow(200)
+        self.estimate = float(max_in_flight)  # fractional limit for AIMD
+
+
+class AdmissionControl:
+    """Per-endpoint in-flight and queue limits with immediate rejection.
+
+    Args:
+        per_endpoint: ``(max_in_flight, max_queue)`` per endpoint key.
+        default: Limits for endpoints not in ``per_endpoint``
+            (``None`` — unlisted endpoints are not controlled).
+        adaptive: Adjust the in-flight limit with AIMD based on latency.
+        target_latency: Latency (seconds) above which a request counts as
+            slow. ``None`` — ``tolerance`` × the endpoint's observed median.
+        tolerance: Multiplier over the observed median when ``target_latency``
+            is not set.
+        min_limit: Lowest in-flight limit AIMD may reach.
+        decrease_factor: Multiplier applied to the limit on a slow or
+            overloaded request.
+    """
+
+    def __init__(
+        self,
+        per_endpoint: Optional[Mapping[str, Tuple[int, int]]] = None,
+        *,
+        default: Optional[Tuple[int, int]] = None,
+        adaptive: bool = False,
+        target_latency: Optional[float] = None,
+        tolerance: float = 2.0,
+        min_limit: int = 1,
+        decrease_factor: float = 0.9,
+    ) -> None:
+        self.gates: Dict[str, _Gate] = {
+            key: _Gate(*limits) for key, limits in (per_endpoint or {}).items()
+        }
+        self.default = default
+        self.adaptive = adaptive
+        self.target_latency = target_latency
+        self.tolerance = tolerance
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+
+    def _gate(self, key: str) -> Optional[_Gate]:
+        gate = self.gates.get(key)
+        if gate is None and self.default is not None:
+            gate = self.gates[key] = _Gate(*self.default)
+        return gate
+
+    @asynccontextmanager
+    async def admit(self, key: str) -> AsyncIterator[None]:
+        """Admit a request to endpoint ``key`` or raise :class:`RequestRejected`."""
+        gate = self._gate(key)
+        if gate is None:
+            yield
+            return
+        limit = gate.limit
+        if limit.in_flight >= limit.limit and limit.waiting >= gate.max_queue:
+            gate.rejected += 1
+            raise RequestRejected(key)
+        await limit.acquire()
+        started = time.monotonic()
+        overloaded: Optional[bool] = False
+        try:
+            yield
+        except xRocketAPIError as e:
+            overloaded = _overloaded(e)
+            raise
+        except BaseException:
+            # cancelled or failed outside the API: nothing learned about latency
+            overloaded = None
+            raise
+        finally:
+            limit.release()
+            if self.adaptive and overloaded is not None:
+                self._adapt(gate, time.monotonic() - started, overloaded)
+
+    def _adapt(self, gate: _Gate, elapsed: float, overloaded: bool) -> None:
+        target = self.target_latency
+        if target is None and len(gate.window) >= 20:
+            target = (gate.window.percentile(0.5) or 0.0) * self.tolerance
+        if not overloaded:
+            gate.window.add(elapsed)
+        if overloaded or (target is not None and elapsed > target):
+            gate.estimate = max(self.min_limit, gate.estimate * self.decrease_factor)
+        else:
+            gate.estimate = min(gate.max_limit, gate.estimate + 1 / gate.estimate)
+        gate.limit.set_limit(int(gate.estimate))
+
+    def stats(self) -> Dict[str, AdmissionStats]:
+        """Return admission metrics per endpoint key."""
+        result = {}
+        for key, gate in self.gates.items():
+            limit = gate.limit
+            result[key] = AdmissionStats(
+                limit=limit.limit,
+                max_queue=gate.max_queue,
+                in_flight=limit.in_flight,
+                waiting=limit.waiting,
+                admitted=limit.acquired,
+                rejected=gate.rejected,
+                max_waiting=limit.max_waiting,
+                wait_avg=(
+                    limit.wait_total / limit.acquired if limit.acquired else 0.0
+                ),
+            )
+        return result
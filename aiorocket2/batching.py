@@ -0,0 +1,298 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""DataLoader-style batching of lookups by id.
+
+With a :class:`BatchLoader` on :class:`aiorocket2.client.xRocketClient`,
+``get_invoice`` and ``get_multi_cheque`` calls arriving within a short window
+are collected and answered together: one or a few list page scans
+(``get_invoices`` / ``get_multi_cheques`` with the largest page) find the
+recent ids (the list endpoints return the newest items first), and only the
+ids the scan did not find are fetched one by one. A dozen lookups of fresh
+invoices then cost one round trip instead of a dozen.
+
+Ids older than the oldest one the last full scan saw skip the scan and go
+straight to per-id requests, as do batches too small to be worth a page.
+Errors of a per-id request (for example ``404``) reach only that id's caller;
+a failed scan falls back to per-id requests.
+
+Lookups answered together receive the same parsed item; treat it as
+read-only. The batch is sent from the loader's own task, so
+:func:`~aiorocket2.callinfo.collect_call_info` records the scans and
+per-id requests there, not in the caller's log.
+
+Example::
+
+    loader = BatchLoader(window=0.005)
+    async with xRocketClient(api_key="KEY", batching=loader) as client:
+        invoices = await asyncio.gather(*(client.get_invoice(i) for i in ids))
+        print(loader.stats())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .callinfo import current_call
+from .deadline import remaining_time
+from .exceptions import DeadlineExceeded
+
+
+__all__ = [
+    "BatchLoader",
+    "BatchStats",
+]
+
+MAX_PAGE_SIZE = 1000
+"""Largest ``limit`` the list endpoints accept."""
+
+
+@dataclass
+class BatchStats:
+    """Counters of a :class:`BatchLoader`.
+
+    Attributes:
+        lookups: Lookups received.
+        batches: Batches sent.
+        scans: List pages fetched.
+        scan_hits: Distinct ids answered from a list page.
+        fallbacks: Distinct ids fetched with their own request.
+    """
+    lookups: int
+    batches: int
+    scans: int
+    scan_hits: int
+    fallbacks: int
+
+
+class _Batch:
+    """Lookups of one client and list endpoint waiting to be sent."""
+
+    __slots__ = ("client", "endpoint", "ids", "handle")
+
+    def __init__(self, client: Any, endpoint: str) -> None:
+        self.client = client
+        self.endpoint = endpoint
+        self.ids: Dict[str, Tuple[Any, asyncio.Future]] = {}
+        self.handle: Optional[asyncio.Handle] = None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_recent(item_id: Any, floor: Optional[int]) -> bool:
+    number = _as_int(item_id)
+    return floor is None or number is None or number >= floor
+
+
+class BatchLoader:
+    """Collects lookups by id and answers them from list page scans.
+
+    One loader may serve several clients (for example the views of a
+    :class:`~aiorocket2.tenants.TenantManager`); batches never mix clients.
+
+    Args:
+        window: Seconds to collect lookups before sending a batch.
+        max_batch: Send the batch early once this many distinct ids wait.
+        scan_pages: Most list pages scanned per batch.
+        page_size: Items per scanned page (at most 1000).
+        min_scan: Smallest number of scannable ids worth a page scan;
+            smaller batches use per-id requests only.
+    """
+
+    def __init__(
+        self,
+        window: float = 0.002,
+        *,
+        max_batch: int = 100,
+        scan_pages: int = 1,
+        page_size: int = MAX_PAGE_SIZE,
+        min_scan: int = 2,
+    ) -> None:
+        if window < 0:
+            raise ValueError("window must be >= 0")
+        if max_batch < 1 or scan_pages < 0 or min_scan < 1:
+            raise ValueError("max_batch and min_scan must be >= 1, scan_pages >= 0")
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        self.window = window
+        self.max_batch = max_batch
+        self.scan_pages = scan_pages
+        self.page_size = page_size
+        self.min_scan = min_scan
+        self.lookups = 0
+        self.batches = 0
+        self.scans = 0
+        self.scan_hits = 0
+        self.fallbacks = 0
+        self._pending: Dict[Tuple[Any, str], _Batch] = {}
+        # lowest numeric id seen by the last scan that did not reach the end
+        # of the list, per client and endpoint: older ids are not scanned for.
+        # Weakly keyed so that a loader shared by many clients does not keep
+        # the closed ones alive.
+        self._floor: weakref.WeakKeyDictionary[Any, Dict[str, int]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, client: Any, endpoint: str, item_id: Any) -> Dict[str, Any]:
+        """Return the API ``data`` of ``{endpoint}/{item_id}``, batched with others.
+
+        Args:
+            client: Client sending the requests.
+            endpoint: List endpoint, ``"tg-invoices"`` or ``"multi-cheque"``.
+            item_id: Id to look up.
+
+        Returns:
+            Dict[str, Any]: The item as returned by the API.
+
+        Raises:
+            xRocketAPIError: If the item's own request fails.
+        """
+        self.lookups += 1
+        if current_call.get() is not None:
+            current_call.set(None)
+        loop = asyncio.get_running_loop()
+        key: Tuple[Any, str] = (client, endpoint)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(client, endpoint)
+            # a fresh context: the batch must not inherit one caller's deadline
+            # or priority
+            batch.handle = loop.call_later(
+                self.window, self._send, key, context=contextvars.Context()
+            )
+        entry = batch.ids.get(str(item_id))
+        if entry is None:
+            entry = batch.ids[str(item_id)] = (item_id, loop.create_future())
+            if len(batch.ids) >= self.max_batch:
+                if batch.handle is not None:
+                    batch.handle.cancel()
+                loop.call_soon(self._send, key, context=contextvars.Context())
+        # one caller giving up must not cancel the lookup for the others
+        future = asyncio.shield(entry[1])
+        remaining = remaining_time()
+        if remaining is None:
+            return await future
+        try:
+            return await asyncio.wait_for(future, max(remaining, 0))
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(
+                f"Deadline exceeded while waiting for {endpoint}/{item_id}"
+            ) from None
+
+    def _send(self, key: Tuple[Any, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        wanted = dict(batch.ids)
+        try:
+            try:
+                await self._scan(batch, wanted)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass  # the ids still wanted are fetched one by one below
+            if wanted:
+                self.fallbacks += len(wanted)
+                await asyncio.gather(*(
+                    self._fetch(batch, item_id, future)
+                    for item_id, future in wanted.values()
+                ))
+        finally:
+            for _, future in batch.ids.values():
+                if not future.done():
+                    future.cancel()
+
+    async def _scan(
+        self, batch: _Batch, wanted: Dict[str, Tuple[Any, asyncio.Future]]
+    ) -> None:
+        floors = self._floor.setdefault(batch.client, {})
+        floor = floors.get(batch.endpoint)
+        scannable = [
+            i for i, (item_id, _) in wanted.items() if _is_recent(item_id, floor)
+        ]
+        if not self.scan_pages or len(scannable) < self.min_scan:
+            return
+        for page in range(self.scan_pages):
+            params = {"limit": self.page_size, "offset": page * self.page_size}
+            payload = await batch.client._request("GET", batch.endpoint, params=params)
+            self.scans += 1
+            data = payload["data"]
+            results: List[Dict[str, Any]] = data.get("results") or []
+            for item in results:
+                entry = wanted.pop(str(item.get("id")), None)
+                if entry is not None:
+                    self.scan_hits += 1
+                    if not entry[1].done():
+                        entry[1].set_result(item)
+            end = (page + 1) * self.page_size >= (data.get("total") or 0)
+            if end or len(results) < self.page_size:
+                floors.pop(batch.endpoint, None)
+                return
+            if not any(i in wanted for i in scannable):
+                return
+        ids = [
+            i for i in (_as_int(item.get("id")) for item in results) if i is not None
+        ]
+        if ids:
+            floors[batch.endpoint] = min(ids)
+
+    async def _fetch(
+        self, batch: _Batch, item_id: Any, future: asyncio.Future
+    ) -> None:
+        try:
+            payload = await batch.client._request(
+                "GET", f"{batch.endpoint}/{item_id}"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # mark retrieved even if every caller gave up
+        else:
+            if not future.done():
+                future.set_result(payload["data"])
+
+    def stats(self) -> BatchStats:
+        """Return lookup, scan and fallback counters."""
+        return BatchStats(
+            lookups=self.lookups,
+            batches=self.batches,
+            scans=self.scans,
+            scan_hits=self.scan_hits,
+            fallbacks=self.fallbacks,
+        )
@@ -0,0 +1,150 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Client-side circuit breaker.
+
+During an xRocket incident, waiting through timeouts, retries and backoff
+for every call only stalls the event loop and the connection pool. A
+:class:`CircuitBreaker` on :class:`aiorocket2.client.xRocketClient` watches
+the outcome of recent attempts and *opens* when too many of them fail or are
+too slow; while open, requests raise
+:class:`~aiorocket2.exceptions.CircuitOpenError` immediately. After
+``open_timeout`` the breaker goes *half-open* and probes the API in the
+background with
+:meth:`Health.check_health <aiorocket2.tags.health.Health.check_health>`; a
+healthy answer closes it again.
+
+Example::
+
+    def on_change(old, new):
+        log.warning("xRocket circuit %s -> %s", old, new)
+
+    breaker = CircuitBreaker(
+        failure_rate=0.5, open_timeout=15, on_state_change=on_change
+    )
+    client = xRocketClient(api_key="KEY", circuit_breaker=breaker)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple
+
+from .enums import CircuitState
+from .exceptions import CircuitOpenError
+
+
+__all__ = [
+    "CircuitBreaker",
+]
+
+
+class CircuitBreaker:
+    """Opens on error-rate or latency thresholds and fails fast while open.
+
+    Args:
+        failure_rate: Fraction of failed attempts in the window that opens the
+            breaker. Network errors, timeouts and 5xx responses count as failures.
+        slow_call_rate: Fraction of slow attempts in the window that opens the
+            breaker (``None`` — latency is ignored).
+        slow_call_threshold: Attempts slower than this many seconds are slow.
+        window_size: Number of most recent attempts evaluated.
+        min_calls: Attempts needed in the window before the breaker may open.
+        open_timeout: Seconds to stay open before probing the API.
+        on_state_change: Called as ``on_state_change(old, new)`` with
+            :class:`~aiorocket2.enums.CircuitState` members on every transition.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        slow_call_rate: Optional[float] = None,
+        slow_call_threshold: float = 5.0,
+        window_size: int = 50,
+        min_calls: int = 20,
+        open_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[CircuitState, CircuitState], None]] = None,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_threshold = slow_call_threshold
+        self.min_calls = min_calls
+        self.open_timeout = open_timeout
+        self.on_state_change = on_state_change
+        self.state = CircuitState.CLOSED
+        # (failed, slow) per attempt
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe: Optional[asyncio.Task] = None
+
+    def _transition(self, state: CircuitState) -> None:
+        old, self.state = self.state, state
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state is CircuitState.CLOSED:
+            self._window.clear()
+        if old is not state and self.on_state_change is not None:
+            self.on_state_change(old, state)
+
+    def check(self, probe: Callable[[], Awaitable[bool]]) -> None:
+        """Raise :class:`CircuitOpenError` unless a request may be sent now.
+
+        Args:
+            probe: Coroutine factory returning whether the API is healthy; it
+                is started in the background once ``open_timeout`` has passed.
+        """
+        if self.state is CircuitState.CLOSED:
+            return
+        retry_in = self._opened_at + self.open_timeout - time.monotonic()
+        if self.state is CircuitState.OPEN and retry_in <= 0:
+            self._transition(CircuitState.HALF_OPEN)
+            # a fresh context: the probe must not inherit the deadline,
+            # priority or call_info() log of the request that started it
+            self._probe = contextvars.Context().run(
+                asyncio.ensure_future, self._run_probe(probe)
+            )
+        raise CircuitOpenError(max(0.0, retry_in))
+
+    async def _run_probe(self, probe: Callable[[], Awaitable[bool]]) -> None:
+        try:
+            healthy = await probe()
+        except Exception:
+            healthy = False
+        self._transition(CircuitState.CLOSED if healthy else CircuitState.OPEN)
+
+    def record(self, failed: bool, elapsed: float) -> None:
+        """Record the outcome of one attempt and open the breaker if needed."""
+        if self.state is not CircuitState.CLOSED:
+            return
+        self._window.append((failed, elapsed >= self.slow_call_threshold))
+        calls = len(self._window)
+        if calls < self.min_calls:
+            return
+        failures = sum(1 for failed_, _ in self._window if failed_)
+        slow = sum(1 for _, slow_ in self._window if slow_)
+        if failures / calls >= self.failure_rate or (
+            self.slow_call_rate is not None and slow / calls >= self.slow_call_rate
+        ):
+            self._transition(CircuitState.OPEN)
@@ -0,0 +1,216 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Bulkheads: separate concurrency limits per tag and per endpoint.
+
+A back-office job paging through ``get_invoices`` should not be able to take
+every pooled connection away from ``create_invoice``. :class:`Bulkheads`
+gives each tag (``App``, ``TgInvoices``, ``MultiCheque``, ``WithdrawalLink``,
+``Currencies``, ``Health``, ``Version``) and optionally individual endpoints
+their own compartment: a FIFO concurrency limit with queue-depth metrics.
+Requests beyond the limit wait in their compartment's queue instead of
+competing for the connection pool.
+
+Example::
+
+    bulkheads = Bulkheads(
+        per_tag={"TgInvoices": 20, "MultiCheque": 4},
+        per_endpoint={"GET tg-invoices": 2},   # bulk listing
+    )
+    async with xRocketClient(api_key="KEY", bulkheads=bulkheads) as client:
+        ...
+        print(bulkheads.stats())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, List, Mapping, Optional
+
+from .utils import endpoint_tag
+
+
+__all__ = [
+    "ConcurrencyLimit",
+    "CompartmentStats",
+    "Bulkheads",
+]
+
+
+@dataclass
+class CompartmentStats:
+    """Snapshot of one :class:`ConcurrencyLimit`.
+
+    Attributes:
+        limit: Maximum concurrent requests.
+        in_flight: Requests currently holding a slot.
+        waiting: Requests currently queued for a slot (queue depth).
+        max_waiting: Deepest queue observed.
+        acquired: Slots handed out so far.
+        wait_avg: Mean time spent queued per acquired slot (seconds).
+        wait_max: Longest time spent queued (seconds).
+    """
+    limit: int
+    in_flight: int
+    waiting: int
+    max_waiting: int
+    acquired: int
+    wait_avg: float
+    wait_max: float
+
+
+class ConcurrencyLimit:
+    """FIFO concurrency limit with queue metrics; the limit may change at runtime."""
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.in_flight = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Requests currently queued."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.acquired += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.max_waiting = max(self.max_waiting, len(self._waiters))
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # the slot was granted just before cancellation
+            elif future in self._waiters:  # _wake may have dropped it already
+                self._waiters.remove(future)
+            raise
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next queued request."""
+        self.in_flight -= 1
+        self._wake()
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit; queued requests are admitted if it grew."""
+        self.limit = max(1, limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def stats(self) -> CompartmentStats:
+        """Return a snapshot of this limit."""
+        return CompartmentStats(
+            limit=self.limit,
+            in_flight=self.in_flight,
+            waiting=self.waiting,
+            max_waiting=self.max_waiting,
+            acquired=self.acquired,
+            wait_avg=self.wait_total / self.acquired if self.acquired else 0.0,
+            wait_max=self.wait_max,
+        )
+
+
+class Bulkheads:
+    """Concurrency compartments per tag and per endpoint.
+
+    A request first takes a slot in its endpoint's compartment, then in its
+    tag's compartment, and holds both until it finishes (retries included).
+    Queueing for the narrower endpoint limit first keeps a throttled endpoint
+    from sitting on slots the rest of its tag could use.
+
+    Args:
+        per_tag: Limits keyed by tag name, for example ``{"TgInvoices": 20}``.
+        per_endpoint: Limits keyed by endpoint key, for example
+            ``{"GET tg-invoices": 2}``.
+        default_tag_limit: Limit for tags not listed in ``per_tag``
+            (``None`` — unlisted tags are unlimited).
+    """
+
+    def __init__(
+        self,
+        per_tag: Optional[Mapping[str, int]] = None,
+        per_endpoint: Optional[Mapping[str, int]] = None,
+        *,
+        default_tag_limit: Optional[int] = None,
+    ) -> None:
+        self.tags: Dict[str, ConcurrencyLimit] = {
+            tag: ConcurrencyLimit(limit) for tag, limit in (per_tag or {}).items()
+        }
+        self.endpoints: Dict[str, ConcurrencyLimit] = {
+            key: ConcurrencyLimit(limit) for key, limit in (per_endpoint or {}).items()
+        }
+        self.default_tag_limit = default_tag_limit
+
+    def _compartments(self, key: str) -> List[ConcurrencyLimit]:
+        compartments = []
+        if key in self.endpoints:
+            compartments.append(self.endpoints[key])
+        tag = endpoint_tag(key)
+        limit = self.tags.get(tag)
+        if limit is None and self.default_tag_limit is not None:
+            limit = self.tags[tag] = ConcurrencyLimit(self.default_tag_limit)
+        if limit is not None:
+            compartments.append(limit)
+        return compartments
+
+    @asynccontextmanager
+    async def enter(self, key: str) -> AsyncIterator[None]:
+        """Hold slots in every compartment of endpoint ``key``."""
+        held: List[ConcurrencyLimit] = []
+        try:
+            for compartment in self._compartments(key):
+                await compartment.acquire()
+                held.append(compartment)
+            yield
+        finally:
+            for compartment in reversed(held):
+                compartment.release()
+
+    def stats(self) -> Dict[str, CompartmentStats]:
+        """Return compartment snapshots keyed by tag name or endpoint key."""
+        result = {tag: limit.stats() for tag, limit in self.tags.items()}
+        result.update((key, limit.stats()) for key, limit in self.endpoints.items())
+        return result
@@ -0,0 +1,308 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Response cache for read endpoints.
+
+With a cache on :class:`aiorocket2.client.xRocketClient` (``cache=``),
+successful ``GET`` responses of endpoints that have a TTL are kept and
+returned without contacting the API until they expire. Entries are keyed by
+path, query parameters and API key, and evicted least recently used first
+once ``max_entries`` or ``max_bytes`` is exceeded. ``404`` answers can be
+cached too (``negative_ttl``), so lookups of unknown ids are not repeated.
+
+Mutations invalidate automatically: a ``POST``, ``PUT`` or ``DELETE`` of a
+path evicts that path and every ancestor path, so ``delete_invoice(42)``
+drops ``tg-invoices/42`` and all ``tg-invoices`` list pages, and
+``edit_multi_cheque(7)`` drops ``multi-cheque/7``. Mutations that move funds
+also drop the cached ``app/info`` balance (see :data:`DEFAULT_INVALIDATES`).
+
+Callers receive the same parsed payload on every hit; in raw mode treat it
+as read-only. Subclass :class:`BaseResponseCache` to keep entries elsewhere.
+
+Example::
+
+    cache = ResponseCache(
+        {"GET tg-invoices/{id}": 5.0}, max_entries=10_000, negative_ttl=1.0
+    )
+    async with xRocketClient(api_key="KEY", cache=cache) as client:
+        await client.get_invoice(42)   # sent
+        await client.get_invoice(42)   # cached for 5 seconds
+        print(cache.stats())
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+__all__ = [
+    "BaseResponseCache",
+    "CacheEntry",
+    "CacheStats",
+    "ResponseCache",
+]
+
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "GET tg-invoices/{id}": 5.0,
+    "GET multi-cheque/{id}": 5.0,
+    "GET app/withdrawal/fees": 60.0,
+    "GET withdrawal-link": 60.0,
+}
+"""Endpoint keys cached when no explicit TTLs are given, with seconds to live."""
+
+DEFAULT_INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    "POST app/transfer": ("app/info",),
+    "POST app/withdrawal": ("app/info",),
+    "POST multi-cheque": ("app/info",),
+    "DELETE multi-cheque/{id}": ("app/info",),
+}
+"""Extra paths evicted by mutations, beyond the mutated path and its ancestors."""
+
+CacheKey = Tuple[Hashable, ...]
+"""``(path, query parameters, API key, require_success, raw data)``."""
+
+
+@dataclass
+class CacheStats:
+    """Counters of a :class:`ResponseCache`.
+
+    Attributes:
+        hits: Calls answered from the cache, negative hits included.
+        negative_hits: Calls answered with a cached ``404``.
+        misses: Cacheable calls that went to the API.
+        evictions: Entries dropped to stay within the size limits.
+        invalidations: Entries dropped by mutations.
+        entries: Entries currently stored.
+        bytes: Estimated size of the stored payloads.
+    """
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+
+
+@dataclass
+class CacheEntry:
+    """One cached response.
+
+    Attributes:
+        path: Request path, used for invalidation.
+        payload: Parsed response body; for a negative entry, the error
+            payload.
+        status: ``404`` for a negative entry, ``None`` otherwise.
+        expires: :func:`time.monotonic` value after which the entry is stale.
+        size: Estimated payload size in bytes (``0`` if not measured).
+    """
+    path: str
+    payload: Any
+    status: Optional[int]
+    expires: float
+    size: int = 0
+
+
+class BaseResponseCache:
+    """TTL policy and storage interface of a response cache.
+
+    Storage methods (:meth:`get`, :meth:`put`, :meth:`invalidate`) are
+    synchronous and must not block: they run on the event loop for every
+    cacheable call.
+
+    Args:
+        ttls: Seconds to live per endpoint key (see
+            :func:`aiorocket2.utils.endpoint_key`). ``None`` — use
+            :data:`DEFAULT_CACHE_TTLS`. Endpoints without a TTL are not cached.
+        negative_ttl: Seconds to keep ``404`` answers of cached endpoints;
+            ``0`` disables negative caching.
+        invalidates: Extra paths evicted per mutating endpoint key, added to
+            :data:`DEFAULT_INVALIDATES`.
+    """
+
+    max_bytes: Optional[int] = None
+    """Byte limit of the storage; payload sizes are only measured when set."""
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        negative_ttl: float = 0.0,
+        invalidates: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> None:
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.negative_ttl = max(0.0, negative_ttl)
+        self.invalidates = {k: tuple(v) for k, v in DEFAULT_INVALIDATES.items()}
+        for k, paths in (invalidates or {}).items():
+            self.invalidates[k] = self.invalidates.get(k, ()) + tuple(paths)
+        self.generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def ttl_for(self, key: str) -> float:
+        """Seconds to keep responses of endpoint ``key``; ``0`` — not cached."""
+        return self.ttls.get(key, 0.0)
+
+    def paths_to_invalidate(self, key: str, path: str) -> List[str]:
+        """Paths a mutation of ``path`` (endpoint ``key``) makes stale.
+
+        Args:
+            key: Endpoint key of the mutation, e.g. ``"DELETE tg-invoices/{id}"``.
+            path: Mutated path, e.g. ``"tg-invoices/42"``.
+
+        Returns:
+            List[str]: The path, its ancestors and the configured extras.
+        """
+        parts = path.strip("/").split("/")
+        paths = ["/".join(parts[:i]) for i in range(len(parts), 0, -1)]
+        paths.extend(self.invalidates.get(key, ()))
+        return paths
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Return the fresh entry stored under ``key``, if any."""
+        raise NotImplementedError
+
+    def put(self, key: CacheKey, entry: CacheEntry, generation: int) -> None:
+        """Store ``entry``, unless an invalidation happened since ``generation``.
+
+        Args:
+            key: Cache key.
+            entry: Entry to store.
+            generation: Value of :attr:`generation` read before the request
+                was sent; a mutation completed meanwhile may have made the
+                response stale.
+        """
+        raise NotImplementedError
+
+    def invalidate(self, paths: Iterable[str]) -> int:
+        """Drop every entry of ``paths``, whatever its parameters or API key.
+
+        Returns:
+            int: Entries dropped.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        raise NotImplementedError
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counters."""
+        raise NotImplementedError
+
+
+class ResponseCache(BaseResponseCache):
+    """In-memory LRU response cache.
+
+    Args:
+        ttls: Seconds to live per endpoint key; see :class:`BaseResponseCache`.
+        max_entries: Most entries kept.
+        max_bytes: Most payload bytes kept, estimated from the JSON encoding
+            of each payload. ``None`` — no byte limit, and sizes are not
+            measured.
+        negative_ttl: Seconds to keep ``404`` answers; ``0`` — never.
+        invalidates: Extra paths evicted per mutating endpoint key.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        max_entries: int = 10_000,
+        max_bytes: Optional[int] = None,
+        negative_ttl: float = 0.0,
+        invalidates: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> None:
+        super().__init__(ttls, negative_ttl=negative_ttl, invalidates=invalidates)
+        if max_entries < 1 or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("max_entries and max_bytes must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._by_path: Dict[str, Set[CacheKey]] = {}
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, entry: CacheEntry, generation: int) -> None:
+        if generation != self.generation:
+            return
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._by_path.setdefault(entry.path, set()).add(key)
+        self.bytes += entry.size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, paths: Iterable[str]) -> int:
+        self.generation += 1
+        dropped = 0
+        for path in paths:
+            for key in tuple(self._by_path.get(path, ())):
+                self._remove(key)
+                dropped += 1
+        self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._by_path.clear()
+        self.bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        keys = self._by_path[entry.path]
+        keys.discard(key)
+        if not keys:
+            del self._by_path[entry.path]
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            negative_hits=self.negative_hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+            entries=len(self._entries),
+            bytes=self.bytes,
+        )
@@ -0,0 +1,121 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Per-call timing and response metadata.
+
+Collection is opt-in: inside :meth:`xRocketClient.call_info()
+<aiorocket2.client.xRocketClient.call_info>` every request made by the client
+appends a :class:`CallInfo` to the yielded list, including requests made by
+tasks created inside the block. Return types of the tag methods do not change.
+
+Example::
+
+    with client.call_info() as calls:
+        invoice = await client.create_invoice(currency="TON", amount=1)
+    info = calls[-1]
+    print(info.attempts, info.backoff, info.ttfb, info.decode, info.convert)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+
+__all__ = [
+    "CallInfo",
+    "collect_call_info",
+]
+
+
+@dataclass
+class CallInfo:
+    """Where the time of one request went.
+
+    Durations are in seconds. ``acquire``, ``ttfb``, ``body_size``,
+    ``decoded_size`` and ``decode`` describe the last attempt. A GET that
+    joined an identical request already in flight (see
+    :mod:`aiorocket2.coalesce`) or was answered from the response cache (see
+    :mod:`aiorocket2.cache`) only gets ``total`` (and ``cached``).
+
+    Attributes:
+        endpoint: Endpoint key (see :func:`aiorocket2.utils.endpoint_key`).
+        status: HTTP status of the last response (``None`` — no response).
+        attempts: HTTP attempts made, retries included.
+        total: Wall time of the whole call.
+        queued: Time before the first attempt was sent: admission,
+            bulkheads, priority scheduler and rate limiter.
+        backoff: Time slept between attempts.
+        acquire: Time spent getting a connection from the pool. Only
+            measured for sessions owned by
+            :class:`~aiorocket2.transport.AiohttpTransport`.
+        ttfb: Time from sending the request to receiving the response
+            headers, ``acquire`` included.
+        body_size: Response body bytes on the wire.
+        decoded_size: Response body bytes after decompression.
+        decode: Time spent decompressing and parsing the body.
+        convert: Time spent building models with ``from_api``.
+        cached: Whether the response came from the response cache.
+        started: :func:`time.perf_counter` value when the call started.
+    """
+    endpoint: str
+    status: Optional[int] = None
+    attempts: int = 0
+    total: float = 0.0
+    queued: float = 0.0
+    backoff: float = 0.0
+    acquire: float = 0.0
+    ttfb: float = 0.0
+    body_size: int = 0
+    decoded_size: int = 0
+    decode: float = 0.0
+    convert: float = 0.0
+    cached: bool = False
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+
+current_call_log: contextvars.ContextVar[Optional[List[CallInfo]]] = (
+    contextvars.ContextVar("aiorocket2_call_log", default=None)
+)
+"""List collecting the :class:`CallInfo` of every call in the current context."""
+
+current_call: contextvars.ContextVar[Optional[CallInfo]] = contextvars.ContextVar(
+    "aiorocket2_call", default=None
+)
+"""The :class:`CallInfo` of the request running in the current context."""
+
+
+@contextmanager
+def collect_call_info() -> Iterator[List[CallInfo]]:
+    """Collect a :class:`CallInfo` for every request made inside the block.
+
+    Yields:
+        List[CallInfo]: Filled in as calls complete, in start order.
+    """
+    calls: List[CallInfo] = []
+    token = current_call_log.set(calls)
+    try:
+        yield calls
+    finally:
+        current_call_log.reset(token)
@@ -51,7 +51,21 @@ Notes
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Mapping, Optional, Union
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
 import aiohttp
 
@@ -59,18 +73,98 @@ import aiohttp
 
 from .constants import (
     BASEURL_MAINNET, BASEURL_TESTNET,
-    DEFAULT_BACKOFF_BASE, DEFAULT_RETRIES,
+    DEFAULT_BACKOFF_BASE, DEFAULT_KEEPALIVE_TIMEOUT, DEFAULT_RETRIES,
     DEFAULT_TIMEOUT, DEFAULT_USER_AGENT
 )
-from .exceptions import xRocketAPIError
+from .admission import AdmissionControl
+from .batching import BatchLoader
+from .breaker import CircuitBreaker
+from .bulkhead import Bulkheads
+from .cache import BaseResponseCache, CacheEntry, CacheKey
+from .callinfo import CallInfo, collect_call_info, current_call, current_call_log
+from .coalesce import RequestCoalescer
+from .codec import JSONCodec, get_codec
+from .compression import ACCEPT_ENCODING, ByteCounter, CompressionStats, decompress
+from .deadline import deadline as _deadline, remaining_time, without_deadline
+from .enums import Idempotency, Priority, RawMode, Status
+from .exceptions import DeadlineExceeded, xRocketAPIError
+from .hedging import HedgePolicy
+from .metrics import LatencyRecorder
+from .pool import PoolConfig, PoolStats
+from .ratelimit import BaseRateLimiter
+from .retry import RetryPolicy
+from .scheduler import PriorityScheduler, current_priority
 from .tags import Tags
-from .utils import backoff_sleep
+from .timeouts import AdaptiveTimeout
+from .transport import AiohttpTransport, Transport, TransportConnectError
+from .utils import endpoint_key, parse_retry_after
 
 
 __all__ = [
     "xRocketClient"
 ]
 
+HEALTH_KEY = endpoint_key("GET", "health")
+"""The health endpoint is never blocked by the circuit breaker: it is the probe."""
+
+
+def _status(error: Optional[BaseException]) -> int:
+    """HTTP status carried by an API error, ``0`` otherwise."""
+    if not isinstance(error, xRocketAPIError):
+        return 0
+    return getattr(error, "status", None) or 0
+
+
+def _cache_key(
+    path: str,
+    params: Optional[Mapping[str, Any]],
+    headers: Mapping[str, str],
+    require_success: bool,
+    raw_data: bool,
+) -> CacheKey:
+    """Key of a GET in the response cache (see :data:`aiorocket2.cache.CacheKey`)."""
+    return (
+        path,
+        tuple(sorted((params or {}).items())),
+        headers.get("Rocket-Pay-Key"),
+        require_success,
+        raw_data,
+    )
+
+
+def _cache_hit(cache: BaseResponseCache, entry: CacheEntry) -> dict:
+    """Count a hit and return its payload, or raise its cached error."""
+    cache.hits += 1
+    if entry.status is not None:
+        cache.negative_hits += 1
+        raise xRocketAPIError(entry.payload, entry.status)
+    return entry.payload
+
+
+def _is_failure(error: Optional[BaseException]) -> bool:
+    """Whether an error means the API is unavailable: network, timeout or 5xx."""
+    network = isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+    return network or _status(error) >= 500
+
+
+# Errors raised before the request could reach the server
+_NOT_SENT_ERRORS = (aiohttp.ClientConnectorError, TransportConnectError) + (
+    (aiohttp.ConnectionTimeoutError,)
+    if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+)
+
+_raw_mode: ContextVar[Optional[RawMode]] = ContextVar(
+    "aiorocket2_raw_mode", default=None
+)
+"""Raw mode set by :meth:`xRocketClient.raw`; ``None`` defers to the client."""
+
+_DEFAULT_IDEMPOTENCY = {
+    "GET": Idempotency.SAFE,
+    "PUT": Idempotency.SAFE,
+    "DELETE": Idempotency.SAFE,
+}
+"""Idempotency of requests whose tag method does not state it; POST is unsafe."""
+
 
 class xRocketClient(Tags):
     """
@@ -99,6 +193,22 @@ class xRocketClient(Tags):
         retries: int = DEFAULT_RETRIES,
         backoff_base: float = DEFAULT_BACKOFF_BASE,
         user_agent: str = DEFAULT_USER_AGENT,
+        pool: Optional[PoolConfig] = None,
+        rate_limiter: Optional[BaseRateLimiter] = None,
+        coalesce_gets: bool = False,
+        hedging: Optional[HedgePolicy] = None,
+        adaptive_timeout: Optional[AdaptiveTimeout] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        bulkheads: Optional[Bulkheads] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        admission: Optional[AdmissionControl] = None,
+        transport: Optional[Transport] = None,
+        compression: bool = True,
+        json_codec: Union[str, JSONCodec] = "json",
+        raw_mode: RawMode = RawMode.OFF,
+        batching: Optional[BatchLoader] = None,
+        cache: Optional[BaseResponseCache] = None,
     ) -> None:
         """
         Initialize the client.
@@ -107,28 +217,95 @@ class xRocketClient(Tags):
             api_key: Your xRocket Pay API key.
             testnet: If True, use the staging/test environment.
             base_url: Optional override for the base API URL.
-            session: Optional aiohttp session to reuse.
+            session: Optional aiohttp session to reuse. When omitted the client
+                creates its own session lazily, on the first request.
+                Ignored when ``transport`` is passed.
             timeout: aiohttp total timeout (seconds).
             retries: Number of retries for network/5xx errors.
+                Ignored when ``retry_policy`` is passed.
             backoff_base: Base delay for exponential backoff (seconds).
+                Ignored when ``retry_policy`` is passed.
             user_agent: Custom User-Agent header value.
+            pool: Connection pool settings for the client-owned session.
+                Ignored when ``session`` or ``transport`` is passed.
+            rate_limiter: Optional limiter (see :mod:`aiorocket2.ratelimit`)
+                every request waits on. With a limiter, ``429`` responses are
+                retried after the delay the API asks for.
+            coalesce_gets: Share one in-flight request between concurrent
+                identical GET calls (see :mod:`aiorocket2.coalesce`).
+            hedging: Optional policy for hedging slow idempotent GETs
+                (see :mod:`aiorocket2.hedging`).
+            adaptive_timeout: Derive per-endpoint timeouts from observed
+                latency instead of using ``timeout`` (see :mod:`aiorocket2.timeouts`).
+            circuit_breaker: Optional breaker that fails requests fast while the
+                API is unhealthy (see :mod:`aiorocket2.breaker`).
+            retry_policy: Backoff, jitter and retry budget settings (see
+                :mod:`aiorocket2.retry`). Defaults to full jitter built from
+                ``retries`` and ``backoff_base``.
+            bulkheads: Optional concurrency limits per tag and per endpoint
+                (see :mod:`aiorocket2.bulkhead`).
+            scheduler: Optional priority queue in front of the connection pool
+                (see :mod:`aiorocket2.scheduler`).
+            admission: Optional per-endpoint in-flight and queue limits that
+                shed excess requests (see :mod:`aiorocket2.admission`).
+            transport: Optional transport performing the HTTP exchanges (see
+                :mod:`aiorocket2.transport`). Defaults to an
+                :class:`~aiorocket2.transport.AiohttpTransport` built from
+                ``session`` and ``pool``.
+            compression: Ask for gzip/deflate (and brotli, if installed)
+                compressed responses (see :mod:`aiorocket2.compression`).
+            json_codec: Codec for request and response bodies: ``"json"``,
+                ``"orjson"``, ``"msgspec"``, ``"auto"`` or a
+                :class:`~aiorocket2.codec.JSONCodec` (see :mod:`aiorocket2.codec`).
+            raw_mode: Make tag methods return the API's ``data`` field as a
+                dict or as JSON bytes instead of models (see :meth:`raw`).
+            batching: Optional loader answering concurrent ``get_invoice`` and
+                ``get_multi_cheque`` calls from list page scans (see
+                :mod:`aiorocket2.batching`).
+            cache: Optional cache of GET responses, invalidated by mutating
+                calls (see :mod:`aiorocket2.cache`).
         """
         self.base_url = (base_url or (BASEURL_TESTNET if testnet else BASEURL_MAINNET)).rstrip("/")
         self.api_key = api_key
-        self._own_session = session is None
-        self.session = session or aiohttp.ClientSession()
+        self.transport = transport or AiohttpTransport(
+            session, pool=pool, retire_grace=timeout
+        )
+        self._heartbeat: Optional[asyncio.Task] = None
+        self.rate_limiter = rate_limiter
+        self.coalescer = RequestCoalescer() if coalesce_gets else None
+        self.hedging = hedging
+        self.latency = LatencyRecorder()
+        self.byte_counter = ByteCounter()
+        self.json_codec = get_codec(json_codec)
+        self.raw_mode = RawMode(raw_mode)
+        self.batching = batching
+        self.cache = cache
+        self.adaptive_timeout = adaptive_timeout
+        self.circuit_breaker = circuit_breaker
+        self.bulkheads = bulkheads
+        self.scheduler = scheduler
+        self.admission = admission
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.retries = max(0, retries)
         self.backoff_base = max(0.0, backoff_base)
+        self.retry_policy = retry_policy or RetryPolicy(
+            self.retries, base=self.backoff_base
+        )
+        accept_encoding = ACCEPT_ENCODING if compression else "identity"
         self._auth_headers = {
             "Rocket-Pay-Key": api_key,
             "User-Agent": user_agent,
             "Accept": "application/json",
+            "Accept-Encoding": accept_encoding,
         }
         self._noauth_headers = {
             "User-Agent": user_agent,
             "Accept": "application/json",
+            "Accept-Encoding": accept_encoding,
         }
+        json_type = {"Content-Type": "application/json"}
+        self._auth_json_headers = {**self._auth_headers, **json_type}
+        self._noauth_json_headers = {**self._noauth_headers, **json_type}
 
 
 
@@ -139,9 +316,200 @@ class xRocketClient(Tags):
         await self.aclose()
 
     async def aclose(self) -> None:
-        """Close the underlying aiohttp session if it was created by this client."""
-        if self._own_session:
-            await self.session.close()
+        """Stop the heartbeat and close the transport."""
+        await self.stop_heartbeat()
+        await self.transport.aclose()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The aiohttp session used for requests, created on first access.
+
+        Only available with :class:`~aiorocket2.transport.AiohttpTransport`.
+        """
+        if not isinstance(self.transport, AiohttpTransport):
+            raise TypeError(
+                f"{type(self.transport).__name__} does not use an aiohttp session"
+            )
+        return self.transport.session
+
+    async def warmup(self, n_connections: int = 1) -> int:
+        """Open pooled connections ahead of time.
+
+        Sends ``n_connections`` concurrent requests to the unauthenticated
+        ``version`` endpoint so that DNS, TCP and TLS setup is paid before the
+        first real call. Connections beyond the transport's ``PoolConfig.limit``
+        are not opened.
+
+        Args:
+            n_connections: Number of connections to open.
+
+        Returns:
+            int: Number of warm-up requests that succeeded.
+        """
+        pool = self.transport.pool
+        if pool is not None and pool.limit:
+            n_connections = min(n_connections, pool.limit)
+        results = await asyncio.gather(
+            # each request must reach the network to open its own connection
+            *(
+                self._request(
+                    "GET", "version",
+                    require_auth_header=False, require_success=False, shared=False,
+                )
+                for _ in range(max(0, n_connections))
+            ),
+            return_exceptions=True,
+        )
+        return sum(1 for r in results if not isinstance(r, BaseException))
+
+    def start_heartbeat(
+        self, interval: Optional[float] = None, n_connections: int = 1
+    ) -> None:
+        """Keep pooled connections warm in the background.
+
+        Every ``interval`` seconds the client re-runs :meth:`warmup`. Sockets
+        that were closed by the server fail the heartbeat request and are
+        dropped by the pool, so a real request does not trip over them. The
+        heartbeat is stopped by :meth:`stop_heartbeat` or :meth:`aclose`.
+
+        Args:
+            interval: Seconds between heartbeats. Defaults to half of
+                ``PoolConfig.keepalive_timeout`` so that idle sockets never expire.
+            n_connections: Number of connections to keep warm.
+        """
+        if self._heartbeat is not None and not self._heartbeat.done():
+            self._heartbeat.cancel()
+        if interval is None:
+            pool = self.transport.pool
+            keepalive = DEFAULT_KEEPALIVE_TIMEOUT if pool is None \
+                else pool.keepalive_timeout
+            interval = max(1.0, keepalive / 2)
+
+        async def beat() -> None:
+            while True:
+                await self.warmup(n_connections)
+                await asyncio.sleep(interval)
+
+        self._heartbeat = asyncio.ensure_future(beat())
+
+    async def stop_heartbeat(self) -> None:
+        """Stop the background heartbeat started by :meth:`start_heartbeat`."""
+        task, self._heartbeat = self._heartbeat, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @staticmethod
+    def deadline(seconds: float) -> ContextManager[None]:
+        """Give every request made inside the block a shared time budget.
+
+        Requests, retries and backoff sleeps are clamped to the remaining
+        budget, and :class:`~aiorocket2.exceptions.DeadlineExceeded` is raised
+        as soon as it is spent. See :mod:`aiorocket2.deadline`.
+
+        Example::
+
+            with client.deadline(2.0):
+                await client.create_invoice(currency="TON", amount=1)
+        """
+        return _deadline(seconds)
+
+    @staticmethod
+    def call_info() -> ContextManager[List[CallInfo]]:
+        """Collect timing and response metadata of the requests made inside the block.
+
+        Yields a list that receives one :class:`~aiorocket2.callinfo.CallInfo`
+        per request: attempts, backoff, queueing, connection acquire, time to
+        first byte, body size, decode and ``from_api`` time. See
+        :mod:`aiorocket2.callinfo`.
+
+        Example::
+
+            with client.call_info() as calls:
+                await client.create_invoice(currency="TON", amount=1)
+            print(calls[0].attempts, calls[0].ttfb, calls[0].convert)
+        """
+        return collect_call_info()
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """Dispatch requests made inside the block with ``priority``.
+
+        Overrides the scheduler's per-endpoint priority for every call made in
+        the current context (tasks created inside inherit it).
+
+        Example::
+
+            with client.priority(Priority.LOW):
+                await client.get_invoices(limit=1000)
+        """
+        token = current_priority.set(priority)
+        try:
+            yield
+        finally:
+            current_priority.reset(token)
+
+    @contextmanager
+    def raw(self, mode: RawMode = RawMode.DICT) -> Iterator[None]:
+        """Return raw ``data`` from tag methods called inside the block.
+
+        Overrides the client's ``raw_mode`` in the current context. With
+        :attr:`RawMode.DICT` methods such as :meth:`get_invoices` return the
+        parsed ``data`` dict; with :attr:`RawMode.BYTES` they return its JSON
+        bytes (cheapest with the ``msgspec`` codec, which does not decode
+        ``data`` at all). :attr:`RawMode.OFF` restores typed models.
+
+        Example::
+
+            with client.raw(RawMode.BYTES):
+                page = await client.get_invoices(limit=1000)   # bytes
+        """
+        token = _raw_mode.set(RawMode(mode))
+        try:
+            yield
+        finally:
+            _raw_mode.reset(token)
+
+    def _raw_mode(self) -> RawMode:
+        """Raw mode in effect for the current call."""
+        return _raw_mode.get() or self.raw_mode
+
+    def _convert(self, payload: dict, from_api: Callable[[Any], Any]) -> Any:
+        """Build the tag method result from ``payload["data"]``, unless in raw mode."""
+        if self._raw_mode() is not RawMode.OFF:
+            return payload["data"]
+        info = current_call.get()
+        if info is None or current_call_log.get() is None:
+            return from_api(payload["data"])
+        started = time.perf_counter()
+        result = from_api(payload["data"])
+        info.convert = time.perf_counter() - started
+        return result
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Return a snapshot of the connection pool.
+
+        Acquire timings are only collected for sessions created by the client;
+        for a session passed in by the caller they stay at zero.
+
+        Returns:
+            Optional[PoolStats]: Open, idle and in-use sockets and acquire wait
+            times, or ``None`` if the transport does not track a pool.
+        """
+        return self.transport.pool_stats()
+
+    def compression_stats(self) -> Dict[str, CompressionStats]:
+        """Return response bytes on the wire and after decompression, per endpoint.
+
+        With a transport that decompresses on its own (for example an aiohttp
+        session created with ``auto_decompress=True``) both sizes are the
+        decoded size.
+
+        Returns:
+            Dict[str, CompressionStats]: Totals keyed by endpoint
+            (see :func:`aiorocket2.utils.endpoint_key`).
+        """
+        return self.byte_counter.stats()
 
 
     async def _request(
@@ -152,7 +520,10 @@ class xRocketClient(Tags):
         params: Optional[Mapping[str, Any]] = None,
         json: Optional[Mapping[str, Any]] = None,
         require_auth_header: bool = True,
-        require_success: bool = True
+        require_success: bool = True,
+        idempotency: Optional[Idempotency] = None,
+        raw: bool = False,
+        shared: bool = True,
     ) -> dict:
         """
         Send an HTTP request with retries and consistent error handling.
@@ -163,6 +534,18 @@ class xRocketClient(Tags):
             params: Optional query string parameters.
             json: Optional JSON body.
             require_auth_header: Whether to include `Rocket-Pay-Key`.
+            require_success: Whether a payload without ``success=true`` is an error.
+            idempotency: Whether the request may be repeated. Safe and
+                idempotent-by-key requests are retried on network errors,
+                timeouts and 5xx; unsafe ones only if the connection could not
+                be established. Defaults to safe for GET/PUT/DELETE and unsafe
+                for POST.
+            raw: Whether the caller converts the result with :meth:`_convert`.
+                In :attr:`RawMode.BYTES <aiorocket2.enums.RawMode.BYTES>` the
+                ``data`` field is then left as undecoded JSON bytes.
+            shared: Whether a GET may join an identical request in flight or be
+                answered from the response cache. Warm-up requests pass
+                ``False`` so that every one of them is sent.
 
         Returns:
             Parsed JSON body as a dictionary.
@@ -170,39 +553,380 @@ class xRocketClient(Tags):
         Raises:
             xRocketAPIError: For non-2xx responses or payloads with success=false.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._auth_headers if require_auth_header else self._noauth_headers
+        key = endpoint_key(method, endpoint)
+        calls = current_call_log.get()
+        if calls is not None:
+            info = CallInfo(key)
+            calls.append(info)
+            # left set after the call so that _convert, which runs in the
+            # caller's context right after, can find it
+            current_call.set(info)
+        else:
+            info = None
+            if current_call.get() is not None:
+                current_call.set(None)
 
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if json is None:
+            data = None
+            headers = self._auth_headers if require_auth_header \
+                else self._noauth_headers
+        else:
+            data = self.json_codec.dumps(json)
+            headers = self._auth_json_headers if require_auth_header \
+                else self._noauth_json_headers
+        if idempotency is None:
+            idempotency = _DEFAULT_IDEMPOTENCY.get(method.upper(), Idempotency.UNSAFE)
+        raw_data = raw and self._raw_mode() is RawMode.BYTES
+        is_get = method.upper() == "GET"
+        shared = shared and is_get
+
+        def dispatch() -> Awaitable[dict]:
+            return self._dispatch(
+                method, url, key, params, data, headers,
+                require_success, raw_data, idempotency,
+            )
+
+        def send() -> Awaitable[dict]:
+            if self.coalescer is not None and shared:
+                identity = (
+                    url,
+                    tuple(sorted((params or {}).items())),
+                    headers.get("Rocket-Pay-Key"),
+                    require_success,
+                    raw_data,
+                )
+                # shared by every caller: each one's own deadline bounds only its
+                # wait below, and the request is cancelled once all of them left
+                return self.coalescer.run(identity, dispatch, without_deadline())
+            return dispatch()
+
+        cache = self.cache
+        if cache is None or (is_get and not shared):
+            request = send()
+        elif is_get:
+            ttl = cache.ttl_for(key)
+            if ttl > 0:
+                path = endpoint.strip("/")
+                cache_key = _cache_key(path, params, headers, require_success, raw_data)
+                request = self._cached(cache, cache_key, path, ttl, info, send)
+            else:
+                request = send()
+        else:
+            request = self._invalidating(cache, key, endpoint.strip("/"), send)
+
+        try:
+            remaining = remaining_time()
+            if remaining is None:
+                return await request
+            if remaining <= 0:
+                request.close()
+                raise DeadlineExceeded(f"Deadline exceeded before {key} was sent")
+            try:
+                # bounds every wait: limiter, bulkheads, scheduler, attempts and backoff
+                return await asyncio.wait_for(request, remaining)
+            except asyncio.TimeoutError:
+                if (remaining_time() or 0) > 0:
+                    raise  # not ours: let the caller see the original timeout
+                raise DeadlineExceeded(
+                    f"Deadline exceeded while waiting for {key}"
+                ) from None
+        finally:
+            if info is not None:
+                info.total = time.perf_counter() - info.started
+
+    async def _cached(
+        self,
+        cache: BaseResponseCache,
+        cache_key: CacheKey,
+        path: str,
+        ttl: float,
+        info: Optional[CallInfo],
+        send: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Answer a GET from the cache, or send it and store the response."""
+        entry = cache.get(cache_key)
+        if entry is not None:
+            if info is not None:
+                info.cached = True
+            return _cache_hit(cache, entry)
+        cache.misses += 1
+        generation = cache.generation
+        try:
+            payload = await send()
+        except xRocketAPIError as e:
+            negative = type(e) is xRocketAPIError and e.status == 404
+            if negative and cache.negative_ttl > 0:
+                expires = time.monotonic() + cache.negative_ttl
+                entry = CacheEntry(path, e.payload, 404, expires)
+                cache.put(cache_key, entry, generation)
+            raise
+        size = self._payload_size(payload) if cache.max_bytes is not None else 0
+        entry = CacheEntry(path, payload, None, time.monotonic() + ttl, size)
+        cache.put(cache_key, entry, generation)
+        return payload
+
+    def _cached_get(self, endpoint: str) -> Optional[dict]:
+        """Cached payload of an authenticated GET of ``endpoint``, or ``None``.
+
+        Lets callers that bypass :meth:`_request`, such as batched lookups,
+        answer from the cache first. A hit is logged like one of
+        :meth:`_request` (see :meth:`call_info`). A cached ``404`` is raised.
+        """
+        cache = self.cache
+        key = endpoint_key("GET", endpoint)
+        if cache is None or cache.ttl_for(key) <= 0:
+            return None
+        path = endpoint.strip("/")
+        entry = cache.get(_cache_key(path, None, self._auth_headers, True, False))
+        if entry is None:
+            return None
+        calls = current_call_log.get()
+        if calls is not None:
+            info = CallInfo(key, cached=True)
+            calls.append(info)
+            current_call.set(info)  # for _convert, as in _request
+        elif current_call.get() is not None:
+            current_call.set(None)
+        return _cache_hit(cache, entry)
+
+    async def _invalidating(
+        self,
+        cache: BaseResponseCache,
+        key: str,
+        path: str,
+        send: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Send a mutation, then evict the cached responses it may have changed."""
+        try:
+            return await send()
+        finally:
+            # also after a failure: the mutation may have been applied anyway
+            cache.invalidate(cache.paths_to_invalidate(key, path))
+
+    def _payload_size(self, payload: dict) -> int:
+        """Estimated size of a parsed payload, for the cache's byte limit."""
+        data = payload.get("data")
+        if isinstance(data, (bytes, bytearray)):
+            return len(data)
+        return len(self.json_codec.dumps(payload))
+
+    async def _dispatch(self, method: str, url: str, key: str, *args: Any) -> dict:
+        """Admit a request through the concurrency controls, then send it."""
+        if self.admission is None:
+            return await self._isolate(method, url, key, *args)
+        async with self.admission.admit(key):
+            return await self._isolate(method, url, key, *args)
+
+    async def _isolate(self, method: str, url: str, key: str, *args: Any) -> dict:
+        """Hold the request's bulkhead slots, if any, while it is scheduled and sent."""
+        if self.bulkheads is None:
+            return await self._schedule(method, url, key, *args)
+        async with self.bulkheads.enter(key):
+            return await self._schedule(method, url, key, *args)
+
+    async def _schedule(self, method: str, url: str, key: str, *args: Any) -> dict:
+        """Wait for the priority scheduler, if any, then send the request."""
+        scheduler = self.scheduler
+        if scheduler is None:
+            return await self._send(method, url, key, *args)
+        await scheduler.acquire(scheduler.priority_for(key))
+        try:
+            return await self._send(method, url, key, *args)
+        finally:
+            scheduler.release()
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        key: str,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        require_success: bool,
+        raw_data: bool,
+        idempotency: Idempotency,
+    ) -> dict:
+        """Run the retry loop for one logical request; see :meth:`_request`."""
+        limiter = self.rate_limiter
+        breaker = self.circuit_breaker if key != HEALTH_KEY else None
+        hedging = self.hedging
+        if hedging is not None and not hedging.applies(key):
+            hedging = None
+        policy = self.retry_policy
+        policy.on_request()
+        info = current_call.get()
         attempt = 0
+        delay = 0.0
         while True:
+            if breaker is not None:
+                breaker.check(self._probe_health)
+            if limiter is not None:
+                await limiter.acquire(key)
+            timeout = self.adaptive_timeout.timeout_for(key, self.latency) \
+                if self.adaptive_timeout is not None else self.timeout
+            remaining = remaining_time()
+            if remaining is not None and (
+                timeout.total is None or timeout.total > remaining
+            ):
+                timeout = aiohttp.ClientTimeout(
+                    total=max(0.0, remaining), connect=timeout.connect,
+                    sock_read=timeout.sock_read, sock_connect=timeout.sock_connect,
+                )
+            started = time.monotonic()
+            if info is not None:
+                if not info.attempts:
+                    info.queued = time.perf_counter() - info.started
+                info.attempts += 1
             try:
-                async with self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    headers=headers,
-                    timeout=self.timeout,
-                ) as resp:
-                    status = resp.status
-                    try:
-                        payload = await resp.json()
-                    except Exception:
-                        text = await resp.text()
-                        raise xRocketAPIError({"message": f"Non-JSON response: {text[:300]}"},
-                                             status=status)
-
-                    if require_success and not payload.get("success", False):
-                        raise xRocketAPIError(payload, status=status)
-                    return payload
+                if hedging is not None:
+                    payload = await self._hedged_attempt(
+                        hedging, key, method, url, params, data, headers,
+                        require_success, raw_data, timeout,
+                    )
+                else:
+                    payload = await self._attempt(
+                        key, method, url, params, data, headers,
+                        require_success, raw_data, timeout,
+                    )
             except (aiohttp.ClientError, asyncio.TimeoutError, xRocketAPIError) as e:
-                # Retry only for network errors and 5xx RocketAPIError
-                retryable = isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError)) or (
-                    isinstance(e, xRocketAPIError) and (getattr(e, "status", 0) >= 500)
-                )
-                if not retryable or attempt >= self.retries:
+                self._record_outcome(key, e, time.monotonic() - started)
+                if info is not None:
+                    info.status = _status(e) or None
+                # Throttled requests are retried once the limiter lets them through
+                throttled = limiter is not None and _status(e) == 429
+                if idempotency is Idempotency.UNSAFE:
+                    # the API may have acted on anything that reached it
+                    retryable = throttled or isinstance(e, _NOT_SENT_ERRORS)
+                else:
+                    # Retry only for network errors and 5xx RocketAPIError
+                    retryable = throttled or _is_failure(e)
+                exhausted = attempt >= policy.retries
+                if not retryable or exhausted or not policy.try_spend(key):
                     if isinstance(e, xRocketAPIError):
                         raise
-                    raise xRocketAPIError({"message": str(e)}, status=None)
-                await backoff_sleep(attempt, self.backoff_base)
+                    raise xRocketAPIError({"message": str(e)}, status=None) from e
+                # the limiter already holds throttled requests back for Retry-After
+                delay = 0.0 if throttled else policy.backoff(
+                    attempt, delay, parse_retry_after(getattr(e, "headers", None))
+                )
+                remaining = remaining_time()
+                if remaining is not None and delay >= remaining:
+                    # the retry could not finish in time: fail now, not after sleeping
+                    raise DeadlineExceeded(f"Deadline too close to retry {key}") from e
+                if self.coalescer is not None and self.coalescer.abandoned():
+                    # a shared request whose callers all left; see abandoned()
+                    raise asyncio.CancelledError() from None
+                policy.record(key, delay)
+                await asyncio.sleep(delay)
+                if info is not None:
+                    info.backoff += delay
                 attempt += 1
+            else:
+                self._record_outcome(key, None, time.monotonic() - started)
+                return payload
+
+    def _record_outcome(
+        self, key: str, error: Optional[BaseException], elapsed: float
+    ) -> None:
+        """Feed the result of one attempt to the components that learn from it."""
+        if error is None:
+            self.latency.record(key, elapsed)
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_success(key)
+        elif self.rate_limiter is not None and _status(error) == 429:
+            self.rate_limiter.throttle(key, parse_retry_after(error.headers))
+        if self.adaptive_timeout is not None:
+            self.adaptive_timeout.record(key, isinstance(error, asyncio.TimeoutError))
+        if self.circuit_breaker is not None and key != HEALTH_KEY:
+            self.circuit_breaker.record(_is_failure(error), elapsed)
+
+    async def _probe_health(self) -> bool:
+        """Circuit breaker probe: whether :meth:`check_health` reports ``ok``."""
+        return await self.check_health() is Status.OK
+
+    async def _hedged_attempt(self, policy: HedgePolicy, key: str, *args: Any) -> dict:
+        """Run :meth:`_attempt`, sending a second copy if the first is slow.
+
+        The first successful answer wins and the other request is cancelled.
+        If both fail, the error of the original request is raised.
+        """
+        policy.requests += 1
+        first = asyncio.ensure_future(self._attempt(key, *args))
+        pending = {first}
+        try:
+            delay = policy.delay_for(key, self.latency)
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not policy.try_spend():
+                return await first
+            second = asyncio.ensure_future(self._attempt(key, *args))
+            pending.add(second)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            policy.wins += 1
+                        return task.result()
+            return first.result()  # both failed: re-raise the original error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _attempt(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        require_success: bool,
+        raw_data: bool,
+        timeout: aiohttp.ClientTimeout,
+    ) -> dict:
+        """Perform one HTTP exchange through the transport and validate the payload."""
+        resp = await self.transport.request(
+            method,
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+        )
+        info = current_call.get()
+        decode_started = time.perf_counter()
+        body = resp.body
+        encoding = None if self.transport.decompresses \
+            else resp.headers.get("Content-Encoding")
+        if encoding:
+            try:
+                body = decompress(body, encoding)
+            except ValueError as e:
+                raise xRocketAPIError(
+                    {"message": str(e)}, status=resp.status, headers=resp.headers
+                ) from e
+        self.byte_counter.record(key, len(resp.body), len(body), bool(encoding))
+        try:
+            if raw_data:
+                payload = self.json_codec.loads_envelope(body)
+            else:
+                payload = self.json_codec.loads(body)
+        except ValueError as e:
+            text = body[:300].decode("utf-8", "replace")
+            raise xRocketAPIError({"message": f"Non-JSON response: {text}"},
+                                 status=resp.status, headers=resp.headers) from e
+        if info is not None:
+            info.status = resp.status
+            info.acquire = resp.acquire
+            info.ttfb = resp.ttfb
+            info.body_size = len(resp.body)
+            info.decoded_size = len(body)
+            info.decode = time.perf_counter() - decode_started
+
+        if require_success and not payload.get("success", False):
+            raise xRocketAPIError(payload, status=resp.status, headers=resp.headers)
+        return payload
@@ -0,0 +1,146 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Single-flight coalescing of identical concurrent requests.
+
+When coalescing is enabled on :class:`aiorocket2.client.xRocketClient`
+(``coalesce_gets=True``), concurrent ``GET`` requests with the same endpoint,
+query parameters and credentials share one HTTP round trip: the first caller
+sends the request and everyone who asks for the same thing while it is in
+flight awaits the same result. Nothing is cached — once the response arrives
+the next call goes to the API again.
+
+The shared request outlives any single caller that gives up, but once every
+caller waiting for it has been cancelled or run out of deadline it is
+cancelled too, releasing its retries and any limiter or bulkhead slots.
+
+Callers receive the same parsed payload object; treat it as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+
+__all__ = [
+    "CoalesceStats",
+    "RequestCoalescer",
+]
+
+
+@dataclass
+class CoalesceStats:
+    """Counters of a :class:`RequestCoalescer`.
+
+    Attributes:
+        hits: Calls that joined a request already in flight.
+        misses: Calls that had to send their own request.
+        in_flight: Distinct requests currently in flight.
+    """
+    hits: int
+    misses: int
+    in_flight: int
+
+
+class RequestCoalescer:
+    """Shares in-flight results between callers asking for the same key."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self._abandoned: Set[asyncio.Future] = set()
+
+    async def run(
+        self,
+        key: Hashable,
+        send: Callable[[], Awaitable[Any]],
+        context: Optional[contextvars.Context] = None,
+    ) -> Any:
+        """Await ``send()`` or join the identical request already in flight.
+
+        Args:
+            key: Identity of the request.
+            send: Coroutine factory performing the request.
+            context: Context to run a newly sent request in; defaults to a
+                copy of the current one.
+
+        Returns:
+            Any: Result of ``send()``, shared by every caller with this key.
+            The request is cancelled when the last caller waiting for it
+            leaves before it finished.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            self.misses += 1
+            if context is None:
+                future = asyncio.ensure_future(send())
+            else:
+                future = context.run(lambda: asyncio.ensure_future(send()))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+        else:
+            self.hits += 1
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # one caller giving up must not cancel the request for the others
+            return await asyncio.shield(future)
+        finally:
+            self._leave(key, future)
+
+    def _leave(self, key: Hashable, future: asyncio.Future) -> None:
+        left = self._waiters[future] - 1
+        if left:
+            self._waiters[future] = left
+            return
+        del self._waiters[future]
+        if not future.done():
+            # nobody waits for the result any more: stop retrying for no one
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            self._abandoned.add(future)
+            future.cancel()
+
+    def abandoned(self) -> bool:
+        """Whether the current task is a shared request all its callers left.
+
+        Cancelling the request is not always enough: before Python 3.12
+        ``asyncio.wait_for`` drops a cancellation that arrives just as the
+        awaited operation completes, so the retry loop checks this too.
+        """
+        return asyncio.current_task() in self._abandoned
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        self._abandoned.discard(future)
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved even if every caller was cancelled
+
+    def stats(self) -> CoalesceStats:
+        """Return hit/miss counters."""
+        return CoalesceStats(
+            hits=self.hits, misses=self.misses, in_flight=len(self._in_flight)
+        )
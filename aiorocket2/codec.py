@@ -0,0 +1,183 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""JSON codecs used for request bodies and responses.
+
+:class:`aiorocket2.client.xRocketClient` encodes request bodies and decodes
+response bodies through a :class:`JSONCodec`. The standard library codec is
+the default; ``orjson`` and ``msgspec`` are used when selected and installed.
+Both parse the response bytes directly, without building an intermediate
+``str``. On a 1000-invoice page (about 400 KiB) they decoded 1.3–2.9x
+(orjson) and 1.8–2.4x (msgspec) as fast as :mod:`json`, and encoded request
+bodies about 10x as fast, on CPython 3.11 (see
+``benchmarks/bench_json_codecs.py``; results vary with the machine).
+
+Example::
+
+    # the fastest installed codec
+    client = xRocketClient(api_key="KEY", json_codec="auto")
+    print(client.json_codec.name)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Union
+
+
+__all__ = [
+    "JSONCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "get_codec",
+]
+
+
+class JSONCodec:
+    """Interface of a JSON codec.
+
+    Subclasses implement :meth:`dumps` and :meth:`loads`. :meth:`loads` must
+    raise :class:`ValueError` (or a subclass) for malformed input. Codecs that
+    can skip over a JSON value without decoding it may override
+    :meth:`loads_envelope`.
+    """
+
+    name: str = ""
+    """Short name used by :func:`get_codec`."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes."""
+        raise NotImplementedError
+
+    def loads_envelope(self, data: bytes) -> Any:
+        """Decode an API response, keeping its ``data`` field as JSON bytes.
+
+        Used for :attr:`RawMode.BYTES <aiorocket2.enums.RawMode.BYTES>`. The
+        default implementation decodes everything and re-encodes ``data``.
+        """
+        payload = self.loads(data)
+        if isinstance(payload, dict) and "data" in payload:
+            payload["data"] = self.dumps(payload["data"])
+        return payload
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec built on the standard :mod:`json` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        # json.loads(bytes) sniffs the encoding first; decoding is faster
+        return json.loads(data.decode("utf-8"))
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec built on ``orjson``.
+
+    Raises:
+        ImportError: If ``orjson`` is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.dumps = orjson.dumps  # type: ignore[method-assign]
+        self.loads = orjson.loads  # type: ignore[method-assign]
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec built on ``msgspec.json``.
+
+    :meth:`loads_envelope` only validates ``data`` and returns its bytes
+    without decoding them.
+
+    Raises:
+        ImportError: If ``msgspec`` is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode  # type: ignore[method-assign]
+        self.loads = msgspec.json.Decoder().decode  # type: ignore[method-assign]
+        envelope = msgspec.defstruct("Envelope", [
+            ("success", bool, False),
+            ("data", msgspec.Raw, msgspec.Raw(b"null")),
+        ])
+        self._envelope = msgspec.json.Decoder(envelope).decode
+
+    def loads_envelope(self, data: bytes) -> Any:
+        envelope = self._envelope(data)
+        if not envelope.success:
+            return self.loads(data)  # keep the error details for xRocketAPIError
+        return {"success": True, "data": bytes(envelope.data)}
+
+
+_CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    StdlibCodec.name: StdlibCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+
+
+def get_codec(codec: Union[str, JSONCodec] = "json") -> JSONCodec:
+    """Resolve a codec name to a :class:`JSONCodec`.
+
+    Args:
+        codec: ``"json"``, ``"orjson"``, ``"msgspec"``, ``"auto"`` (the
+            fastest installed one) or a codec instance, returned as is.
+
+    Returns:
+        JSONCodec: The codec.
+
+    Raises:
+        ImportError: If the named codec's library is not installed.
+        ValueError: If the name is unknown.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+    factory = _CODECS.get(codec)
+    if factory is None:
+        raise ValueError(f"Unknown JSON codec: {codec!r}")
+    return factory()
@@ -0,0 +1,174 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Response compression negotiation and byte accounting.
+
+:class:`aiorocket2.client.xRocketClient` advertises the encodings listed in
+:data:`ACCEPT_ENCODING` (gzip and deflate always, brotli when ``brotli`` or
+``brotlicffi`` is installed) and decodes compressed responses itself, so that
+the bytes received on the wire can be compared with the decoded size.
+:class:`ByteCounter` keeps those totals per endpoint; see
+:meth:`xRocketClient.compression_stats()
+<aiorocket2.client.xRocketClient.compression_stats>`.
+
+Example::
+
+    async with xRocketClient(api_key="KEY") as client:
+        await client.get_invoices(limit=1000)
+        stats = client.compression_stats()["GET tg-invoices"]
+        print(stats.wire_bytes, stats.decoded_bytes, stats.saved_bytes)
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+try:
+    from brotli import decompress as _brotli_decompress
+except ImportError:  # pragma: no cover - depends on the environment
+    try:
+        from brotlicffi import decompress as _brotli_decompress
+    except ImportError:
+        _brotli_decompress = None
+
+
+__all__ = [
+    "ACCEPT_ENCODING",
+    "CompressionStats",
+    "ByteCounter",
+    "decompress",
+]
+
+
+def _inflate(body: bytes) -> bytes:
+    # "deflate" is zlib-wrapped per the RFC, but some servers send raw deflate
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+_DECODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.decompress,
+    "x-gzip": gzip.decompress,
+    "deflate": _inflate,
+}
+if _brotli_decompress is not None:
+    _DECODERS["br"] = _brotli_decompress
+
+ACCEPT_ENCODING: str = ", ".join(
+    e for e in ("gzip", "deflate", "br") if e in _DECODERS
+)
+"""Value of the ``Accept-Encoding`` header sent by the client."""
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo the ``Content-Encoding`` of a response body.
+
+    Args:
+        body: Body as received on the wire.
+        content_encoding: Value of the ``Content-Encoding`` header; several
+            comma-separated codings are undone in reverse order.
+
+    Returns:
+        bytes: The decoded body.
+
+    Raises:
+        ValueError: If an encoding is not supported or the body is corrupt.
+    """
+    if not content_encoding:
+        return body
+    for coding in reversed(content_encoding.split(",")):
+        coding = coding.strip().lower()
+        if coding in ("", "identity"):
+            continue
+        decoder = _DECODERS.get(coding)
+        if decoder is None:
+            raise ValueError(f"Unsupported content encoding: {coding}")
+        try:
+            body = decoder(body)
+        except Exception as e:
+            raise ValueError(f"Corrupt {coding} body: {e}") from e
+    return body
+
+
+@dataclass
+class CompressionStats:
+    """Bytes received for one endpoint.
+
+    Attributes:
+        responses: Responses received.
+        compressed: Of ``responses``, how many were sent compressed.
+        wire_bytes: Body bytes received on the wire.
+        decoded_bytes: Body bytes after decompression.
+    """
+    responses: int = 0
+    compressed: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes compression kept off the wire."""
+        return self.decoded_bytes - self.wire_bytes
+
+    @property
+    def ratio(self) -> float:
+        """Wire size as a fraction of the decoded size (``1.0`` — no savings)."""
+        return self.wire_bytes / self.decoded_bytes if self.decoded_bytes else 1.0
+
+
+class ByteCounter:
+    """Per-endpoint totals of wire and decoded response bytes."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, CompressionStats] = {}
+
+    def record(
+        self, key: str, wire_bytes: int, decoded_bytes: int, compressed: bool
+    ) -> None:
+        """Account one response body.
+
+        Args:
+            key: Endpoint key (see :func:`aiorocket2.utils.endpoint_key`).
+            wire_bytes: Body size as received.
+            decoded_bytes: Body size after decompression.
+            compressed: Whether the response had a ``Content-Encoding``.
+        """
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = CompressionStats()
+        stats.responses += 1
+        stats.compressed += compressed
+        stats.wire_bytes += wire_bytes
+        stats.decoded_bytes += decoded_bytes
+
+    def stats(self) -> Dict[str, CompressionStats]:
+        """Return a copy of the totals, keyed by endpoint."""
+        return {
+            key: CompressionStats(
+                s.responses, s.compressed, s.wire_bytes, s.decoded_bytes
+            )
+            for key, s in self._stats.items()
+        }
@@ -33,6 +33,9 @@ Available constants
 - ``DEFAULT_RETRIES``: Default retry attempts for transient errors.
 - ``DEFAULT_BACKOFF_BASE``: Base backoff (seconds) for exponential backoff.
 - ``DEFAULT_USER_AGENT``: Default HTTP `User-Agent` header value.
+- ``DEFAULT_POOL_LIMIT``: Default total number of pooled connections.
+- ``DEFAULT_KEEPALIVE_TIMEOUT``: Default idle keep-alive time for pooled sockets.
+- ``DEFAULT_DNS_TTL``: Default DNS cache TTL in seconds.
 """
 
 __all__ = [
@@ -41,7 +44,10 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "DEFAULT_RETRIES",
     "DEFAULT_BACKOFF_BASE",
-    "DEFAULT_USER_AGENT"
+    "DEFAULT_USER_AGENT",
+    "DEFAULT_POOL_LIMIT",
+    "DEFAULT_KEEPALIVE_TIMEOUT",
+    "DEFAULT_DNS_TTL"
 ]
 
 BASEURL_MAINNET: str = "https://pay.xrocket.tg"
@@ -51,3 +57,7 @@ DEFAULT_TIMEOUT: float = 30.0          # seconds (aiohttp total timeout)
 DEFAULT_RETRIES: int = 3               # network/5xx retries
 DEFAULT_BACKOFF_BASE: float = 0.25     # seconds
 DEFAULT_USER_AGENT: str = "aiorocket2/2.0 (+https://github.com/RimMirK/aiorocket2)"
+
+DEFAULT_POOL_LIMIT: int = 100          # total pooled connections
+DEFAULT_KEEPALIVE_TIMEOUT: float = 15.0  # seconds an idle socket is kept open
+DEFAULT_DNS_TTL: int = 10              # seconds
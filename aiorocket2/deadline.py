@@ -0,0 +1,93 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Deadline propagation.
+
+A deadline is a point in time after which the caller no longer cares about
+the result. It is stored in a context variable, so it follows the call
+through every request, retry and backoff sleep — and into tasks created
+inside the block. :meth:`xRocketClient.deadline()
+<aiorocket2.client.xRocketClient.deadline>` sets it; the client clamps
+timeouts and backoff to the remaining budget and raises
+:class:`~aiorocket2.exceptions.DeadlineExceeded` once it is spent.
+
+Example::
+
+    with client.deadline(2.0):
+        invoice = await client.create_invoice(currency="TON", amount=1)
+        await client.get_invoice(invoice.id)   # shares the same 2 s
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+__all__ = [
+    "deadline",
+    "remaining_time",
+]
+
+current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "aiorocket2_deadline", default=None
+)
+"""Absolute deadline (``time.monotonic()`` based) of the current context."""
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Limit every request made inside the block to ``seconds`` in total.
+
+    Nested deadlines can only shorten the budget, never extend it.
+
+    Args:
+        seconds: Budget for the whole block.
+    """
+    until = time.monotonic() + seconds
+    outer = current_deadline.get()
+    token = current_deadline.set(until if outer is None else min(outer, until))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def without_deadline() -> contextvars.Context:
+    """Return a copy of the current context with no deadline set.
+
+    Used to start work shared by several callers, such as a coalesced
+    request, so that one caller's deadline does not cut it short for the
+    others; each caller still bounds its own wait.
+    """
+    context = contextvars.copy_context()
+    context.run(current_deadline.set, None)
+    return context
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left until the current deadline, or ``None`` without one."""
+    until = current_deadline.get()
+    if until is None:
+        return None
+    return until - time.monotonic()
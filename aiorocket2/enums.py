@@ -23,7 +23,7 @@
 Enums used by aiorocket2
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 __all__ = [
     'WithdrawalStatus',
@@ -31,7 +31,11 @@ __all__ = [
     'Country',
     'ChequeState',
     'InvoiceStatus',
-    'Status'
+    'Status',
+    'CircuitState',
+    'Idempotency',
+    'Priority',
+    'RawMode'
 ]
 
 class Base(str, Enum):
@@ -346,3 +350,47 @@ class Status(Base):
     SHUTTING_DOWN = "shutting_down"
     UNKNOWN = "UNKNOWN"
     """Fallback used when the API health endpoint returns an unknown status."""
+
+class CircuitState(Base):
+    """State of the client-side circuit breaker (see :mod:`aiorocket2.breaker`)."""
+    CLOSED = "closed"
+    """Requests flow normally."""
+    OPEN = "open"
+    """Requests fail fast without reaching the API."""
+    HALF_OPEN = "half_open"
+    """A health probe is checking whether the API has recovered."""
+
+class Idempotency(Base):
+    """How safely a request can be repeated; decides what the client retries."""
+    SAFE = "safe"
+    """Reads, deletes and full updates: repeating them changes nothing."""
+    BY_KEY = "by_key"
+    """Creates deduplicated by a caller-supplied id, such as ``transfer_id``."""
+    UNSAFE = "unsafe"
+    """Creates without an idempotency key: retried only if never sent."""
+
+class Priority(IntEnum):
+    """Dispatch priority of a request; lower goes first.
+
+    See :mod:`aiorocket2.scheduler`.
+    """
+    HIGH = 0
+    """User-facing calls such as checkout."""
+    NORMAL = 1
+    LOW = 2
+    """Reporting, sync and other background traffic."""
+
+    def __str__(self):
+        return f"{self.__class__.__name__}.{self.name}"
+
+    def __repr__(self):
+        return str(self)
+
+class RawMode(Base):
+    """What tag methods return (see :meth:`aiorocket2.client.xRocketClient.raw`)."""
+    OFF = "off"
+    """Typed models built with ``from_api``."""
+    DICT = "dict"
+    """The ``data`` field of the response, as parsed JSON."""
+    BYTES = "bytes"
+    """The ``data`` field of the response, as undecoded JSON bytes."""
@@ -26,7 +26,10 @@ Exceptions used by aiorocket2
 from typing import Any, Mapping, Optional
 
 __all__ = [
-    "xRocketAPIError"
+    "xRocketAPIError",
+    "CircuitOpenError",
+    "DeadlineExceeded",
+    "RequestRejected"
 ]
 
 class xRocketAPIError(Exception):
@@ -37,6 +40,7 @@ class xRocketAPIError(Exception):
         message: Human-readable error message.
         payload: Raw JSON payload returned by the API.
         status: HTTP status code (if known).
+        headers: HTTP response headers (if known).
     
     Example:
 
@@ -46,11 +50,57 @@ class xRocketAPIError(Exception):
             print(exc.status, exc.payload)
     """
 
-    def __init__(self, payload: Mapping[str, Any], status: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        payload: Mapping[str, Any],
+        status: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
         self.payload = dict(payload)
         self.status = status
+        self.headers = headers
         self.message = payload.get("message")
         super().__init__(self.message)
     
     def __str__(self):
         return f"API says: {self.message or '~'}\nStatus: {self.status}\nPayload: {self.payload!r}"
+
+
+class CircuitOpenError(xRocketAPIError):
+    """
+    Raised without contacting the API while the client's circuit breaker is open.
+
+    Attributes:
+        retry_in: Seconds until the breaker probes the API again.
+    """
+
+    def __init__(self, retry_in: float) -> None:
+        super().__init__({"message": "Circuit breaker is open, request not sent"})
+        self.retry_in = retry_in
+
+
+class DeadlineExceeded(xRocketAPIError):
+    """
+    Raised when the deadline set with ``xRocketClient.deadline()`` runs out.
+
+    The request is abandoned — no further retries or backoff sleeps — as soon
+    as the remaining budget cannot cover them.
+    """
+
+    def __init__(self, message: str = "Deadline exceeded") -> None:
+        super().__init__({"message": message})
+
+
+class RequestRejected(xRocketAPIError):
+    """
+    Raised immediately, without queueing, when admission control sheds a request.
+
+    Attributes:
+        endpoint: Endpoint key whose in-flight and queue limits were full.
+    """
+
+    def __init__(self, endpoint: str) -> None:
+        super().__init__(
+            {"message": f"Request to {endpoint} rejected: client overloaded"}
+        )
+        self.endpoint = endpoint
@@ -0,0 +1,141 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Hedged requests for latency-critical reads.
+
+With a :class:`HedgePolicy` on :class:`aiorocket2.client.xRocketClient`, an
+idempotent ``GET`` that has not answered within the hedge delay is sent a
+second time; aiohttp serves the copy from another pooled connection, the
+first answer wins and the other request is cancelled. The delay is either
+fixed or the observed latency percentile of the endpoint, and a budget caps
+how much extra load hedges may add.
+
+Example::
+
+    policy = HedgePolicy(percentile=0.95, budget=0.05)
+    async with xRocketClient(api_key="KEY", hedging=policy) as client:
+        await client.get_invoice(42)
+        print(policy.stats())
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Collection, Optional
+
+from .metrics import LatencyRecorder
+
+
+__all__ = [
+    "HedgePolicy",
+    "HedgeStats",
+]
+
+DEFAULT_HEDGE_ENDPOINTS = (
+    "GET tg-invoices/{id}",
+    "GET app/withdrawal/status/{id}",
+)
+"""Endpoints hedged when no explicit list is given."""
+
+
+@dataclass
+class HedgeStats:
+    """Counters of a :class:`HedgePolicy`.
+
+    Attributes:
+        requests: Requests eligible for hedging.
+        hedges: Hedge requests actually sent.
+        wins: Hedges that answered before the original request.
+        denied: Hedges skipped because the budget was exhausted.
+    """
+    requests: int
+    hedges: int
+    wins: int
+    denied: int
+
+
+class HedgePolicy:
+    """When and how often to hedge GET requests.
+
+    Args:
+        delay: Fixed hedge delay in seconds. ``None`` — use the observed
+            ``percentile`` latency of the endpoint.
+        percentile: Latency quantile used as the delay when ``delay`` is ``None``.
+        min_samples: Samples needed before the observed percentile is trusted;
+            until then ``fallback_delay`` is used.
+        fallback_delay: Delay used while there is not enough data.
+        min_delay: Lower bound for the computed delay.
+        budget: Maximum extra load, as a fraction of eligible requests
+            (``0.05`` — at most 5 % more requests).
+        endpoints: Endpoint keys to hedge. Only ``GET`` endpoints are ever hedged.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        *,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        fallback_delay: float = 0.2,
+        min_delay: float = 0.005,
+        budget: float = 0.05,
+        endpoints: Collection[str] = DEFAULT_HEDGE_ENDPOINTS,
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.fallback_delay = fallback_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.endpoints = frozenset(endpoints)
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self.denied = 0
+
+    def applies(self, key: str) -> bool:
+        """Whether requests to endpoint ``key`` are hedged."""
+        return key.startswith("GET ") and key in self.endpoints
+
+    def delay_for(self, key: str, latency: LatencyRecorder) -> float:
+        """Return how long to wait before hedging a request to ``key``."""
+        if self.delay is not None:
+            return self.delay
+        if latency.count(key) < self.min_samples:
+            return self.fallback_delay
+        return max(self.min_delay, latency.percentile(key, self.percentile) or 0.0)
+
+    def try_spend(self) -> bool:
+        """Reserve one hedge if the budget allows it."""
+        if self.hedges + 1 > self.budget * self.requests:
+            self.denied += 1
+            return False
+        self.hedges += 1
+        return True
+
+    def stats(self) -> HedgeStats:
+        """Return hedge counters."""
+        return HedgeStats(
+            requests=self.requests,
+            hedges=self.hedges,
+            wins=self.wins,
+            denied=self.denied,
+        )
@@ -0,0 +1,104 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Per-endpoint latency tracking.
+
+Every :class:`aiorocket2.client.xRocketClient` records how long successful
+requests take, keyed by :func:`aiorocket2.utils.endpoint_key`. The rolling
+windows kept here drive latency-based features such as hedged requests and
+are available for monitoring through ``client.latency``.
+
+Example::
+
+    p95 = client.latency.percentile("GET tg-invoices/{id}", 0.95)
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+__all__ = [
+    "LatencyWindow",
+    "LatencyRecorder",
+]
+
+DEFAULT_WINDOW_SIZE = 500
+"""Number of most recent samples kept per endpoint."""
+
+
+class LatencyWindow:
+    """Rolling window of the most recent latency samples (seconds).
+
+    A sorted copy of the window is kept up to date on every :meth:`add`, so
+    :meth:`percentile`, which is called on the request path, is a lookup.
+    """
+
+    def __init__(self, size: int = DEFAULT_WINDOW_SIZE) -> None:
+        self.samples: Deque[float] = deque(maxlen=size)
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        samples = self.samples
+        if len(samples) == samples.maxlen:
+            evicted = samples[0]
+            del self._sorted[bisect_left(self._sorted, evicted)]
+        samples.append(value)
+        insort(self._sorted, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the ``q`` quantile (``0.0``–``1.0``) or ``None`` without samples."""
+        ordered = self._sorted
+        if not ordered:
+            return None
+        last = len(ordered) - 1
+        return ordered[min(last, max(0, int(round(q * last))))]
+
+
+class LatencyRecorder:
+    """Collection of :class:`LatencyWindow` objects keyed by endpoint."""
+
+    def __init__(self, size: int = DEFAULT_WINDOW_SIZE) -> None:
+        self.size = size
+        self.windows: Dict[str, LatencyWindow] = {}
+
+    def record(self, key: str, value: float) -> None:
+        """Record a latency sample for endpoint ``key``."""
+        window = self.windows.get(key)
+        if window is None:
+            window = self.windows[key] = LatencyWindow(self.size)
+        window.add(value)
+
+    def count(self, key: str) -> int:
+        """Return the number of samples currently kept for ``key``."""
+        window = self.windows.get(key)
+        return len(window) if window is not None else 0
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """Return the ``q`` quantile for ``key`` or ``None`` without samples."""
+        window = self.windows.get(key)
+        return window.percentile(q) if window is not None else None
@@ -0,0 +1,194 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Connection pool configuration and statistics.
+
+:class:`PoolConfig` describes the ``aiohttp`` connector used by
+:class:`aiorocket2.client.xRocketClient` when the client owns its session, and
+:class:`PoolStats` is the snapshot returned by
+:meth:`xRocketClient.pool_stats() <aiorocket2.client.xRocketClient.pool_stats>`.
+
+Example::
+
+    pool = PoolConfig(limit=200, limit_per_host=50, keepalive_timeout=30)
+    async with xRocketClient(api_key="KEY", pool=pool) as client:
+        await client.get_info()
+        print(client.pool_stats())
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+
+from .constants import DEFAULT_DNS_TTL, DEFAULT_KEEPALIVE_TIMEOUT, DEFAULT_POOL_LIMIT
+
+
+__all__ = [
+    "PoolConfig",
+    "PoolStats",
+]
+
+
+@dataclass
+class PoolConfig:
+    """Settings for the connection pool of a client-owned session.
+
+    Attributes:
+        limit: Total number of simultaneously open connections
+            (``0`` — unlimited).
+        limit_per_host: Connections per ``(host, port, ssl)`` triple
+            (``0`` — unlimited).
+        keepalive_timeout: Seconds an idle socket stays in the pool before it
+            is closed.
+        ttl_dns_cache: Seconds resolved addresses are cached (``None`` — forever).
+        use_dns_cache: Whether to cache DNS lookups at all.
+        force_close: Close every connection after its response (disables keep-alive).
+        enable_cleanup_closed: Abort SSL transports that were not shut down cleanly.
+        recycle_after: Replace the whole pool after this many seconds so that
+            long-lived sockets are re-established (``None`` — never recycle).
+            The retired pool is closed once in-flight requests had time to finish.
+    """
+    limit: int = DEFAULT_POOL_LIMIT
+    limit_per_host: int = 0
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: Optional[int] = DEFAULT_DNS_TTL
+    use_dns_cache: bool = True
+    force_close: bool = False
+    enable_cleanup_closed: bool = False
+    recycle_after: Optional[float] = None
+
+    def build_connector(self) -> aiohttp.TCPConnector:
+        """Create a new :class:`aiohttp.TCPConnector` from this configuration.
+
+        Must be called from inside a running event loop.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            # aiohttp refuses keepalive_timeout together with force_close
+            keepalive_timeout=None if self.force_close else self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache,
+            force_close=self.force_close,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+
+@dataclass
+class PoolStats:
+    """Point-in-time snapshot of the connection pool.
+
+    Attributes:
+        open: Sockets currently open (``idle + in_use``).
+        idle: Keep-alive sockets waiting in the pool.
+        in_use: Sockets currently serving a request.
+        limit: Configured total connection limit (``0`` — unlimited).
+        waiting: Requests currently queued because the pool is exhausted.
+        acquired: Connections handed out since the pool was created.
+        created: Of ``acquired``, how many required a new socket.
+        acquire_wait_avg: Mean time (seconds) between sending a request and
+            getting a connection for it, including queueing, DNS and connect.
+        acquire_wait_max: Worst observed acquire time (seconds).
+        age: Seconds since the current pool was created.
+    """
+    open: int
+    idle: int
+    in_use: int
+    limit: int
+    waiting: int
+    acquired: int
+    created: int
+    acquire_wait_avg: float
+    acquire_wait_max: float
+    age: float
+
+
+class _PoolTracer:
+    """Collects connection acquire timings through ``aiohttp`` tracing hooks."""
+
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.acquired = 0
+        self.created = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config that feeds this tracer."""
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_connection_queued_start.append(self._on_queued_start)
+        config.on_connection_queued_end.append(self._on_queued_end)
+        config.on_connection_create_end.append(self._on_create_end)
+        config.on_connection_reuseconn.append(self._on_reuseconn)
+        return config
+
+    def _record(self, ctx) -> None:
+        wait = time.perf_counter() - getattr(ctx, "request_start", time.perf_counter())
+        self.acquired += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        timing = getattr(ctx, "trace_request_ctx", None)
+        if timing is not None and hasattr(timing, "acquire"):
+            timing.acquire = wait
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        ctx.request_start = time.perf_counter()
+
+    async def _on_queued_start(self, session, ctx, params) -> None:
+        self.waiting += 1
+
+    async def _on_queued_end(self, session, ctx, params) -> None:
+        self.waiting = max(0, self.waiting - 1)
+
+    async def _on_create_end(self, session, ctx, params) -> None:
+        self.created += 1
+        self._record(ctx)
+
+    async def _on_reuseconn(self, session, ctx, params) -> None:
+        self._record(ctx)
+
+
+def _connector_stats(
+    connector: Optional[aiohttp.BaseConnector], tracer: _PoolTracer, age: float
+) -> PoolStats:
+    """Build :class:`PoolStats` from a connector and its tracer."""
+    # aiohttp keeps idle sockets in ``_conns`` and busy ones in ``_acquired``
+    idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+    in_use = len(getattr(connector, "_acquired", ()))
+    return PoolStats(
+        open=idle + in_use,
+        idle=idle,
+        in_use=in_use,
+        limit=getattr(connector, "limit", 0) or 0,
+        waiting=tracer.waiting,
+        acquired=tracer.acquired,
+        created=tracer.created,
+        acquire_wait_avg=(
+            tracer.wait_total / tracer.acquired if tracer.acquired else 0.0
+        ),
+        acquire_wait_max=tracer.wait_max,
+        age=age,
+    )
@@ -0,0 +1,383 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Client-side rate limiting.
+
+:class:`RateLimiter` is an async token-bucket limiter with one global bucket
+and optional buckets per endpoint (see :func:`aiorocket2.utils.endpoint_key`).
+Pass it to :class:`aiorocket2.client.xRocketClient` and every request waits
+for a token before it is sent. When the API answers ``429 Too Many Requests``
+the limiter pauses for the ``Retry-After`` delay and halves the refill rate;
+the rate then recovers gradually with each successful request.
+
+Example::
+
+    limiter = RateLimiter(rate=20, burst=40, per_endpoint={"POST app/transfer": (5, 5)})
+    async with xRocketClient(api_key="KEY", rate_limiter=limiter) as client:
+        ...
+        print(limiter.fill_levels())
+
+When several worker processes share one API key, use
+:class:`SharedRateLimiter` instead: its buckets live in a memory-mapped file,
+so every process on the host draws from the same quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+import time
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+__all__ = [
+    "BaseRateLimiter",
+    "TokenBucket",
+    "RateLimiter",
+    "SharedRateLimiter",
+]
+
+GLOBAL_KEY = "*"
+"""Key of the global bucket in :meth:`BaseRateLimiter.fill_levels`."""
+
+
+class BaseRateLimiter:
+    """Interface every rate limiter passed to the client implements."""
+
+    async def acquire(self, key: str) -> None:
+        """Wait until a request to endpoint ``key`` may be sent."""
+        raise NotImplementedError
+
+    def throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        """Slow down after the API rejected a request to ``key`` with 429."""
+        raise NotImplementedError
+
+    def record_success(self, key: str) -> None:
+        """Report a request to ``key`` that was not throttled."""
+
+    def fill_levels(self) -> Dict[str, float]:
+        """Return the fill level (``0.0``–``1.0``) of every bucket by key."""
+        raise NotImplementedError
+
+
+class TokenBucket:
+    """A single token bucket refilled continuously at ``rate`` tokens per second.
+
+    Attributes:
+        rate: Current refill rate (lowered after throttling).
+        base_rate: Configured refill rate.
+        capacity: Maximum number of tokens (burst size).
+        tokens: Tokens currently available.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = self.base_rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        refilled = self.tokens + (now - self._updated) * self.rate
+        self.tokens = min(self.capacity, refilled)
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """Return seconds until one token is available (``0`` — available now)."""
+        self._refill(now)
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        """Consume one token; call only after :meth:`delay` returned ``0``."""
+        self.tokens -= 1
+
+    def throttle(self, retry_after: Optional[float], min_rate_factor: float) -> None:
+        """Empty the bucket, pause for ``retry_after`` and halve the rate."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = 0.0
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+        self.rate = max(self.base_rate * min_rate_factor, self.rate / 2)
+
+    def recover(self, step: float) -> None:
+        """Raise the rate back towards :attr:`base_rate` by ``step`` of it."""
+        if self.rate < self.base_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * step)
+
+    @property
+    def fill(self) -> float:
+        """Current fill level between ``0.0`` and ``1.0``."""
+        self._refill(time.monotonic())
+        return max(0.0, self.tokens) / self.capacity
+
+
+class RateLimiter(BaseRateLimiter):
+    """In-process token-bucket limiter with a global and per-endpoint buckets.
+
+    Args:
+        rate: Global requests per second.
+        burst: Global bucket capacity. Defaults to ``rate``.
+        per_endpoint: Limits for specific endpoints, keyed like
+            ``"POST app/transfer"``; values are ``rate`` or ``(rate, burst)``.
+        endpoint_rate: Default ``rate`` (or ``(rate, burst)``) for endpoints not
+            listed in ``per_endpoint``. ``None`` — only the global bucket applies.
+        min_rate_factor: Lowest fraction of the configured rate that 429
+            responses may push a bucket down to.
+        recovery_step: Fraction of the configured rate restored per success.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        per_endpoint: Optional[Mapping[str, Union[float, Tuple[float, float]]]] = None,
+        endpoint_rate: Optional[Union[float, Tuple[float, float]]] = None,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        self.global_bucket = TokenBucket(rate, burst)
+        self.buckets: Dict[str, TokenBucket] = {
+            key: self._bucket(limit) for key, limit in (per_endpoint or {}).items()
+        }
+        self.endpoint_rate = endpoint_rate
+        self.min_rate_factor = min_rate_factor
+        self.recovery_step = recovery_step
+
+    @staticmethod
+    def _bucket(limit: Union[float, Tuple[float, float]]) -> TokenBucket:
+        if isinstance(limit, tuple):
+            return TokenBucket(*limit)
+        return TokenBucket(limit)
+
+    def _endpoint_bucket(self, key: str) -> Optional[TokenBucket]:
+        bucket = self.buckets.get(key)
+        if bucket is None and self.endpoint_rate is not None:
+            bucket = self.buckets[key] = self._bucket(self.endpoint_rate)
+        return bucket
+
+    async def acquire(self, key: str) -> None:
+        bucket = self._endpoint_bucket(key)
+        while True:
+            now = time.monotonic()
+            wait = self.global_bucket.delay(now)
+            if bucket is not None:
+                wait = max(wait, bucket.delay(now))
+            if wait <= 0:
+                self.global_bucket.take()
+                if bucket is not None:
+                    bucket.take()
+                return
+            await asyncio.sleep(wait)
+
+    def throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        self.global_bucket.throttle(retry_after, self.min_rate_factor)
+        bucket = self._endpoint_bucket(key)
+        if bucket is not None:
+            bucket.throttle(retry_after, self.min_rate_factor)
+
+    def record_success(self, key: str) -> None:
+        self.global_bucket.recover(self.recovery_step)
+        bucket = self.buckets.get(key)
+        if bucket is not None:
+            bucket.recover(self.recovery_step)
+
+    def fill_levels(self) -> Dict[str, float]:
+        levels = {GLOBAL_KEY: self.global_bucket.fill}
+        levels.update((key, bucket.fill) for key, bucket in self.buckets.items())
+        return levels
+
+
+class SharedRateLimiter(BaseRateLimiter):
+    """Token-bucket limiter shared by all processes on one host.
+
+    Bucket state is stored in a small memory-mapped file and every update is
+    done under an exclusive ``flock``, so worker processes that create a
+    limiter with the same ``path`` share one global bucket and the same
+    per-endpoint buckets. Throttling after a ``429`` is shared too: when one
+    worker is told to back off, all of them do.
+
+    All processes must use the same ``rate``, ``burst`` and ``per_endpoint``
+    settings; the first process to create the file initialises it. The lock
+    is held only for a few microseconds per acquire (see
+    ``benchmarks/bench_shared_ratelimit.py``), so it is taken synchronously.
+    Requires a POSIX system.
+
+    Args:
+        path: File backing the shared state, for example
+            ``"/dev/shm/aiorocket2-<app>.bucket"``.
+        rate: Global requests per second across all processes.
+        burst: Global bucket capacity. Defaults to ``rate``.
+        per_endpoint: Limits for specific endpoints, as in :class:`RateLimiter`.
+        min_rate_factor: Lowest fraction of the configured rate that 429
+            responses may push a bucket down to.
+        recovery_step: Fraction of the configured rate restored per success.
+    """
+
+    _SLOT = struct.Struct("=dddd")  # tokens, updated, rate, blocked_until
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        per_endpoint: Optional[Mapping[str, Union[float, Tuple[float, float]]]] = None,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedRateLimiter requires a POSIX system")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.path = path
+        self.min_rate_factor = min_rate_factor
+        self.recovery_step = recovery_step
+        limits = {GLOBAL_KEY: (rate, burst)}
+        for key, limit in (per_endpoint or {}).items():
+            limits[key] = limit if isinstance(limit, tuple) else (limit, None)
+        # slots are assigned in key order so every process agrees on the layout
+        self._keys: List[str] = [GLOBAL_KEY] + sorted(
+            k for k in limits if k != GLOBAL_KEY
+        )
+        self._slots = {key: i for i, key in enumerate(self._keys)}
+        self._base_rates = [float(limits[key][0]) for key in self._keys]
+        self._capacities = [
+            float(burst if burst is not None else max(1.0, rate))
+            for rate, burst in (limits[key] for key in self._keys)
+        ]
+        size = self._SLOT.size * len(self._keys)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            fresh = os.fstat(self._fd).st_size < size
+            if fresh:
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+            if fresh:
+                now = time.monotonic()
+                for i in range(len(self._keys)):
+                    self._write(i, self._capacities[i], now, self._base_rates[i], 0.0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Unmap the shared file. The file itself is left for other processes."""
+        self._map.close()
+        os.close(self._fd)
+
+    def _read(self, i: int) -> List[float]:
+        return list(self._SLOT.unpack_from(self._map, i * self._SLOT.size))
+
+    def _write(
+        self, i: int, tokens: float, updated: float, rate: float, blocked: float
+    ) -> None:
+        offset = i * self._SLOT.size
+        self._SLOT.pack_into(self._map, offset, tokens, updated, rate, blocked)
+
+    def _refilled(self, i: int, now: float) -> List[float]:
+        tokens, updated, rate, blocked = self._read(i)
+        tokens = min(self._capacities[i], tokens + max(0.0, now - updated) * rate)
+        return [tokens, now, rate, blocked]
+
+    def _slots_for(self, key: str) -> List[int]:
+        slot = self._slots.get(key)
+        return [0] if slot is None else [0, slot]
+
+    def _try_take(self, slots: List[int]) -> float:
+        """Take a token from every slot, or return how long to wait."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            now = time.monotonic()
+            states = {i: self._refilled(i, now) for i in slots}
+            wait = 0.0
+            for tokens, _, rate, blocked in states.values():
+                if now < blocked:
+                    wait = max(wait, blocked - now)
+                elif tokens < 1:
+                    wait = max(wait, (1 - tokens) / rate)
+            if wait <= 0:
+                for state in states.values():
+                    state[0] -= 1
+            for i, state in states.items():
+                self._write(i, *state)
+            return wait
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _update(
+        self, key: str, throttle: bool, retry_after: Optional[float] = None
+    ) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            now = time.monotonic()
+            for i in self._slots_for(key):
+                tokens, updated, rate, blocked = self._refilled(i, now)
+                base = self._base_rates[i]
+                if throttle:
+                    tokens = 0.0
+                    if retry_after:
+                        blocked = max(blocked, now + retry_after)
+                    rate = max(base * self.min_rate_factor, rate / 2)
+                elif rate < base:
+                    rate = min(base, rate + base * self.recovery_step)
+                self._write(i, tokens, updated, rate, blocked)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    async def acquire(self, key: str) -> None:
+        slots = self._slots_for(key)
+        while True:
+            wait = self._try_take(slots)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        self._update(key, True, retry_after)
+
+    def record_success(self, key: str) -> None:
+        # nothing to recover in the common case, so skip taking the lock
+        if all(self._read(i)[2] >= self._base_rates[i] for i in self._slots_for(key)):
+            return
+        self._update(key, False)
+
+    def fill_levels(self) -> Dict[str, float]:
+        now = time.monotonic()
+        return {
+            key: max(0.0, self._refilled(i, now)[0]) / self._capacities[i]
+            for i, key in enumerate(self._keys)
+        }
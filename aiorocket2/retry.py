@@ -0,0 +1,158 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Retry policy: backoff with jitter and a client-wide retry budget.
+
+Fixed exponential backoff makes every worker retry in lockstep after a
+blip. :class:`RetryPolicy` randomises the delay (full or decorrelated
+jitter), caps it, honours ``Retry-After`` and can limit retries with a token
+budget: with ``budget_ratio`` set, every request deposits that many tokens
+and every retry spends one, so retries cannot exceed that fraction of the
+traffic once the initial ``budget_reserve`` is used up. There is no budget
+by default.
+
+Example::
+
+    policy = RetryPolicy(
+        retries=4, base=0.1, cap=5, jitter="decorrelated", budget_ratio=0.1
+    )
+    async with xRocketClient(api_key="KEY", retry_policy=policy) as client:
+        ...
+        print(policy.stats())
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .constants import DEFAULT_BACKOFF_BASE, DEFAULT_RETRIES
+
+
+__all__ = [
+    "RetryPolicy",
+    "RetryStats",
+]
+
+JITTER_MODES = ("none", "full", "decorrelated")
+
+
+@dataclass
+class RetryStats:
+    """Retry counters of one endpoint.
+
+    Attributes:
+        retries: Retries performed.
+        delay: Total time spent sleeping before retries (seconds).
+        denied: Retries skipped because the budget was exhausted.
+    """
+    retries: int = 0
+    delay: float = 0.0
+    denied: int = 0
+
+
+class RetryPolicy:
+    """How many times, and after which delay, failed requests are retried.
+
+    Args:
+        retries: Maximum retries per request.
+        base: Delay (seconds) the backoff grows from.
+        cap: Upper bound for a single backoff delay (seconds).
+        jitter: ``"full"`` — uniform in ``[0, min(cap, base * 2**attempt)]``;
+            ``"decorrelated"`` — uniform in ``[base, previous * 3]`` capped;
+            ``"none"`` — plain ``base * 2**attempt`` capped.
+        respect_retry_after: Wait at least as long as ``Retry-After`` asks.
+        budget_ratio: Retry tokens earned per request (``None`` — no budget,
+            every failure is retried up to ``retries`` times).
+        budget_reserve: Tokens available up front and the most that can be
+            saved up, so short bursts of retries are allowed after quiet periods.
+    """
+
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        *,
+        base: float = DEFAULT_BACKOFF_BASE,
+        cap: float = 10.0,
+        jitter: str = "full",
+        respect_retry_after: bool = True,
+        budget_ratio: Optional[float] = None,
+        budget_reserve: float = 10.0,
+    ) -> None:
+        if jitter not in JITTER_MODES:
+            raise ValueError(f"jitter must be one of {JITTER_MODES}")
+        self.retries = max(0, retries)
+        self.base = max(0.0, base)
+        self.cap = cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.tokens = budget_reserve
+        self._stats: Dict[str, RetryStats] = {}
+
+    def on_request(self) -> None:
+        """Deposit the budget share of one new request."""
+        if self.budget_ratio is not None:
+            self.tokens = min(self.budget_reserve, self.tokens + self.budget_ratio)
+
+    def try_spend(self, key: str) -> bool:
+        """Take one retry token for endpoint ``key`` if the budget allows it."""
+        if self.budget_ratio is None:
+            return True
+        if self.tokens < 1:
+            self._stats.setdefault(key, RetryStats()).denied += 1
+            return False
+        self.tokens -= 1
+        return True
+
+    def backoff(
+        self, attempt: int, previous: float, retry_after: Optional[float] = None
+    ) -> float:
+        """Return the delay before retry number ``attempt`` (0-based).
+
+        Args:
+            attempt: Retries already made for this request.
+            previous: Delay used before the previous retry (``0`` for the first).
+            retry_after: Delay requested by the server, if any.
+        """
+        exponential = min(self.cap, self.base * (2 ** attempt))
+        if self.jitter == "full":
+            delay = random.uniform(0, exponential)
+        elif self.jitter == "decorrelated":
+            upper = max(self.base, previous * 3)
+            delay = min(self.cap, random.uniform(self.base, upper))
+        else:
+            delay = exponential
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def record(self, key: str, delay: float) -> None:
+        """Count one retry of endpoint ``key`` preceded by ``delay`` seconds."""
+        stats = self._stats.setdefault(key, RetryStats())
+        stats.retries += 1
+        stats.delay += delay
+
+    def stats(self) -> Dict[str, RetryStats]:
+        """Return retry counters per endpoint key."""
+        return dict(self._stats)
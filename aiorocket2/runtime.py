@@ -0,0 +1,121 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Opt-in fast event loop for loops the library runs itself.
+
+:func:`new_event_loop` creates a ``uvloop`` loop when ``uvloop`` is installed
+(``pip install "aiorocket2[speedups]"``). Otherwise, on Python 3.12+, the
+stock loop gets :func:`asyncio.eager_task_factory`, which starts tasks
+synchronously and skips a loop iteration for coroutines that finish without
+suspending; ``uvloop`` does not support that factory, so the two are never
+combined. :func:`run` is :func:`asyncio.run` on such a loop.
+
+Nothing changes unless asked for: applications that run their own loop keep
+it. Use it for scripts and workers, and for :class:`~aiorocket2.sync.SyncClient`
+(``fast_loop=True``).
+
+Example::
+
+    from aiorocket2 import runtime
+
+    runtime.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the environment
+    uvloop = None
+
+
+__all__ = [
+    "HAS_UVLOOP",
+    "HAS_EAGER_TASKS",
+    "new_event_loop",
+    "run",
+]
+
+T = TypeVar("T")
+
+HAS_UVLOOP: bool = uvloop is not None
+"""Whether ``uvloop`` is installed."""
+
+HAS_EAGER_TASKS: bool = sys.version_info >= (3, 12)
+"""Whether :func:`asyncio.eager_task_factory` is available."""
+
+
+def new_event_loop(
+    *, use_uvloop: bool = True, eager_tasks: bool = True
+) -> asyncio.AbstractEventLoop:
+    """Create the fastest available event loop.
+
+    Args:
+        use_uvloop: Use ``uvloop`` if it is installed.
+        eager_tasks: Install :func:`asyncio.eager_task_factory` on Python 3.12+
+            when the stock asyncio loop is used.
+
+    Returns:
+        asyncio.AbstractEventLoop: A new, not yet running loop.
+    """
+    if use_uvloop and HAS_UVLOOP:
+        return uvloop.new_event_loop()
+    loop = asyncio.new_event_loop()
+    if eager_tasks and HAS_EAGER_TASKS:
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def run(
+    main: Coroutine[Any, Any, T], *, use_uvloop: bool = True, eager_tasks: bool = True
+) -> T:
+    """Run ``main`` like :func:`asyncio.run`, on a loop from :func:`new_event_loop`.
+
+    Args:
+        main: Coroutine to run.
+        use_uvloop: Use ``uvloop`` if it is installed.
+        eager_tasks: Install the eager task factory on the stock loop
+            (Python 3.12+).
+
+    Returns:
+        The result of ``main``.
+    """
+    def factory() -> asyncio.AbstractEventLoop:
+        return new_event_loop(use_uvloop=use_uvloop, eager_tasks=eager_tasks)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(main)
+
+    loop = factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
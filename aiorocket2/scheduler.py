@@ -0,0 +1,195 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Priority-aware dispatch of requests.
+
+When the client is saturated every waiting coroutine normally competes
+equally for the connection pool. A :class:`PriorityScheduler` caps the
+number of requests in flight and, whenever a slot frees up, hands it to the
+most urgent waiter: user-facing calls such as ``create_invoice`` go ahead of
+reporting and sync traffic. Waiters age while they wait, so low-priority
+requests are delayed but never starved.
+
+Priorities come from the ``per_endpoint`` map or, for a single call, from
+the :meth:`xRocketClient.priority() <aiorocket2.client.xRocketClient.priority>`
+context manager.
+
+Example::
+
+    scheduler = PriorityScheduler(max_concurrency=50)
+    async with xRocketClient(api_key="KEY", scheduler=scheduler) as client:
+        with client.priority(Priority.LOW):
+            await client.get_invoices(limit=1000)
+        print(scheduler.stats())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+from .enums import Priority
+
+
+__all__ = [
+    "PriorityScheduler",
+    "PriorityStats",
+]
+
+DEFAULT_PRIORITIES: Mapping[str, Priority] = {
+    "POST tg-invoices": Priority.HIGH,
+    "POST app/withdrawal": Priority.HIGH,
+    "POST app/transfer": Priority.HIGH,
+    "GET tg-invoices": Priority.LOW,
+    "GET multi-cheque": Priority.LOW,
+}
+"""Endpoint priorities used when no ``per_endpoint`` map is given."""
+
+current_priority: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar(
+    "aiorocket2_priority", default=None
+)
+"""Priority set by :meth:`xRocketClient.priority` for the current context."""
+
+
+@dataclass
+class PriorityStats:
+    """Queue metrics of one priority class.
+
+    Attributes:
+        waiting: Requests of this class currently queued.
+        dispatched: Requests of this class dispatched so far.
+        wait_avg: Mean queue wait per dispatched request (seconds).
+        wait_max: Longest queue wait (seconds).
+    """
+    waiting: int = 0
+    dispatched: int = 0
+    wait_avg: float = 0.0
+    wait_max: float = 0.0
+
+
+class _Waiter:
+    __slots__ = ("priority", "enqueued", "seq", "future")
+
+    def __init__(self, priority: Priority, seq: int, future: asyncio.Future) -> None:
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.seq = seq
+        self.future = future
+
+
+class PriorityScheduler:
+    """Limits requests in flight and dispatches queued ones by priority.
+
+    Args:
+        max_concurrency: Requests allowed in flight at once.
+        per_endpoint: Priority per endpoint key; unlisted endpoints are
+            ``Priority.NORMAL``. Defaults to :data:`DEFAULT_PRIORITIES`.
+        aging: Seconds of waiting that raise a request by one priority level
+            (starvation protection).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        per_endpoint: Optional[Mapping[str, Priority]] = None,
+        aging: float = 1.0,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.per_endpoint = dict(
+            DEFAULT_PRIORITIES if per_endpoint is None else per_endpoint
+        )
+        self.aging = aging
+        self.in_flight = 0
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._dispatched: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._wait_total: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._wait_max: Dict[Priority, float] = {p: 0.0 for p in Priority}
+
+    def priority_for(self, key: str) -> Priority:
+        """Priority of a request to endpoint ``key`` in the current context."""
+        priority = current_priority.get()
+        if priority is not None:
+            return priority
+        return self.per_endpoint.get(key, Priority.NORMAL)
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait until a request of ``priority`` may be dispatched."""
+        if self.in_flight < self.max_concurrency and not self._waiters:
+            self.in_flight += 1
+            self._record(priority, 0.0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(priority, next(self._seq), future)
+        self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release()  # dispatched just before cancellation
+            elif waiter in self._waiters:  # release() may have dropped it already
+                self._waiters.remove(waiter)
+            raise
+        self._record(priority, time.monotonic() - waiter.enqueued)
+
+    def release(self) -> None:
+        """Finish a request and dispatch the most urgent waiter."""
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.max_concurrency:
+            now = time.monotonic()
+            waiter = min(
+                self._waiters,
+                key=lambda w: (w.priority - (now - w.enqueued) / self.aging, w.seq),
+            )
+            self._waiters.remove(waiter)
+            if not waiter.future.done():
+                self.in_flight += 1
+                waiter.future.set_result(None)
+
+    def _record(self, priority: Priority, waited: float) -> None:
+        self._dispatched[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+
+    def stats(self) -> Dict[Priority, PriorityStats]:
+        """Return queue metrics per priority class."""
+        waiting = {p: 0 for p in Priority}
+        for waiter in self._waiters:
+            waiting[waiter.priority] += 1
+        return {
+            p: PriorityStats(
+                waiting=waiting[p],
+                dispatched=self._dispatched[p],
+                wait_avg=(
+                    self._wait_total[p] / self._dispatched[p]
+                    if self._dispatched[p] else 0.0
+                ),
+                wait_max=self._wait_max[p],
+            )
+            for p in Priority
+        }
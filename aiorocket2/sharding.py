@@ -0,0 +1,363 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Spreading calls across several API keys (xRocket apps) of the same owner.
+
+:class:`ShardedClient` exposes the same tag methods as
+:class:`~aiorocket2.client.xRocketClient`, but every call is routed to one of
+several keys, all sharing one connection pool (see :mod:`aiorocket2.tenants`).
+
+Routing rules:
+
+- New work (creating invoices, cheques, withdrawals, transfers and
+  app-independent reads) goes to the least-loaded key: fewest requests in
+  flight or queued, skipping keys that were answered ``429`` until their
+  ``Retry-After`` has passed.
+- Requests about an existing invoice, cheque or withdrawal are *sticky*: they
+  go to the key that created it. For reads of ids created by another process
+  the keys are tried in turn until one does not answer ``404``; other methods
+  (such as deletes) never guess, so such ids must be read first or registered
+  up front with :meth:`ShardedClient.assign`.
+- Reads that only make sense per app (``get_info``, ``get_invoices``,
+  ``get_multi_cheques``) must be called on :meth:`ShardedClient.shard`.
+
+Example::
+
+    keys = ["KEY_A", "KEY_B", "KEY_C"]
+    async with ShardedClient(keys, names=["a", "b", "c"]) as pool:
+        invoice = await pool.create_invoice(currency="TON", amount=1)
+        await pool.get_invoice(invoice.id)       # same key that created it
+        balance = await pool.shard("a").get_info()
+        print(pool.stats())
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from .exceptions import CircuitOpenError, DeadlineExceeded, xRocketAPIError
+from .pool import PoolConfig
+from .tags import Tags
+from .tenants import TenantClient, TenantLimits, TenantManager
+from .transport import Transport
+from .utils import ENDPOINT_TEMPLATES, endpoint_key, parse_retry_after
+
+
+__all__ = [
+    "ShardStats",
+    "ShardedClient",
+]
+
+DEFAULT_MAX_STICKY = 100_000
+"""Resource ids remembered for sticky routing before the oldest are forgotten."""
+
+DEFAULT_THROTTLE_PAUSE = 1.0
+"""Seconds a key is avoided after a ``429`` without ``Retry-After``."""
+
+_APP_SCOPED = frozenset({"GET app/info", "GET tg-invoices", "GET multi-cheque"})
+"""Endpoints whose answer depends on the app: routing them would be arbitrary."""
+
+_CREATES = {
+    "POST tg-invoices": "tg-invoices/{id}",
+    "POST multi-cheque": "multi-cheque/{id}",
+    "POST app/withdrawal": "app/withdrawal/status/{id}",
+}
+"""Endpoints creating a resource, mapped to the template of its sticky endpoint."""
+
+
+@dataclass
+class ShardStats:
+    """Load of one key of a :class:`ShardedClient`.
+
+    Attributes:
+        requests: Calls routed to the key.
+        failures: Of ``requests``, how many raised an error.
+        in_flight: Calls currently running.
+        waiting: Calls queued on the key's ``max_in_flight`` limit.
+        throttled: ``429`` answers received.
+        throttled_for: Seconds the key is still avoided after a ``429``.
+        sticky: Resource ids currently bound to the key.
+    """
+    requests: int
+    failures: int
+    in_flight: int
+    waiting: int
+    throttled: int
+    throttled_for: float
+    sticky: int
+
+
+class _Shard:
+    """One key of the pool and its routing state."""
+
+    def __init__(self, client: TenantClient) -> None:
+        self.client = client
+        self.throttled = 0
+        self.throttled_until = 0.0
+        self.sticky = 0
+
+    def load(self) -> float:
+        """Requests in flight or queued, plus how empty the key's rate limit is."""
+        tenant = self.client._tenant
+        load = float(tenant.in_flight)
+        if tenant.limit is not None:
+            load += tenant.limit.waiting
+        limiter = self.client.rate_limiter
+        if limiter is not None:
+            load += 1.0 - min(limiter.fill_levels().values(), default=1.0)
+        return load
+
+
+class ShardedClient(Tags):
+    """Tag methods routed across several API keys; see :mod:`aiorocket2.sharding`.
+
+    Args:
+        api_keys: API keys of the apps to spread calls across.
+        names: Names of the keys used in :meth:`stats` and :meth:`shard`;
+            default to ``"0"``, ``"1"``, ...
+        limits: Per-key limits (see :class:`~aiorocket2.tenants.TenantLimits`).
+        pool: Connection pool settings of the shared transport.
+        transport: Shared transport, closed by :meth:`aclose`.
+        max_sticky: Resource ids remembered for sticky routing.
+        **client_kwargs: Other :class:`~aiorocket2.client.xRocketClient`
+            arguments, applied to every key.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        *,
+        names: Optional[Sequence[str]] = None,
+        limits: Optional[TenantLimits] = None,
+        pool: Optional[PoolConfig] = None,
+        transport: Optional[Transport] = None,
+        max_sticky: int = DEFAULT_MAX_STICKY,
+        **client_kwargs: Any,
+    ) -> None:
+        if not api_keys:
+            raise ValueError("at least one API key is required")
+        if names is None:
+            names = [str(i) for i in range(len(api_keys))]
+        names = list(names)
+        if len(names) != len(api_keys) or len(set(names)) != len(names):
+            raise ValueError("names must be unique, one per API key")
+        self.manager = TenantManager(
+            pool=pool, transport=transport, default_limits=limits, **client_kwargs
+        )
+        self._shards: Dict[str, _Shard] = {
+            name: _Shard(self.manager.client(api_keys[i], name=name))
+            for i, name in enumerate(names)
+        }
+        self._sticky: "OrderedDict[Tuple[str, str], _Shard]" = OrderedDict()
+        self.max_sticky = max_sticky
+        # lookups by id are routed one by one to the key that owns the id
+        self.batching = None
+
+    async def __aenter__(self) -> "ShardedClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared transport."""
+        await self.manager.aclose()
+
+    @property
+    def shards(self) -> List[TenantClient]:
+        """Clients of every key, in the order the keys were given."""
+        return [shard.client for shard in self._shards.values()]
+
+    def shard(self, name: str) -> TenantClient:
+        """Return the client of the key called ``name``, for per-app calls."""
+        return self._shards[name].client
+
+    def assign(self, endpoint: str, name: str) -> None:
+        """Bind a resource created elsewhere to a key.
+
+        Args:
+            endpoint: Path of the resource, e.g. ``"tg-invoices/123"``.
+            name: Name of the key that owns it.
+        """
+        sticky = _sticky_key(endpoint)
+        if sticky is None:
+            raise ValueError(f"{endpoint!r} is not a per-resource endpoint")
+        self._remember(sticky, self._shards[name])
+
+    def stats(self) -> Dict[str, ShardStats]:
+        """Return the load of every key, by name."""
+        now = time.monotonic()
+        result = {}
+        for name, shard in self._shards.items():
+            tenant = shard.client._tenant.stats()
+            result[name] = ShardStats(
+                requests=tenant.requests,
+                failures=tenant.failures,
+                in_flight=tenant.in_flight,
+                waiting=tenant.waiting,
+                throttled=shard.throttled,
+                throttled_for=max(0.0, shard.throttled_until - now),
+                sticky=shard.sticky,
+            )
+        return result
+
+    def _convert(self, payload: Dict[str, Any], from_api: Callable[[Any], Any]) -> Any:
+        """Build the tag method result; every key shares the same settings."""
+        return self.shards[0]._convert(payload, from_api)
+
+    def _pick(self) -> _Shard:
+        """The least-loaded key that is not throttled (or the least throttled one)."""
+        now = time.monotonic()
+        return min(
+            self._shards.values(),
+            key=lambda s: (
+                max(0.0, s.throttled_until - now), s.load(), s.client._tenant.requests
+            ),
+        )
+
+    def _remember(self, sticky: Tuple[str, str], shard: _Shard) -> None:
+        previous = self._sticky.pop(sticky, None)
+        if previous is not None:
+            previous.sticky -= 1
+        self._sticky[sticky] = shard
+        shard.sticky += 1
+        while len(self._sticky) > self.max_sticky:
+            _, oldest = self._sticky.popitem(last=False)
+            oldest.sticky -= 1
+
+    def _forget(self, sticky: Tuple[str, str]) -> None:
+        shard = self._sticky.pop(sticky, None)
+        if shard is not None:
+            shard.sticky -= 1
+
+    async def _send(
+        self, shard: _Shard, method: str, endpoint: str, kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send through one key, noting ``429`` answers for routing."""
+        try:
+            return await shard.client._request(method, endpoint, **kwargs)
+        except xRocketAPIError as e:
+            if e.status == 429:
+                shard.throttled += 1
+                pause = parse_retry_after(e.headers) or DEFAULT_THROTTLE_PAUSE
+                shard.throttled_until = max(
+                    shard.throttled_until, time.monotonic() + pause
+                )
+            raise
+
+    async def _request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Route a request to a key; see :mod:`aiorocket2.sharding`."""
+        key = endpoint_key(method, endpoint)
+        if key in _APP_SCOPED:
+            raise ValueError(
+                f"{key} differs between apps: call it on ShardedClient.shard(name)"
+            )
+        sticky = _sticky_key(endpoint)
+        if sticky is not None:
+            shard = self._sticky.get(sticky)
+            if shard is None:
+                if method.upper() != "GET":
+                    # guessing could act on the resource through the wrong app
+                    raise ValueError(
+                        f"{key}: no key is known to own {endpoint.strip('/')!r}; "
+                        "read it first or call ShardedClient.assign()"
+                    )
+                return await self._probe(sticky, method, endpoint, kwargs)
+            self._sticky.move_to_end(sticky)
+            payload = await self._send(shard, method, endpoint, kwargs)
+            if method.upper() == "DELETE":
+                self._forget(sticky)
+            return payload
+
+        shard = self._pick()
+        payload = await self._send(shard, method, endpoint, kwargs)
+        template = _CREATES.get(key)
+        if template is not None:
+            resource_id = self._created_id(shard, key, payload, kwargs)
+            if resource_id is not None:
+                self._remember((template, str(resource_id)), shard)
+        return payload
+
+    async def _probe(
+        self,
+        sticky: Tuple[str, str],
+        method: str,
+        endpoint: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Find the key that owns an unknown resource by reading it with each."""
+        now = time.monotonic()
+        candidates = sorted(
+            self._shards.values(), key=lambda s: (s.throttled_until > now, s.load())
+        )
+        errors: List[xRocketAPIError] = []
+        for shard in candidates:
+            try:
+                payload = await self._send(shard, method, endpoint, kwargs)
+            except (CircuitOpenError, DeadlineExceeded):
+                raise
+            except xRocketAPIError as e:
+                # 429, 5xx and network errors leave the key's ownership open
+                if e.status is not None and e.status not in (404, 429) \
+                        and e.status < 500:
+                    raise
+                errors.append(e)
+                continue
+            self._remember(sticky, shard)
+            return payload
+        # a key that failed may be the owner: its error says more than a 404
+        raise next((e for e in errors if e.status != 404), errors[-1])
+
+    @staticmethod
+    def _created_id(
+        shard: _Shard, key: str, payload: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Id of the resource a create request made."""
+        if key == "POST app/withdrawal":
+            return (kwargs.get("json") or {}).get("withdrawalId")
+        data = payload.get("data")
+        if isinstance(data, (bytes, bytearray)):  # RawMode.BYTES
+            data = shard.client.json_codec.loads(bytes(data))
+        return data.get("id") if isinstance(data, dict) else None
+
+
+def _sticky_key(endpoint: str) -> Optional[Tuple[str, str]]:
+    """``(template, id)`` of a per-resource endpoint, ``None`` for others."""
+    path = endpoint.strip("/")
+    parts = path.split("/")
+    for template in ENDPOINT_TEMPLATES:
+        tparts = template.split("/")
+        if len(tparts) == len(parts) and all(
+            t == parts[i] or t == "{id}" for i, t in enumerate(tparts)
+        ):
+            return template, parts[-1]
+    return None
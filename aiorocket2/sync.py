@@ -0,0 +1,181 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Synchronous facade over :class:`~aiorocket2.client.xRocketClient`.
+
+:class:`SyncClient` runs one long-lived event loop in a background thread and
+owns one pooled client on it, so synchronous code (Django views, Celery
+tasks, scripts) keeps connections alive between calls instead of paying for a
+new loop and session on every ``asyncio.run``. It can be shared by any
+number of threads: calls are handed to the loop thread and the caller blocks
+until the result is ready.
+
+Every coroutine method of the client is available as a blocking method with
+the same arguments. Context managers that work through context variables —
+:meth:`~aiorocket2.client.xRocketClient.deadline`,
+:meth:`~aiorocket2.client.xRocketClient.raw`,
+:meth:`~aiorocket2.client.xRocketClient.call_info`,
+:meth:`~aiorocket2.client.xRocketClient.priority` — apply to the calls made
+inside them in the calling thread.
+
+Example::
+
+    client = SyncClient(api_key="KEY")          # e.g. once per process
+    invoice = client.create_invoice(currency="TON", amount=1)
+    with client.deadline(2.0):
+        client.get_invoice(invoice.id)
+    client.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from types import TracebackType
+from typing import Any, Callable, Coroutine, Optional, Type
+
+from .client import xRocketClient
+from .runtime import new_event_loop
+
+
+__all__ = [
+    "SyncClient",
+]
+
+
+class SyncClient:
+    """Thread-safe blocking client backed by a background event loop.
+
+    Args:
+        api_key: API key for the client to create.
+        client: An existing client to drive instead; ``api_key`` and
+            ``client_kwargs`` are then ignored. It is closed by :meth:`close`.
+        loop_factory: Callable returning the event loop to run
+            (default: :func:`asyncio.new_event_loop`).
+        fast_loop: Run on :func:`aiorocket2.runtime.new_event_loop` (uvloop
+            and eager tasks where available). Ignored with ``loop_factory``.
+        **client_kwargs: Other :class:`~aiorocket2.client.xRocketClient`
+            arguments.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        client: Optional[xRocketClient] = None,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
+        fast_loop: bool = False,
+        **client_kwargs: Any,
+    ) -> None:
+        if client is None:
+            if api_key is None:
+                raise ValueError("api_key or client is required")
+            client = xRocketClient(api_key, **client_kwargs)
+        self.client = client
+        if loop_factory is None:
+            loop_factory = new_event_loop if fast_loop else asyncio.new_event_loop
+        self.loop = loop_factory()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="aiorocket2-sync", daemon=True
+        )
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run ``coro`` on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run, typically a call on :attr:`client`.
+
+        Returns:
+            Any: Its result; exceptions are re-raised in the calling thread.
+
+        Raises:
+            RuntimeError: If the client is closed, or if called from the
+                loop thread itself (which would deadlock).
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SyncClient is closed")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "SyncClient cannot be called from its own event loop; "
+                "await the client instead"
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()  # e.g. KeyboardInterrupt while waiting
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        # read through __dict__: before __init__ has set ``client`` (a failed
+        # __init__, unpickling) self.client would land back here forever
+        client = self.__dict__.get("client")
+        if client is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        attr = getattr(client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self.run(attr(*args, **kwargs))
+
+        self.__dict__[name] = call  # cached: __getattr__ is not consulted again
+        return call
+
+    def close(self) -> None:
+        """Close the client, stop the loop and join its thread. Idempotent."""
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                self.run(self.client.aclose())
+            finally:
+                self._closed = True
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self._thread.join()
@@ -36,6 +36,10 @@ Available tags
 - ``WithdrawalLink`` — on-chain withdrawal link helper
 - ``Currencies`` — currency listing helper
 - ``Health`` — lightweight health check
+
+Methods that return models build them from the response's ``data`` field
+through ``_convert``; in raw mode (see :meth:`aiorocket2.client.xRocketClient.raw`)
+they return that field as a dict or as JSON bytes instead.
 """
 
 from .version import Version
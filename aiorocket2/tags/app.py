@@ -34,7 +34,7 @@ Examples
 
 from typing import Any, Dict, List, Optional
 
-from ..enums import Network, WithdrawalStatus
+from ..enums import Idempotency, Network, WithdrawalStatus
 from ..models import Info, Transfer, Withdrawal, WithdrawalCoin
 
 
@@ -51,8 +51,8 @@ class App:
         Raises:
             xRocketAPIError: On API or network errors.
         """
-        r = await self._request("GET", "app/info")
-        return Info.from_api(r['data'])
+        r = await self._request("GET", "app/info", raw=True)
+        return self._convert(r, Info.from_api)
 
     async def send_transfer(
         self,
@@ -85,8 +85,12 @@ class App:
             "description": description
         }
 
-        r = await self._request("POST", "app/transfer", json=payload)
-        return Transfer.from_api(r['data'])
+        # transfer_id deduplicates repeated transfers, so retries are safe
+        r = await self._request(
+            "POST", "app/transfer", json=payload,
+            idempotency=Idempotency.BY_KEY, raw=True,
+        )
+        return self._convert(r, Transfer.from_api)
 
 
     async def create_withdrawal(
@@ -123,8 +127,12 @@ class App:
             "comment": comment
         }
 
-        r = await self._request("POST", "app/withdrawal", json=payload)
-        return Withdrawal.from_api(r['data'])
+        # withdrawal_id deduplicates repeated withdrawals, so retries are safe
+        r = await self._request(
+            "POST", "app/withdrawal", json=payload,
+            idempotency=Idempotency.BY_KEY, raw=True,
+        )
+        return self._convert(r, Withdrawal.from_api)
 
     async def get_withdrawal(
         self, withdrawal_id: str
@@ -141,16 +149,18 @@ class App:
             xRocketAPIError: If the withdrawal is not found or API returns error.
         """
         
-        r = await self._request("GET", f"app/withdrawal/status/{withdrawal_id}")
-        return Withdrawal.from_api(r['data'])
+        r = await self._request(
+            "GET", f"app/withdrawal/status/{withdrawal_id}", raw=True
+        )
+        return self._convert(r, Withdrawal.from_api)
     
     async def get_withdrawal_status(
         self, withdrawal_id: str
     ) -> WithdrawalStatus:
         """Return status for a withdrawal.
 
-        This is a thin helper around :meth:`get_withdrawal` that returns the
-        parsed :class:`WithdrawalStatus` enum.
+        Same request as :meth:`get_withdrawal`, but returns only the parsed
+        :class:`WithdrawalStatus` enum, in raw mode too.
 
         Args:
             withdrawal_id (str): Unique withdrawal id.
@@ -162,7 +172,8 @@ class App:
             xRocketAPIError: If the API call fails.
         """
 
-        return (await self.get_withdrawal(withdrawal_id=withdrawal_id)).status
+        r = await self._request("GET", f"app/withdrawal/status/{withdrawal_id}")
+        return Withdrawal.from_api(r['data']).status
 
     async def get_withdrawal_fees(
         self, currency: Optional[str] = None
@@ -178,5 +189,10 @@ class App:
         Raises:
             xRocketAPIError: If the API returns an error.
         """
-        r = await self._request('GET', 'app/withdrawal/fees', params={'currency': currency} if currency else None)
-        return [WithdrawalCoin.from_api(data) for data in r['data']]
+        r = await self._request(
+            'GET', 'app/withdrawal/fees',
+            params={'currency': currency} if currency else None, raw=True,
+        )
+        return self._convert(
+            r, lambda coins: [WithdrawalCoin.from_api(data) for data in coins]
+        )
@@ -48,5 +48,9 @@ class Currencies:
         Raises:
             xRocketAPIError: If the request fails.
         """
-        r = await self._request("GET", "currencies/available", require_auth_header=False)
-        return [Currency.from_api(c) for c in r["data"].get("results", [])]
+        r = await self._request(
+            "GET", "currencies/available", require_auth_header=False, raw=True
+        )
+        return self._convert(
+            r, lambda data: [Currency.from_api(c) for c in data.get("results", [])]
+        )
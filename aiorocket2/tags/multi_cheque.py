@@ -24,7 +24,7 @@ from typing import List, Optional, Union
 
 from ..exceptions import xRocketAPIError
 
-from ..enums import Country
+from ..enums import Country, Idempotency, RawMode
 from ..models import Cheque, PaginatedCheque
 
 
@@ -93,8 +93,12 @@ class MultiCheque:
             "disabledLanguages": disabled_languages,
             "enabledCountries": [country.value for country in (enabled_countries or [])]
         }
-        r = await self._request("POST", "multi-cheque", json=payload)
-        return Cheque.from_api(r['data'])
+        # no idempotency key: a retried create could make a duplicate cheque
+        r = await self._request(
+            "POST", "multi-cheque", json=payload,
+            idempotency=Idempotency.UNSAFE, raw=True,
+        )
+        return self._convert(r, Cheque.from_api)
 
     async def get_multi_cheques(
         self,
@@ -113,8 +117,10 @@ class MultiCheque:
         Raises:
             xRocketAPIError: If the API returns an error.
         """
-        r = await self._request('GET', 'multi-cheque', params={"limit": limit, "offset": offset})
-        return PaginatedCheque.from_api(r['data'])
+        r = await self._request(
+            'GET', 'multi-cheque', params={"limit": limit, "offset": offset}, raw=True
+        )
+        return self._convert(r, PaginatedCheque.from_api)
 
     async def get_multi_cheque(
         self,
@@ -131,8 +137,14 @@ class MultiCheque:
         Raises:
             xRocketAPIError: If the cheque is not found or API reports an error.
         """
-        r = await self._request("GET", f"multi-cheque/{cheque_id}")
-        return Cheque.from_api(r["data"])
+        if self.batching is not None and self._raw_mode() is not RawMode.BYTES:
+            # answered from the response cache, if any, before joining a batch
+            r = self._cached_get(f"multi-cheque/{cheque_id}") or {
+                "data": await self.batching.load(self, "multi-cheque", cheque_id)
+            }
+        else:
+            r = await self._request("GET", f"multi-cheque/{cheque_id}", raw=True)
+        return self._convert(r, Cheque.from_api)
 
     async def edit_multi_cheque(
         self,
@@ -179,8 +191,10 @@ class MultiCheque:
             "enabledCountries": [country.value for country in (enabled_countries or [])]
         }
 
-        r = await self._request("PUT", f"multi-cheque/{cheque_id}", json=payload)
-        return Cheque.from_api(r["data"])
+        r = await self._request(
+            "PUT", f"multi-cheque/{cheque_id}", json=payload, raw=True
+        )
+        return self._convert(r, Cheque.from_api)
 
     async def delete_multi_cheque(self, cheque_id: str) -> True:
         """
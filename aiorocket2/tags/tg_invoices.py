@@ -23,6 +23,7 @@
 Tag tg-invoices from the API
 """
 
+from ..enums import Idempotency, RawMode
 from ..models import Invoice, PaginatedInvoice
 
 
@@ -104,8 +105,12 @@ class TgInvoices:
             "expiredIn": expired_in, 
             "platformId": platform_id, 
         }
-        r = await self._request("POST", "tg-invoices", json=api_payload)
-        return Invoice.from_api(r["data"])
+        # no idempotency key: a retried create could make a duplicate invoice
+        r = await self._request(
+            "POST", "tg-invoices", json=api_payload,
+            idempotency=Idempotency.UNSAFE, raw=True,
+        )
+        return self._convert(r, Invoice.from_api)
 
     async def get_invoices(
         self,
@@ -124,8 +129,10 @@ class TgInvoices:
         Raises:
             xRocketAPIError: If the API returns an error.
         """
-        r = await self._request('GET', 'tg-invoices', params={"limit": limit, "offset": offset})
-        return PaginatedInvoice.from_api(r['data'])
+        r = await self._request(
+            'GET', 'tg-invoices', params={"limit": limit, "offset": offset}, raw=True
+        )
+        return self._convert(r, PaginatedInvoice.from_api)
 
     async def get_invoice(
         self,
@@ -142,8 +149,14 @@ class TgInvoices:
         Raises:
             xRocketAPIError: If invoice is not found or API error occurs.
         """
-        r = await self._request("GET", f"tg-invoices/{invoice_id}")
-        return Invoice.from_api(r["data"])
+        if self.batching is not None and self._raw_mode() is not RawMode.BYTES:
+            # answered from the response cache, if any, before joining a batch
+            r = self._cached_get(f"tg-invoices/{invoice_id}") or {
+                "data": await self.batching.load(self, "tg-invoices", invoice_id)
+            }
+        else:
+            r = await self._request("GET", f"tg-invoices/{invoice_id}", raw=True)
+        return self._convert(r, Invoice.from_api)
 
     async def delete_invoice(
         self,
@@ -0,0 +1,351 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Multi-tenant mode: many API keys over one shared connection pool.
+
+Platforms that act for many merchants hold one API key per merchant. A
+:class:`TenantManager` owns a single transport (and so a single connection
+pool) and hands out a lightweight :class:`TenantClient` view per key. Views
+share the pool and the components configured on the manager (codec, breaker,
+bulkheads, scheduler, response cache, ...). Each view has its own
+``Rocket-Pay-Key`` header, tenant limits and metrics, and its own copy of the
+state one busy tenant could otherwise use up for the rest: admission limits,
+retry budget and the latency windows behind adaptive timeouts. A tenant
+``rate`` applies on top of the manager's ``rate_limiter``. No sockets are
+opened for a view.
+
+Example::
+
+    manager = TenantManager(
+        pool=PoolConfig(limit=200),
+        default_limits=TenantLimits(max_in_flight=10, rate=20),
+    )
+    async with manager:
+        client = manager.client(merchant.api_key, name=merchant.id)
+        await client.create_invoice(currency="TON", amount=1)
+        print(manager.stats()[merchant.id])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+from .admission import AdmissionControl
+from .bulkhead import ConcurrencyLimit
+from .client import xRocketClient
+from .deadline import remaining_time
+from .exceptions import DeadlineExceeded, xRocketAPIError
+from .metrics import LatencyRecorder, LatencyWindow
+from .pool import PoolConfig
+from .ratelimit import BaseRateLimiter, RateLimiter
+from .retry import RetryPolicy
+from .transport import AiohttpTransport, Transport
+from .utils import endpoint_key
+
+
+__all__ = [
+    "TenantLimits",
+    "TenantStats",
+    "TenantClient",
+    "TenantManager",
+]
+
+
+@dataclass
+class TenantLimits:
+    """Limits applied to each tenant separately.
+
+    Attributes:
+        max_in_flight: Concurrent requests per tenant; further calls queue in
+            FIFO order (``None`` — unlimited).
+        rate: Requests per second per tenant (``None`` — unlimited).
+        burst: Bucket size for ``rate`` (``None`` — same as ``rate``).
+    """
+    max_in_flight: Optional[int] = None
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+
+
+@dataclass
+class TenantStats:
+    """Counters of one tenant.
+
+    Attributes:
+        requests: Calls made through the tenant's view.
+        failures: Of ``requests``, how many raised an error.
+        in_flight: Calls currently running.
+        waiting: Calls queued on ``max_in_flight``.
+        wait_avg: Mean time (seconds) a call waited for a tenant slot.
+        latency_p50: Median call time (seconds), ``None`` before the first call.
+        latency_p99: 99th percentile call time (seconds).
+    """
+    requests: int
+    failures: int
+    in_flight: int
+    waiting: int
+    wait_avg: float
+    latency_p50: Optional[float]
+    latency_p99: Optional[float]
+
+
+class _Tenant:
+    """Per-tenant limits and metrics."""
+
+    def __init__(self, limits: TenantLimits) -> None:
+        self.limit = (
+            ConcurrencyLimit(limits.max_in_flight) if limits.max_in_flight else None
+        )
+        self.rate_limiter = (
+            RateLimiter(limits.rate, limits.burst) if limits.rate else None
+        )
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.latency = LatencyWindow()
+
+    def stats(self) -> TenantStats:
+        limit = self.limit
+        return TenantStats(
+            requests=self.requests,
+            failures=self.failures,
+            in_flight=self.in_flight,
+            waiting=limit.waiting if limit is not None else 0,
+            wait_avg=(
+                limit.wait_total / limit.acquired
+                if limit is not None and limit.acquired else 0.0
+            ),
+            latency_p50=self.latency.percentile(0.5),
+            latency_p99=self.latency.percentile(0.99),
+        )
+
+
+class _ChainedRateLimiter(BaseRateLimiter):
+    """A tenant's limiter in front of the limiter shared by all tenants."""
+
+    def __init__(self, tenant: BaseRateLimiter, shared: BaseRateLimiter) -> None:
+        self.tenant = tenant
+        self.shared = shared
+
+    async def acquire(self, key: str) -> None:
+        await self.tenant.acquire(key)
+        await self.shared.acquire(key)
+
+    def throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        self.tenant.throttle(key, retry_after)
+        self.shared.throttle(key, retry_after)
+
+    def record_success(self, key: str) -> None:
+        self.tenant.record_success(key)
+        self.shared.record_success(key)
+
+    def fill_levels(self) -> Dict[str, float]:
+        levels = self.shared.fill_levels()
+        for key, level in self.tenant.fill_levels().items():
+            levels[key] = min(level, levels.get(key, level))
+        return levels
+
+
+def _own_retry_policy(policy: RetryPolicy) -> RetryPolicy:
+    """Copy of ``policy`` with a full retry budget and no stats."""
+    own = copy.copy(policy)
+    own.tokens = policy.budget_reserve
+    own._stats = {}
+    return own
+
+
+def _own_admission(admission: AdmissionControl) -> AdmissionControl:
+    """Copy of ``admission`` with the configured limits and nothing admitted."""
+    gates = admission.gates
+    return AdmissionControl(
+        {key: (gate.max_limit, gate.max_queue) for key, gate in gates.items()},
+        default=admission.default,
+        adaptive=admission.adaptive,
+        target_latency=admission.target_latency,
+        tolerance=admission.tolerance,
+        min_limit=admission.min_limit,
+        decrease_factor=admission.decrease_factor,
+    )
+
+
+class TenantClient(xRocketClient):
+    """Client view for one tenant's API key; created by :meth:`TenantManager.client`.
+
+    It behaves like :class:`~aiorocket2.client.xRocketClient`, except that
+    :meth:`aclose` leaves the shared transport open.
+    """
+
+    def __init__(
+        self, template: xRocketClient, api_key: str, name: str, tenant: _Tenant
+    ) -> None:
+        # share the template's components, except the credentials and the state
+        # one tenant could use up for all others
+        self.__dict__.update(template.__dict__)
+        self.api_key = api_key
+        self.name = name
+        self._auth_headers = {**template._auth_headers, "Rocket-Pay-Key": api_key}
+        self._auth_json_headers = {
+            **template._auth_json_headers, "Rocket-Pay-Key": api_key
+        }
+        self._heartbeat = None
+        self._tenant = tenant
+        self.latency = LatencyRecorder(template.latency.size)
+        self.retry_policy = _own_retry_policy(template.retry_policy)
+        if template.admission is not None:
+            self.admission = _own_admission(template.admission)
+        if tenant.rate_limiter is not None:
+            shared = template.rate_limiter
+            self.rate_limiter = tenant.rate_limiter if shared is None \
+                else _ChainedRateLimiter(tenant.rate_limiter, shared)
+
+    async def aclose(self) -> None:
+        """Stop the view's heartbeat; the transport belongs to the manager."""
+        await self.stop_heartbeat()
+
+    async def _request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Apply the tenant's concurrency limit and record its metrics."""
+        tenant = self._tenant
+        limit = tenant.limit
+        tenant.requests += 1
+        if limit is not None:
+            await self._acquire(limit, method, endpoint)
+        tenant.in_flight += 1
+        started = time.monotonic()
+        try:
+            return await super()._request(method, endpoint, **kwargs)
+        except xRocketAPIError:
+            tenant.failures += 1
+            raise
+        finally:
+            tenant.latency.add(time.monotonic() - started)
+            tenant.in_flight -= 1
+            if limit is not None:
+                limit.release()
+
+    async def _acquire(
+        self, limit: ConcurrencyLimit, method: str, endpoint: str
+    ) -> None:
+        """Wait for a slot of the tenant's limit, within the current deadline."""
+        remaining = remaining_time()
+        if remaining is None:
+            await limit.acquire()
+            return
+        try:
+            await asyncio.wait_for(limit.acquire(), max(0.0, remaining))
+        except asyncio.TimeoutError:
+            self._tenant.failures += 1
+            raise DeadlineExceeded(
+                f"Deadline exceeded while waiting for {endpoint_key(method, endpoint)}"
+            ) from None
+
+
+class TenantManager:
+    """Shared transport and per-key client views for many tenants.
+
+    Args:
+        pool: Connection pool settings for the shared transport.
+            Ignored when ``transport`` is passed.
+        transport: Shared transport; defaults to an
+            :class:`~aiorocket2.transport.AiohttpTransport` built from ``pool``.
+            It is closed by :meth:`aclose`.
+        default_limits: Limits of tenants that are not given their own.
+        **client_kwargs: Any other :class:`~aiorocket2.client.xRocketClient`
+            argument (``testnet``, ``timeout``, ``json_codec``,
+            ``circuit_breaker``, ...). Components passed here are shared by
+            all tenants, except the state of ``admission`` and
+            ``retry_policy``: each tenant starts from a fresh copy. A
+            ``rate_limiter`` caps all tenants together, after each tenant's
+            own ``rate``.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: Optional[PoolConfig] = None,
+        transport: Optional[Transport] = None,
+        default_limits: Optional[TenantLimits] = None,
+        **client_kwargs: Any,
+    ) -> None:
+        self.transport = transport or AiohttpTransport(pool=pool)
+        self.default_limits = default_limits or TenantLimits()
+        self._template = xRocketClient(
+            api_key="", transport=self.transport, **client_kwargs
+        )
+        self._views: Dict[str, TenantClient] = {}
+
+    async def __aenter__(self) -> "TenantManager":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    def client(self, api_key: str, *, name: Optional[str] = None,
+               limits: Optional[TenantLimits] = None) -> TenantClient:
+        """Return the view for ``api_key``, creating it on first use.
+
+        Args:
+            api_key: The tenant's xRocket Pay API key.
+            name: Identifier used in :meth:`stats`. Defaults to a masked form
+                of the key; pass your own tenant id to keep keys out of metrics.
+            limits: Limits of this tenant; defaults to ``default_limits``.
+                Only used when the view is created.
+
+        Returns:
+            TenantClient: A client bound to ``api_key``.
+        """
+        view = self._views.get(api_key)
+        if view is None:
+            if name is None:
+                name = f"{api_key[:4]}…{api_key[-4:]}" if len(api_key) > 8 else "…"
+            tenant = _Tenant(limits or self.default_limits)
+            view = TenantClient(self._template, api_key, name, tenant)
+            self._views[api_key] = view
+        return view
+
+    async def remove(self, api_key: str) -> None:
+        """Stop the view of ``api_key`` and forget it and its metrics."""
+        view = self._views.pop(api_key, None)
+        if view is not None:
+            await view.aclose()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def stats(self) -> Dict[str, TenantStats]:
+        """Return per-tenant counters keyed by tenant name."""
+        return {view.name: view._tenant.stats() for view in self._views.values()}
+
+    async def aclose(self) -> None:
+        """Stop the views' heartbeats and close the shared transport."""
+        for view in self._views.values():
+            await view.aclose()
+        await self._template.aclose()
@@ -0,0 +1,145 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Adaptive per-endpoint timeouts.
+
+By default every request shares the client's single ``timeout``. With an
+:class:`AdaptiveTimeout` the client instead derives a timeout for each
+endpoint from its observed latency: ``percentile × multiplier``, clamped to
+``[min_timeout, max_timeout]``. Connecting (including waiting for a pooled
+connection) and reading the response are bounded separately, so a stuck
+``get_invoice`` is abandoned quickly while a large ``get_invoices`` page that
+is still streaming is not.
+
+Example::
+
+    timeouts = AdaptiveTimeout(multiplier=3, min_timeout=0.5, max_timeout=30)
+    async with xRocketClient(api_key="KEY", adaptive_timeout=timeouts) as client:
+        ...
+        print(timeouts.stats())
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import aiohttp
+
+from .constants import DEFAULT_TIMEOUT
+from .metrics import LatencyRecorder
+
+
+__all__ = [
+    "AdaptiveTimeout",
+    "TimeoutStats",
+]
+
+
+@dataclass
+class TimeoutStats:
+    """Timeout counters of one endpoint.
+
+    Attributes:
+        requests: Attempts made with an adaptive timeout.
+        timeouts: Attempts that hit the timeout.
+        timeout_rate: ``timeouts / requests``.
+        read_timeout: Read timeout currently in effect (seconds).
+    """
+    requests: int
+    timeouts: int
+    timeout_rate: float
+    read_timeout: float
+
+
+class AdaptiveTimeout:
+    """Computes per-endpoint timeouts from a rolling latency distribution.
+
+    Args:
+        percentile: Latency quantile the timeout is based on.
+        multiplier: Factor applied to the quantile.
+        min_timeout: Lower bound for the read timeout (seconds).
+        max_timeout: Upper bound for the read timeout and the whole attempt (seconds).
+        connect_timeout: Limit for obtaining a connection, including pool
+            queueing, DNS and TCP/TLS setup (seconds).
+        min_samples: Samples needed before an endpoint's own distribution is
+            used; until then ``max_timeout`` applies.
+        overrides: Fixed read timeouts for specific endpoint keys.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.99,
+        multiplier: float = 3.0,
+        min_timeout: float = 1.0,
+        max_timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = 5.0,
+        min_samples: int = 20,
+        overrides: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.connect_timeout = connect_timeout
+        self.min_samples = min_samples
+        self.overrides = dict(overrides or {})
+        self._requests: Dict[str, int] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._current: Dict[str, float] = {}
+
+    def read_timeout(self, key: str, latency: LatencyRecorder) -> float:
+        """Return the read timeout for endpoint ``key`` in seconds."""
+        if key in self.overrides:
+            return self.overrides[key]
+        if latency.count(key) < self.min_samples:
+            return self.max_timeout
+        observed = latency.percentile(key, self.percentile) or 0.0
+        return min(self.max_timeout, max(self.min_timeout, observed * self.multiplier))
+
+    def timeout_for(self, key: str, latency: LatencyRecorder) -> aiohttp.ClientTimeout:
+        """Return the :class:`aiohttp.ClientTimeout` for the next attempt to ``key``."""
+        read = self._current[key] = self.read_timeout(key, latency)
+        return aiohttp.ClientTimeout(
+            total=self.max_timeout + self.connect_timeout,
+            connect=self.connect_timeout,
+            sock_read=read,
+        )
+
+    def record(self, key: str, timed_out: bool) -> None:
+        """Count one attempt to ``key`` and whether it timed out."""
+        self._requests[key] = self._requests.get(key, 0) + 1
+        if timed_out:
+            self._timeouts[key] = self._timeouts.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, TimeoutStats]:
+        """Return timeout counters per endpoint key."""
+        result = {}
+        for key, requests in self._requests.items():
+            timeouts = self._timeouts.get(key, 0)
+            result[key] = TimeoutStats(
+                requests=requests,
+                timeouts=timeouts,
+                timeout_rate=timeouts / requests,
+                read_timeout=self._current.get(key, self.max_timeout),
+            )
+        return result
@@ -0,0 +1,451 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Pluggable HTTP transports.
+
+:class:`aiorocket2.client.xRocketClient` builds every request (URL, headers,
+encoded body, timeout) itself and hands the actual exchange to a
+:class:`Transport`. A transport sends the bytes and returns the status code,
+headers and body as received on the wire; decompression, parsing, retries
+and error handling stay in the client.
+
+Available transports:
+
+- :class:`AiohttpTransport` — the default, an ``aiohttp`` session with a
+  configurable connection pool (see :mod:`aiorocket2.pool`).
+- :class:`HttpxTransport` — an ``httpx`` client that can speak HTTP/2 and
+  multiplex many concurrent requests over one connection
+  (``pip install "aiorocket2[http2]"``).
+- :class:`InMemoryTransport` — calls a Python handler instead of the network;
+  useful for tests and for benchmarking the client without sockets.
+
+Network failures must surface as :class:`aiohttp.ClientError` subclasses (for
+example :class:`TransportError`) and timeouts as :class:`asyncio.TimeoutError`,
+so that retries, circuit breaking and adaptive timeouts work the same for
+every transport.
+
+Example::
+
+    transport = HttpxTransport(http2=True, max_connections=4)
+    async with xRocketClient(api_key="KEY", transport=transport) as client:
+        await client.get_info()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import (
+    Any, Awaitable, Callable, Mapping, Optional, Set, Tuple, Union, cast
+)
+
+import aiohttp
+
+from .constants import DEFAULT_KEEPALIVE_TIMEOUT, DEFAULT_POOL_LIMIT, DEFAULT_TIMEOUT
+from .pool import PoolConfig, PoolStats, _PoolTracer, _connector_stats
+
+
+__all__ = [
+    "TransportResponse",
+    "TransportError",
+    "TransportConnectError",
+    "Transport",
+    "AiohttpTransport",
+    "HttpxTransport",
+    "InMemoryTransport",
+]
+
+
+@dataclass
+class TransportResponse:
+    """Raw result of one HTTP exchange.
+
+    Attributes:
+        status: HTTP status code.
+        headers: Response headers (case-insensitive mapping where the
+            transport provides one).
+        body: Response body as received, still compressed if the response
+            has a ``Content-Encoding`` (unless the transport ``decompresses``).
+        ttfb: Seconds from sending the request to receiving the response
+            headers, connection acquire included (``0`` — not measured).
+        acquire: Seconds spent getting a connection (``0`` — not measured).
+    """
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    ttfb: float = 0.0
+    acquire: float = 0.0
+
+
+class TransportError(aiohttp.ClientError):
+    """Network failure reported by a transport that is not based on ``aiohttp``."""
+
+
+class TransportConnectError(TransportError):
+    """The connection could not be established: the request was never sent."""
+
+
+class Transport:
+    """Base class of the objects that perform HTTP exchanges for the client.
+
+    Subclasses implement :meth:`request` and, if they hold resources,
+    :meth:`aclose`. Transports that manage an ``aiohttp``-style pool may also
+    expose it through :attr:`pool` and :meth:`pool_stats`.
+    """
+
+    pool: Optional[PoolConfig] = None
+    """Pool settings used for warm-up and heartbeats, if the transport has any."""
+
+    decompresses: bool = False
+    """Whether returned bodies are already decoded; the client then neither
+    decompresses them nor can tell their size on the wire."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> TransportResponse:
+        """Send one request and read the whole response.
+
+        Args:
+            method: HTTP verb.
+            url: Absolute URL without the query string.
+            params: Query string parameters.
+            data: Encoded request body, if any.
+            headers: Request headers.
+            timeout: Time limits of this attempt. ``total`` bounds the whole
+                exchange; ``connect`` and ``sock_read`` are honoured where the
+                underlying client supports them.
+
+        Returns:
+            TransportResponse: Status, headers and body.
+
+        Raises:
+            aiohttp.ClientError: On network failures.
+            asyncio.TimeoutError: When ``timeout`` is exceeded.
+        """
+        raise NotImplementedError
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        """Return a snapshot of the connection pool, if the transport tracks one."""
+        return None
+
+    async def aclose(self) -> None:
+        """Release the resources held by the transport."""
+
+
+class AiohttpTransport(Transport):
+    """Transport backed by an :class:`aiohttp.ClientSession`.
+
+    Args:
+        session: Session to reuse. It is not closed by :meth:`aclose`. Create
+            it with ``auto_decompress=False`` to get compressed byte
+            accounting (see :mod:`aiorocket2.compression`). When omitted the
+            transport creates its own session lazily, on the first request,
+            from ``pool``.
+        pool: Connection pool settings for the transport-owned session.
+            Ignored when ``session`` is passed.
+        retire_grace: Seconds a recycled session stays open so that its
+            in-flight requests can finish (see ``PoolConfig.recycle_after``).
+    """
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        *,
+        pool: Optional[PoolConfig] = None,
+        retire_grace: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._own_session = session is None
+        self._session = session
+        self._session_created = time.monotonic()
+        self._retired_sessions: Set[asyncio.Task] = set()
+        self.pool = (pool or PoolConfig()) if session is None else None
+        self.decompresses = session is not None and getattr(
+            session, "auto_decompress", True
+        )
+        self.retire_grace = retire_grace
+        self._tracer = _PoolTracer()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The aiohttp session used for requests, created on first access."""
+        return self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the current session, creating or recycling it when needed."""
+        session = self._session
+        if not self._own_session:
+            return session
+        if session is not None and not session.closed:
+            recycle_after = self.pool.recycle_after
+            age = time.monotonic() - self._session_created
+            if not recycle_after or age < recycle_after:
+                return session
+            self._retire_session(session)
+        self._session = aiohttp.ClientSession(
+            connector=self.pool.build_connector(),
+            trace_configs=[self._tracer.trace_config()],
+            auto_decompress=False,
+        )
+        self._session_created = time.monotonic()
+        return self._session
+
+    def _retire_session(self, session: aiohttp.ClientSession) -> None:
+        """Close a recycled session once its in-flight requests had time to finish."""
+        async def close_later() -> None:
+            try:
+                await asyncio.sleep(self.retire_grace)
+            finally:
+                await session.close()
+
+        task = asyncio.ensure_future(close_later())
+        self._retired_sessions.add(task)
+        task.add_done_callback(self._retired_sessions.discard)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> TransportResponse:
+        # filled with the connection acquire time by the pool tracer
+        timing = SimpleNamespace(acquire=0.0)
+        started = time.perf_counter()
+        async with self._get_session().request(
+            method,
+            url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            trace_request_ctx=timing,
+        ) as resp:
+            ttfb = time.perf_counter() - started
+            body = await resp.read()
+            acquire = timing.acquire
+            return TransportResponse(resp.status, resp.headers, body, ttfb, acquire)
+
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of the connection pool.
+
+        Acquire timings are only collected for sessions created by the
+        transport; for a session passed in by the caller they stay at zero.
+        """
+        connector = self._session.connector if self._session is not None else None
+        age = time.monotonic() - self._session_created
+        return _connector_stats(connector, self._tracer, age)
+
+    async def aclose(self) -> None:
+        """Close the session if it was created by this transport."""
+        for task in list(self._retired_sessions):
+            task.cancel()
+        if self._retired_sessions:
+            await asyncio.gather(*self._retired_sessions, return_exceptions=True)
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class HttpxTransport(Transport):
+    """Transport backed by an ``httpx.AsyncClient``, with optional HTTP/2.
+
+    Over HTTP/2 concurrent requests to the same host share a single
+    connection instead of each holding a pooled socket, which keeps the
+    number of TLS handshakes and open sockets low under heavy fan-out.
+    Requires ``httpx`` (and ``h2`` for HTTP/2): ``pip install "aiorocket2[http2]"``.
+
+    Args:
+        http2: Negotiate HTTP/2 where the server supports it.
+        http1: Allow HTTP/1.1. With ``http1=False`` plain ``http://`` URLs are
+            spoken as HTTP/2 with prior knowledge.
+        max_connections: Total number of open connections.
+        max_keepalive_connections: Idle connections kept in the pool
+            (``None`` — same as ``max_connections``).
+        keepalive_expiry: Seconds an idle connection is kept open.
+        client: ``httpx.AsyncClient`` to reuse. It is not closed by
+            :meth:`aclose`, and the other arguments are ignored.
+
+    Raises:
+        ImportError: If ``httpx`` is not installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: Optional[int] = DEFAULT_POOL_LIMIT,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_TIMEOUT,
+        client: Any = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HttpxTransport requires httpx: pip install \"aiorocket2[http2]\""
+            ) from None
+        self._httpx = httpx
+        self._own_client = client is None
+        self._client = client
+        self.http2 = http2
+        self.http1 = http1
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+            if max_keepalive_connections is not None else max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+    def _get_client(self) -> Any:
+        """Return the ``httpx`` client, creating it on first use."""
+        if self._client is None:
+            self._client = self._httpx.AsyncClient(
+                http1=self.http1, http2=self.http2, limits=self.limits
+            )
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> TransportResponse:
+        httpx = self._httpx
+        client = self._get_client()
+        request = client.build_request(
+            method,
+            url,
+            params=params,
+            content=data,
+            headers=headers,
+            # httpx has no overall limit: ``total`` is enforced by wait_for below
+            timeout=httpx.Timeout(
+                None,
+                connect=timeout.sock_connect or timeout.connect,
+                read=timeout.sock_read,
+            ),
+        )
+        exchange = self._exchange(client, request)
+        try:
+            if timeout.total is None:
+                return await exchange
+            return await asyncio.wait_for(exchange, timeout.total)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            raise TransportConnectError(str(e) or type(e).__name__) from e
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+
+    @staticmethod
+    async def _exchange(client: Any, request: Any) -> TransportResponse:
+        """Send ``request`` and read the body without decoding it."""
+        started = time.perf_counter()
+        resp = await client.send(request, stream=True)
+        ttfb = time.perf_counter() - started
+        try:
+            body = b"".join([chunk async for chunk in resp.aiter_raw()])
+        finally:
+            await resp.aclose()
+        return TransportResponse(resp.status_code, resp.headers, body, ttfb)
+
+    async def aclose(self) -> None:
+        """Close the ``httpx`` client if it was created by this transport."""
+        if self._own_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+Handler = Callable[..., Union[Awaitable[Any], Any]]
+
+
+class InMemoryTransport(Transport):
+    """Transport that answers requests from a Python callable, without sockets.
+
+    The handler is called as ``handler(method, url, params, data, headers)``
+    and may be a plain function or a coroutine function. It returns either a
+    :class:`TransportResponse` or a ``(status, payload)`` tuple, where
+    ``payload`` is ``bytes`` or a JSON-serialisable object. Raising
+    :class:`TransportError` or :class:`asyncio.TimeoutError` simulates
+    network failures.
+
+    Example::
+
+        def handler(method, url, params, data, headers):
+            return 200, {"success": True, "data": {"version": "1.0"}}
+
+        client = xRocketClient(api_key="KEY", transport=InMemoryTransport(handler))
+
+    Args:
+        handler: Callable producing the responses.
+
+    Attributes:
+        requests: Number of requests handled so far.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        self.handler = handler
+        self.requests = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        data: Optional[bytes],
+        headers: Mapping[str, str],
+        timeout: aiohttp.ClientTimeout,
+    ) -> TransportResponse:
+        self.requests += 1
+        started = time.perf_counter()
+        result = self.handler(method, url, params, data, headers)
+        if inspect.isawaitable(result):
+            if timeout.total is not None:
+                result = asyncio.wait_for(result, timeout.total)
+            result = await result
+        if isinstance(result, TransportResponse):
+            return result
+        status, payload = cast(Tuple[int, Any], result)
+        if not isinstance(payload, (bytes, bytearray)):
+            payload = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+        ttfb = time.perf_counter() - started
+        return TransportResponse(status, headers, bytes(payload), ttfb)
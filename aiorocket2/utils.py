@@ -21,19 +21,44 @@
 
 """Utility helpers used across the package.
 
-The helpers are intentionally small and focused: id generation for idempotency
-and a simple exponential backoff helper used by network retry logic.
+The helpers are intentionally small and focused: id generation for idempotency,
+a simple exponential backoff helper (the client itself uses
+:class:`aiorocket2.retry.RetryPolicy`) and helpers
+that name endpoints and read rate-limit headers.
 """
 
 import asyncio
 import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
 
 __all__ = [
     "generate_idempotency_id",
     "gii",
-    "backoff_sleep"
+    "backoff_sleep",
+    "endpoint_key",
+    "endpoint_tag",
+    "parse_retry_after",
 ]
 
+ENDPOINT_TEMPLATES = (
+    "tg-invoices/{id}",
+    "multi-cheque/{id}",
+    "app/withdrawal/status/{id}",
+)
+"""Endpoints whose last path segment is a resource id."""
+
+ENDPOINT_TAGS = {
+    "version": "Version",
+    "app": "App",
+    "multi-cheque": "MultiCheque",
+    "tg-invoices": "TgInvoices",
+    "withdrawal-link": "WithdrawalLink",
+    "currencies": "Currencies",
+    "health": "Health",
+}
+"""First path segment of an endpoint mapped to its tag (see :mod:`aiorocket2.tags`)."""
+
 def generate_idempotency_id() -> str:
     """Generate a simple idempotency identifier based on the current timestamp.
 
@@ -61,3 +86,86 @@ async def backoff_sleep(attempt: int, base: float) -> None:
     """
     delay = base * (2 ** attempt)
     await asyncio.sleep(delay)
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """Return a stable name for an endpoint, used to key per-endpoint settings.
+
+    Resource ids are replaced with ``{id}`` so that, for example, every
+    ``get_invoice`` call maps to the same key.
+
+    Args:
+        method (str): HTTP verb.
+        endpoint (str): Path after the base URL.
+
+    Returns:
+        str: Key such as ``"GET tg-invoices/{id}"``.
+
+    Example::
+
+        endpoint_key("GET", "tg-invoices/42")  # "GET tg-invoices/{id}"
+    """
+    path = endpoint.strip("/")
+    parts = path.split("/")
+    for template in ENDPOINT_TEMPLATES:
+        tparts = template.split("/")
+        if len(tparts) == len(parts) and all(
+            t == parts[i] or t == "{id}" for i, t in enumerate(tparts)
+        ):
+            path = template
+            break
+    return f"{method.upper()} {path}"
+
+def endpoint_tag(endpoint: str) -> str:
+    """Return the name of the tag an endpoint belongs to.
+
+    Args:
+        endpoint (str): Path after the base URL, or an :func:`endpoint_key`.
+
+    Returns:
+        str: Tag class name such as ``"TgInvoices"``; the first path segment
+        for endpoints unknown to the client.
+
+    Example::
+
+        endpoint_tag("tg-invoices/42")  # "TgInvoices"
+    """
+    path = endpoint.rsplit(" ", 1)[-1].strip("/")
+    segment = path.split("/", 1)[0]
+    return ENDPOINT_TAGS.get(segment, segment)
+
+def parse_retry_after(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Read how long the server asks to wait from response headers.
+
+    ``Retry-After`` (seconds or HTTP date) is preferred; otherwise the common
+    ``RateLimit-Reset`` / ``X-RateLimit-Reset`` headers are used when the
+    remaining quota is exhausted.
+
+    Args:
+        headers (Mapping): Response headers.
+
+    Returns:
+        Optional[float]: Delay in seconds, or ``None`` if the headers do not say.
+    """
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+    for prefix in ("RateLimit-", "X-RateLimit-"):
+        remaining = headers.get(prefix + "Remaining")
+        reset = headers.get(prefix + "Reset")
+        if reset is None or remaining not in (None, "0"):
+            continue
+        try:
+            reset_f = float(reset)
+        except ValueError:
+            continue
+        # some servers send an epoch timestamp instead of a delay
+        return max(0.0, reset_f - time.time()) if reset_f > 1e9 else max(0.0, reset_f)
+    return None
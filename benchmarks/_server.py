@@ -0,0 +1,200 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Local stand-in for the xRocket Pay API used by the benchmarks.
+
+Serves ``GET /tg-invoices/{id}``, ``GET /tg-invoices?limit=&offset=`` (and
+``GET /version``) with realistic payloads, either over HTTP/1.1
+(``aiohttp.web``) or over cleartext HTTP/2 with prior knowledge (``h2``).
+Each server runs in its own process so that it does not compete with the
+client for the benchmark's event loop.
+
+Usage from a benchmark::
+
+    with serve("http1", delay=0.002) as base_url:
+        ...
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import multiprocessing
+from typing import Iterator, Tuple
+from urllib.parse import parse_qs
+
+INVOICES = 1000
+
+
+def invoice(invoice_id: int) -> dict:
+    """Return the API representation of an invoice."""
+    return {
+        "id": invoice_id,
+        "amount": 1.5,
+        "minPayment": 0,
+        "totalActivations": 1,
+        "activationsLeft": 1,
+        "description": f"Order #{invoice_id}",
+        "hiddenMessage": "Thank you!",
+        "payload": f"order:{invoice_id}",
+        "callbackUrl": "https://example.com/callback",
+        "commentsEnabled": False,
+        "currency": "TONCOIN",
+        "created": "2025-01-01T00:00:00.000Z",
+        "paid": None,
+        "status": "active",
+        "expiredIn": 3600,
+        "link": f"https://t.me/xrocket?start=inv_{invoice_id:016d}",
+    }
+
+
+def respond(method: str, path: str) -> Tuple[int, bytes]:
+    """Build the status and JSON body the stand-in returns for a request."""
+    path, _, query = path.partition("?")
+    path = path.strip("/")
+    if method == "GET" and path == "version":
+        return 200, json.dumps({"version": "1.0"}).encode()
+    if method == "GET" and path == "tg-invoices":
+        args = parse_qs(query)
+        limit = int(args.get("limit", ["100"])[0])
+        return 200, _page(limit, int(args.get("offset", ["0"])[0]))
+    if method == "GET" and path.startswith("tg-invoices/"):
+        invoice_id = int(path.rsplit("/", 1)[1])
+        if 0 < invoice_id <= INVOICES:
+            body = {"success": True, "data": invoice(invoice_id)}
+            return 200, json.dumps(body).encode()
+    return 404, json.dumps({"success": False, "message": "Not found"}).encode()
+
+
+@functools.lru_cache(maxsize=64)
+def _page(limit: int, offset: int) -> bytes:
+    # newest first, like the API
+    first = INVOICES - offset
+    results = [invoice(i) for i in range(first, max(0, first - limit), -1)]
+    return json.dumps({"success": True, "data": {
+        "total": INVOICES, "limit": limit, "offset": offset, "results": results,
+    }}).encode()
+
+
+async def _serve_http1(delay: float, ready) -> None:
+    from aiohttp import web
+
+    async def handle(request: web.Request) -> web.Response:
+        if delay:
+            await asyncio.sleep(delay)
+        status, body = respond(request.method, request.path_qs)
+        return web.Response(status=status, body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    ready.put(site._server.sockets[0].getsockname()[1])
+    await asyncio.Event().wait()
+
+
+class _H2Protocol(asyncio.Protocol):
+    """Minimal HTTP/2 server connection (prior knowledge, no TLS)."""
+
+    def __init__(self, delay: float) -> None:
+        import h2.config
+        import h2.connection
+
+        self.delay = delay
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.transport = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        import h2.events
+        import h2.exceptions
+
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.write(self.conn.data_to_send())
+            self.transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                headers = dict(event.headers)
+                asyncio.ensure_future(self._respond(
+                    event.stream_id, headers[":method"], headers[":path"]
+                ))
+            elif isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id: int, method: str, path: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.transport.is_closing():
+            return
+        status, body = respond(method, path)
+        self.conn.send_headers(stream_id, [
+            (":status", str(status)),
+            ("content-type", "application/json"),
+            ("content-length", str(len(body))),
+        ])
+        self.conn.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+async def _serve_http2(delay: float, ready) -> None:
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: _H2Protocol(delay), "127.0.0.1", 0)
+    ready.put(server.sockets[0].getsockname()[1])
+    await asyncio.Event().wait()
+
+
+def _run(kind: str, delay: float, ready) -> None:
+    serve_forever = _serve_http2 if kind == "http2" else _serve_http1
+    asyncio.run(serve_forever(delay, ready))
+
+
+@contextlib.contextmanager
+def serve(kind: str = "http1", delay: float = 0.0) -> Iterator[str]:
+    """Run a stand-in server in a child process and yield its base URL.
+
+    Args:
+        kind: ``"http1"`` or ``"http2"`` (cleartext, prior knowledge).
+        delay: Seconds the server waits before answering each request.
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_run, args=(kind, delay, ready), daemon=True
+    )
+    process.start()
+    try:
+        yield f"http://127.0.0.1:{ready.get(timeout=10)}"
+    finally:
+        process.terminate()
+        process.join()
@@ -0,0 +1,91 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: batched versus per-id ``get_invoice`` lookups.
+
+Bursts of concurrent ``get_invoice`` calls against the local stand-in server
+(which answers after a simulated round trip), with and without a
+:class:`~aiorocket2.batching.BatchLoader`:
+
+- recent ids — all on the first list page, answered by one scan;
+- old ids — below what the last scan saw, fetched one by one.
+
+Usage::
+
+    python benchmarks/bench_batching.py [bursts] [rtt_ms]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import INVOICES, serve  # noqa: E402
+
+from aiorocket2 import BatchLoader, xRocketClient  # noqa: E402
+
+PAGE = 200
+
+
+async def _bursts(url, ids, bursts, batching):
+    samples = []
+    client = xRocketClient(api_key="BENCH", base_url=url, batching=batching)
+    async with client:
+        await client.warmup(len(ids))
+        await asyncio.gather(*(client.get_invoice(i) for i in ids))
+        for _ in range(bursts):
+            started = time.perf_counter()
+            await asyncio.gather(*(client.get_invoice(i) for i in ids))
+            samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def _requests(loader, lookups):
+    if loader is None:
+        return lookups
+    stats = loader.stats()
+    return stats.scans + stats.fallbacks
+
+
+async def main():
+    bursts = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rtt = (float(sys.argv[2]) if len(sys.argv) > 2 else 20.0) / 1e3
+    with serve("http1", delay=rtt) as url:
+        for name, ids in [
+            ("10 recent ids", range(INVOICES, INVOICES - 10, -1)),
+            ("50 recent ids", range(INVOICES, INVOICES - 50, -1)),
+            ("10 old ids", range(1, 11)),
+        ]:
+            ids = list(ids)
+            loaders = [("per-id", None), ("batched", BatchLoader(page_size=PAGE))]
+            for label, loader in loaders:
+                p50, p99 = await _bursts(url, ids, bursts, loader)
+                sent = _requests(loader, len(ids) * (bursts + 1))
+                print(f"{name:<14} {label:<8} burst p50 {p50 * 1e3:7.2f} ms   "
+                      f"p99 {p99 * 1e3:7.2f} ms   "
+                      f"{sent / (bursts + 1):5.1f} requests/burst")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: repeated ``get_invoice`` lookups with and without the response cache.
+
+Sequential lookups drawn from a small hot set of ids against the local
+stand-in server (with a simulated round trip), with and without a
+:class:`~aiorocket2.cache.ResponseCache`, and the cost of a cache hit on
+its own through ``InMemoryTransport``.
+
+Usage::
+
+    python benchmarks/bench_cache.py [calls] [hot_ids] [rtt_ms]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import respond, serve  # noqa: E402
+
+from aiorocket2 import (  # noqa: E402
+    InMemoryTransport,
+    ResponseCache,
+    TransportResponse,
+    xRocketClient,
+)
+
+_, _BODY = respond("GET", "/tg-invoices/1")
+_RESPONSE = TransportResponse(200, {"Content-Type": "application/json"}, _BODY)
+
+
+async def _lookups(client, ids):
+    started = time.perf_counter()
+    for i in ids:
+        await client.get_invoice(i)
+    return time.perf_counter() - started
+
+
+async def _hit_cost(n):
+    results = {}
+    for name, cache in [("no cache", None), ("cache hit", ResponseCache())]:
+        transport = InMemoryTransport(lambda *args: _RESPONSE)
+        client = xRocketClient(api_key="BENCH", transport=transport, cache=cache)
+        async with client:
+            await client.get_invoice(1)
+            results[name] = await _lookups(client, [1] * n) / n
+    return results
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    hot = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rtt = (float(sys.argv[3]) if len(sys.argv) > 3 else 20.0) / 1e3
+    ids = [random.randint(1, hot) for _ in range(n)]
+    with serve("http1", delay=rtt) as url:
+        for name, cache in [("no cache", None), ("cache", ResponseCache())]:
+            client = xRocketClient(api_key="BENCH", base_url=url, cache=cache)
+            async with client:
+                await client.warmup()
+                elapsed = await _lookups(client, ids)
+            sent = n if cache is None else cache.stats().misses
+            print(f"{name:<10} {n / elapsed:8.0f} lookups/s   "
+                  f"{sent:5d} requests for {n} lookups of {hot} ids")
+    for name, per_call in (await _hit_cost(n * 20)).items():
+        print(f"in-memory {name:<10} {per_call * 1e6:6.1f} us/call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
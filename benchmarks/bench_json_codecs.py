@@ -0,0 +1,81 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: JSON encode/decode cost per codec.
+
+Decodes a 1000-invoice ``get_invoices`` page and encodes a ``create_invoice``
+body with every installed codec. ``json (via str)`` is the old path, where
+the body was first decoded to text (as ``aiohttp``'s ``resp.json()`` does)
+and then parsed.
+
+Usage::
+
+    python benchmarks/bench_json_codecs.py [repeats]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import invoice  # noqa: E402
+
+from aiorocket2.codec import get_codec  # noqa: E402
+
+PAGE = json.dumps({"success": True, "data": {
+    "total": 1000, "limit": 1000, "offset": 0,
+    "results": [invoice(i) for i in range(1, 1001)],
+}}).encode()
+
+BODY = {
+    "amount": 1.5, "minPayment": None, "numPayments": 1, "currency": "TONCOIN",
+    "description": "Order #1", "hiddenMessage": "Thank you!", "commentsEnabled": False,
+    "callbackUrl": "https://example.com/callback", "payload": "order:1",
+    "expiredIn": 3600, "platformId": None,
+}
+
+
+def _time(func, repeats):
+    """Best per-call time in seconds over 5 rounds."""
+    return min(timeit.repeat(func, number=repeats, repeat=5)) / repeats
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"page: {len(PAGE) / 1024:.0f} KiB, body: {len(json.dumps(BODY))} B")
+    baseline = _time(lambda: json.loads(PAGE.decode("utf-8")), repeats)
+    print(f"{'json (via str)':<16} decode page {baseline * 1e3:7.3f} ms")
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<16} not installed")
+            continue
+        decode = _time(lambda codec=codec: codec.loads(PAGE), repeats)
+        encode = _time(lambda codec=codec: codec.dumps(BODY), repeats * 50)
+        print(f"{name:<16} decode page {decode * 1e3:7.3f} ms "
+              f"({baseline / decode:4.1f}x)   encode body {encode * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: typed models versus raw mode.
+
+Fetches a 1000-invoice ``get_invoices`` page through ``InMemoryTransport`` (no
+network) and reports the client-side cost per call for:
+
+- ``typed``            — ``PaginatedInvoice`` built with ``from_api``;
+- ``typed + as_dict``  — the same, converted back to plain dicts;
+- ``raw dict``         — ``RawMode.DICT``, the parsed ``data`` field;
+- ``raw bytes``        — ``RawMode.BYTES``, the ``data`` field as JSON bytes.
+
+Each row is measured with every installed JSON codec.
+
+Usage::
+
+    python benchmarks/bench_raw_mode.py [calls]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import invoice  # noqa: E402
+
+from aiorocket2 import InMemoryTransport, RawMode, TransportResponse, xRocketClient  # noqa: E402
+
+PAGE = json.dumps({"success": True, "data": {
+    "total": 1000, "limit": 1000, "offset": 0,
+    "results": [invoice(i) for i in range(1, 1001)],
+}}).encode()
+
+RESPONSE = TransportResponse(200, {"Content-Type": "application/json"}, PAGE)
+
+
+def _handler(method, url, params, data, headers):
+    return RESPONSE
+
+
+async def _typed(client):
+    return await client.get_invoices(limit=1000)
+
+
+async def _typed_as_dict(client):
+    return (await client.get_invoices(limit=1000)).as_dict()
+
+
+def _raw(mode):
+    async def call(client):
+        with client.raw(mode):
+            return await client.get_invoices(limit=1000)
+    return call
+
+
+CASES = [
+    ("typed", _typed),
+    ("typed + as_dict", _typed_as_dict),
+    ("raw dict", _raw(RawMode.DICT)),
+    ("raw bytes", _raw(RawMode.BYTES)),
+]
+
+
+async def _measure(codec, call, n):
+    transport = InMemoryTransport(_handler)
+    client = xRocketClient(api_key="BENCH", transport=transport, json_codec=codec)
+    async with client:
+        await call(client)
+        clock = time.perf_counter
+        best = float("inf")
+        for _ in range(5):
+            start = clock()
+            for _ in range(n):
+                await call(client)
+            best = min(best, (clock() - start) / n)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"get_invoices(limit=1000), page {len(PAGE) / 1024:.0f} KiB, ms per call")
+    for codec in ("json", "orjson", "msgspec"):
+        try:
+            baseline = asyncio.run(_measure(codec, _typed, n))
+        except ImportError:
+            print(f"{codec}: not installed")
+            continue
+        for name, call in CASES:
+            if call is _typed:
+                elapsed = baseline
+            else:
+                elapsed = asyncio.run(_measure(codec, call, n))
+            print(f"{codec:<8} {name:<16} {elapsed * 1e3:8.3f} ms  "
+                  f"({baseline / elapsed:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
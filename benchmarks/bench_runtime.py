@@ -0,0 +1,128 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: default event loop versus aiorocket2.runtime's fast loop.
+
+For each loop configuration (stock asyncio, asyncio with eager tasks, uvloop)
+measures:
+
+- ``_request`` overhead: sequential ``get_invoice`` through
+  ``InMemoryTransport`` — the client's own cost per call, no network;
+- concurrent ``get_invoice`` throughput and p99 against the local stand-in;
+- parse throughput: sequential ``get_invoices(limit=1000)`` pages from the
+  stand-in, in invoices per second.
+
+Usage::
+
+    python benchmarks/bench_runtime.py [calls]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import INVOICES, respond, serve  # noqa: E402
+
+from aiorocket2 import InMemoryTransport, TransportResponse, runtime, xRocketClient  # noqa: E402
+
+_, _BODY = respond("GET", "/tg-invoices/1")
+_RESPONSE = TransportResponse(200, {"Content-Type": "application/json"}, _BODY)
+
+
+async def _overhead(n):
+    transport = InMemoryTransport(lambda *args: _RESPONSE)
+    async with xRocketClient(api_key="BENCH", transport=transport) as client:
+        await client.get_invoice(1)
+        started = time.perf_counter()
+        for _ in range(n):
+            await client.get_invoice(1)
+        return (time.perf_counter() - started) / n
+
+
+async def _concurrent(url, n, concurrency=100):
+    samples = []
+    ids = iter(range(n))
+
+    async def worker(client):
+        for i in ids:
+            start = time.perf_counter()
+            await client.get_invoice(i % INVOICES + 1)
+            samples.append(time.perf_counter() - start)
+
+    async with xRocketClient(api_key="BENCH", base_url=url) as client:
+        await asyncio.gather(*(client.get_invoice(i + 1) for i in range(concurrency)))
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    samples.sort()
+    return n / elapsed, samples[int(len(samples) * 0.99)]
+
+
+async def _pages(url, pages):
+    async with xRocketClient(api_key="BENCH", base_url=url) as client:
+        await client.get_invoices(limit=1000)
+        started = time.perf_counter()
+        items = 0
+        for _ in range(pages):
+            items += len((await client.get_invoices(limit=1000)).results)
+        return items / (time.perf_counter() - started)
+
+
+async def _all(url, n):
+    return (
+        await _overhead(n),
+        await _concurrent(url, n),
+        await _pages(url, max(1, n // 200)),
+    )
+
+
+CONFIGS = [
+    ("asyncio", False, False),
+    ("asyncio + eager tasks", False, True),
+    ("uvloop", True, False),
+]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"uvloop installed: {runtime.HAS_UVLOOP}, "
+          f"eager tasks available: {runtime.HAS_EAGER_TASKS}")
+    with serve("http1") as url:
+        for name, use_uvloop, eager in CONFIGS:
+            missing = (use_uvloop and not runtime.HAS_UVLOOP) or (
+                eager and not runtime.HAS_EAGER_TASKS
+            )
+            if missing:
+                print(f"{name:<24} not available")
+                continue
+            overhead, (rps, p99), parsed = runtime.run(
+                _all(url, n), use_uvloop=use_uvloop, eager_tasks=eager
+            )
+            print(f"{name:<24} overhead {overhead * 1e6:6.1f} us/call   "
+                  f"concurrent {rps:6.0f} req/s p99 {p99 * 1e3:6.2f} ms   "
+                  f"parse {parsed:8.0f} invoices/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: acquire overhead of SharedRateLimiter under contention.
+
+Starts N worker processes that all acquire tokens from one shared bucket as
+fast as they can (the rate is set high enough that nobody has to wait), and
+reports the per-acquire latency. The in-process RateLimiter is measured in a
+single process as a baseline.
+
+Usage::
+
+    python benchmarks/bench_shared_ratelimit.py [acquires_per_worker]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from aiorocket2.ratelimit import RateLimiter, SharedRateLimiter  # noqa: E402
+
+RATE = 1e9  # never wait: measure pure acquire cost
+KEY = "GET tg-invoices/{id}"
+
+
+async def _measure(limiter, n):
+    samples = []
+    clock = time.perf_counter
+    for _ in range(n):
+        start = clock()
+        await limiter.acquire(KEY)
+        samples.append(clock() - start)
+    return samples
+
+
+def _worker(path, n, queue):
+    limiter = SharedRateLimiter(path, RATE, RATE, per_endpoint={KEY: (RATE, RATE)})
+    queue.put(asyncio.run(_measure(limiter, n)))
+    limiter.close()
+
+
+def _report(name, samples):
+    samples.sort()
+    us = 1e6
+    print(f"{name:<28} mean {statistics.mean(samples) * us:7.2f} us   "
+          f"p50 {samples[len(samples) // 2] * us:7.2f} us   "
+          f"p99 {samples[int(len(samples) * 0.99)] * us:7.2f} us")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    _report("RateLimiter (1 process)", asyncio.run(_measure(
+        RateLimiter(RATE, RATE, per_endpoint={KEY: (RATE, RATE)}), n)))
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in (1, 4, 8, 16):
+            path = os.path.join(tmp, f"bucket-{workers}")
+            queue = multiprocessing.Queue()
+            procs = [multiprocessing.Process(target=_worker, args=(path, n, queue))
+                     for _ in range(workers)]
+            for p in procs:
+                p.start()
+            samples = [s for _ in procs for s in queue.get()]
+            for p in procs:
+                p.join()
+            _report(f"SharedRateLimiter x{workers}", samples)
+
+
+if __name__ == "__main__":
+    main()
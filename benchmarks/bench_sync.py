@@ -0,0 +1,103 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: SyncClient versus ``asyncio.run`` per call.
+
+Sequential ``get_invoice`` calls from synchronous code against the local
+stand-in server, made three ways:
+
+- ``asyncio.run`` per call — a new loop, client and connection every time;
+- ``SyncClient`` — one background loop and pooled client, one caller thread;
+- ``SyncClient`` shared by several caller threads.
+
+Usage::
+
+    python benchmarks/bench_sync.py [calls] [threads]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import INVOICES, serve  # noqa: E402
+
+from aiorocket2 import SyncClient, xRocketClient  # noqa: E402
+
+
+def _report(name, elapsed, samples):
+    samples.sort()
+    ms = 1e3
+    print(f"{name:<28} {len(samples) / elapsed:8.0f} calls/s   "
+          f"p50 {samples[len(samples) // 2] * ms:6.2f} ms   "
+          f"p99 {samples[int(len(samples) * 0.99)] * ms:6.2f} ms")
+
+
+async def _one_call(url, invoice_id):
+    async with xRocketClient(api_key="BENCH", base_url=url) as client:
+        return await client.get_invoice(invoice_id)
+
+
+def _calls(call, n, samples):
+    clock = time.perf_counter
+    for i in range(n):
+        start = clock()
+        call(i % INVOICES + 1)
+        samples.append(clock() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    with serve("http1") as url:
+        samples = []
+        started = time.perf_counter()
+        _calls(lambda i: asyncio.run(_one_call(url, i)), n, samples)
+        _report("asyncio.run per call", time.perf_counter() - started, samples)
+
+        with SyncClient("BENCH", base_url=url) as client:
+            client.get_version()  # open the first connection
+            samples = []
+            started = time.perf_counter()
+            _calls(client.get_invoice, n, samples)
+            _report("SyncClient, 1 thread", time.perf_counter() - started, samples)
+
+            samples = []
+            workers = [
+                threading.Thread(
+                    target=_calls, args=(client.get_invoice, n // threads, samples)
+                )
+                for _ in range(threads)
+            ]
+            started = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+            _report(f"SyncClient, {threads} threads", elapsed, samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#  aiorocket2 - Asynchronous Python client for xRocket Pay API
+#  Copyright (C) 2025-present RimMirK
+#
+#  This file is part of aiorocket2.
+#
+#  aiorocket2 is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, version 3 of the License.
+#
+#  aiorocket2 is an independent, unofficial client library.
+#  It is a near one-to-one reflection of the xRocket Pay API:
+#  all methods, parameters, objects and enums are implemented.
+#  If something does not work as expected, please open an issue.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiorocket2.  If not, see the LICENSE file.
+#
+#  Repository: https://github.com/RimMirK/aiorocket2
+#  Documentation: https://docs.aiorocket2.rimmirk.dev
+#  Telegram: @RimMirK
+
+"""Benchmark: throughput and tail latency of the client transports.
+
+Runs a concurrent ``get_invoice`` workload through :class:`xRocketClient` with
+each transport and reports requests per second and p50/p99 latency:
+
+- ``InMemoryTransport`` — no sockets; measures the client's own overhead.
+- ``AiohttpTransport`` — HTTP/1.1 against the local stand-in server.
+- ``HttpxTransport`` over HTTP/1.1 and over HTTP/2 (one multiplexed
+  connection), if ``httpx`` and ``h2`` are installed.
+
+The stand-in server (see ``_server.py``) runs in a separate process.
+
+Usage::
+
+    python benchmarks/bench_transports.py [requests] [concurrency] [server_delay_ms]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from _server import INVOICES, respond, serve  # noqa: E402
+
+from aiorocket2 import (  # noqa: E402
+    AiohttpTransport, HttpxTransport, InMemoryTransport, PoolConfig, xRocketClient
+)
+
+
+async def _workload(client, n, concurrency):
+    """Call ``get_invoice`` ``n`` times with ``concurrency`` workers."""
+    samples = []
+    ids = iter(range(n))
+    clock = time.perf_counter
+
+    async def worker():
+        for i in ids:
+            start = clock()
+            await client.get_invoice(i % INVOICES + 1)
+            samples.append(clock() - start)
+
+    started = clock()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return clock() - started, samples
+
+
+async def _bench(name, base_url, transport, n, concurrency):
+    client = xRocketClient(api_key="BENCH", base_url=base_url, transport=transport)
+    async with client:
+        # open connections, warm caches
+        await _workload(client, min(n, 200), concurrency)
+        elapsed, samples = await _workload(client, n, concurrency)
+    samples.sort()
+    ms = 1e3
+    print(f"{name:<26} {n / elapsed:9.0f} req/s   "
+          f"p50 {samples[len(samples) // 2] * ms:7.2f} ms   "
+          f"p99 {samples[int(len(samples) * 0.99)] * ms:7.2f} ms")
+
+
+def _in_memory(delay):
+    async def handler(method, url, params, data, headers):
+        if delay:
+            await asyncio.sleep(delay)
+        return respond(method, urlsplit(url).path)
+    return InMemoryTransport(handler)
+
+
+def _httpx(**kwargs):
+    try:
+        return HttpxTransport(**kwargs)
+    except ImportError:
+        return None
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    delay = float(sys.argv[3]) / 1e3 if len(sys.argv) > 3 else 0.0
+    print(f"{n} x get_invoice, concurrency {concurrency}, "
+          f"server delay {delay * 1e3:g} ms")
+
+    def bench(name, base_url, transport):
+        asyncio.run(_bench(name, base_url, transport, n, concurrency))
+
+    bench("InMemoryTransport", "http://in-memory", _in_memory(delay))
+    with serve("http1", delay) as url:
+        pool = PoolConfig(limit=concurrency)
+        bench("AiohttpTransport (HTTP/1.1)", url, AiohttpTransport(pool=pool))
+        transport = _httpx(http2=False, max_connections=concurrency)
+        if transport is not None:
+            bench("HttpxTransport (HTTP/1.1)", url, transport)
+    transport = _httpx(http1=False, http2=True, max_connections=1)
+    if transport is None:
+        print("httpx is not installed: skipping HttpxTransport")
+        return
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("h2 is not installed: skipping HTTP/2")
+        return
+    with serve("http2", delay) as url:
+        bench("HttpxTransport (HTTP/2)", url, transport)
+
+
+if __name__ == "__main__":
+    main()
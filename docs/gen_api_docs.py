@@ -11,6 +11,28 @@ pages = {
     "api/enums.md": "::: aiorocket2.enums\n",
     "api/exceptions.md": "::: aiorocket2.exceptions\n",
     "api/utils.md": "::: aiorocket2.utils\n",
+    "api/pool.md": "::: aiorocket2.pool\n",
+    "api/ratelimit.md": "::: aiorocket2.ratelimit\n",
+    "api/coalesce.md": "::: aiorocket2.coalesce\n",
+    "api/metrics.md": "::: aiorocket2.metrics\n",
+    "api/hedging.md": "::: aiorocket2.hedging\n",
+    "api/timeouts.md": "::: aiorocket2.timeouts\n",
+    "api/breaker.md": "::: aiorocket2.breaker\n",
+    "api/retry.md": "::: aiorocket2.retry\n",
+    "api/bulkhead.md": "::: aiorocket2.bulkhead\n",
+    "api/scheduler.md": "::: aiorocket2.scheduler\n",
+    "api/deadline.md": "::: aiorocket2.deadline\n",
+    "api/admission.md": "::: aiorocket2.admission\n",
+    "api/transport.md": "::: aiorocket2.transport\n",
+    "api/compression.md": "::: aiorocket2.compression\n",
+    "api/codec.md": "::: aiorocket2.codec\n",
+    "api/callinfo.md": "::: aiorocket2.callinfo\n",
+    "api/tenants.md": "::: aiorocket2.tenants\n",
+    "api/sharding.md": "::: aiorocket2.sharding\n",
+    "api/sync.md": "::: aiorocket2.sync\n",
+    "api/runtime.md": "::: aiorocket2.runtime\n",
+    "api/batching.md": "::: aiorocket2.batching\n",
+    "api/cache.md": "::: aiorocket2.cache\n",
 }
 
 for path, content in pages.items():
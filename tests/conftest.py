@@ -0,0 +1,79 @@
+"""Shared fixtures: an in-memory stand-in for the xRocket Pay API."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from aiorocket2 import InMemoryTransport, xRocketClient
+
+
+def invoice(invoice_id: int) -> Dict[str, Any]:
+    """API representation of an invoice."""
+    return {
+        "id": invoice_id, "currency": "TON", "amount": 1, "description": None,
+        "hiddenMessage": None, "payload": None, "callbackUrl": None,
+        "commentsEnabled": None, "status": "active", "link": "https://t.me/xrocket",
+        "created": None, "paid": None,
+    }
+
+
+class FakeAPI:
+    """Answers invoice, health and version requests and records every call.
+
+    Invoices ``1..total`` exist; list pages are newest first.
+    """
+
+    def __init__(self, total: int = 100) -> None:
+        self.total = total
+        self.calls: List[Tuple[str, str, Optional[dict]]] = []
+
+    def __call__(self, method, url, params, data, headers):
+        path = url.split("/", 3)[3]
+        self.calls.append((method, path, dict(params) if params else None))
+        if path == "version":
+            return 200, {"success": True, "version": "1.0"}
+        if path == "health":
+            return 200, {"status": "ok"}
+        if path == "tg-invoices":
+            if method == "POST":
+                return 201, {"success": True, "data": invoice(self.total + 1)}
+            limit, offset = int(params["limit"]), int(params["offset"])
+            ids = range(self.total - offset, max(0, self.total - offset - limit), -1)
+            return 200, {"success": True, "data": {
+                "total": self.total, "limit": limit, "offset": offset,
+                "results": [invoice(i) for i in ids],
+            }}
+        if path.startswith("tg-invoices/"):
+            invoice_id = int(path.split("/")[1])
+            if not 0 < invoice_id <= self.total:
+                return 404, {"success": False, "message": "Invoice not found"}
+            if method == "DELETE":
+                return 200, {"success": True}
+            return 200, {"success": True, "data": invoice(invoice_id)}
+        return 404, {"success": False, "message": "Not found"}
+
+    def slow(self, delay: float):
+        """Return a handler answering like this API after ``delay`` seconds."""
+        async def handler(*args):
+            await asyncio.sleep(delay)
+            return self(*args)
+        return handler
+
+    def sent(self, method: str, path: str) -> int:
+        """Number of requests made to ``method path``."""
+        return sum(1 for m, p, _ in self.calls if m == method and p == path)
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    return FakeAPI()
+
+
+@pytest.fixture
+def make_client(api):
+    """Build clients talking to the ``api`` fixture."""
+    def make(**kwargs: Any) -> xRocketClient:
+        kwargs.setdefault("transport", InMemoryTransport(api))
+        return xRocketClient(api_key="TEST", **kwargs)
+    return make
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import (
+    AdmissionControl,
+    CircuitBreaker,
+    CircuitState,
+    DeadlineExceeded,
+    InMemoryTransport,
+    RequestRejected,
+    xRocketAPIError,
+    xRocketClient,
+)
+
+KEY = "GET tg-invoices/{id}"
+
+
+def status_handler(api, status: int):
+    def handler(*args):
+        api(*args)
+        return status, {"success": False, "message": "Failed"}
+    return handler
+
+
+def test_full_endpoint_sheds_requests(api):
+    async def main():
+        admission = AdmissionControl({KEY: (1, 1)})
+        transport = InMemoryTransport(api.slow(0.05))
+        async with xRocketClient(
+            api_key="TEST", transport=transport, admission=admission
+        ) as client:
+            results = await asyncio.gather(
+                *(client.get_invoice(1) for _ in range(3)), return_exceptions=True
+            )
+        return results, admission.stats()[KEY]
+
+    results, stats = asyncio.run(main())
+    assert [r.id for r in results[:2]] == [1, 1]
+    assert isinstance(results[2], RequestRejected)
+    assert (stats.admitted, stats.rejected) == (2, 1)
+
+
+def test_5xx_shrinks_limit_and_success_regrows_it(api):
+    async def main():
+        admission = AdmissionControl({KEY: (10, 0)}, adaptive=True, decrease_factor=0.5)
+        async with xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(status_handler(api, 503)),
+            admission=admission, retries=0,
+        ) as client:
+            for _ in range(3):
+                with pytest.raises(xRocketAPIError):
+                    await client.get_invoice(1)
+            shrunk = admission.stats()[KEY].limit
+            client.transport.handler = api
+            for _ in range(10):
+                await client.get_invoice(1)
+        return shrunk, admission.stats()[KEY].limit
+
+    shrunk, regrown = asyncio.run(main())
+    assert shrunk == 1
+    assert regrown > shrunk
+
+
+def test_open_breaker_does_not_shrink_limit(api):
+    async def main():
+        admission = AdmissionControl({KEY: (10, 0)}, adaptive=True)
+        breaker = CircuitBreaker(open_timeout=60)
+        breaker._transition(CircuitState.OPEN)
+        async with xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(api),
+            admission=admission, circuit_breaker=breaker,
+        ) as client:
+            for _ in range(20):
+                with pytest.raises(xRocketAPIError):
+                    await client.get_invoice(1)
+        return admission.gates[KEY].estimate
+
+    assert asyncio.run(main()) == 10
+
+
+def test_spent_deadline_does_not_shrink_limit(api):
+    async def main():
+        admission = AdmissionControl({KEY: (10, 0)}, adaptive=True)
+        async with xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(api.slow(0.05)),
+            admission=admission, retries=0,
+        ) as client:
+            for _ in range(5):
+                with pytest.raises(DeadlineExceeded), client.deadline(0.01):
+                    await client.get_invoice(1)
+        return admission.gates[KEY].estimate
+
+    assert asyncio.run(main()) == 10
+
+
+def test_attempt_timeout_shrinks_limit(api):
+    async def main():
+        admission = AdmissionControl({KEY: (10, 0)}, adaptive=True, decrease_factor=0.5)
+        async with xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(api.slow(0.05)),
+            admission=admission, retries=0, timeout=0.01,
+        ) as client:
+            with pytest.raises(xRocketAPIError):
+                await client.get_invoice(1)
+        return admission.gates[KEY].estimate
+
+    assert asyncio.run(main()) == 5
+
+
+def test_cancelled_request_does_not_move_limit(api):
+    async def main():
+        admission = AdmissionControl({KEY: (10, 0)}, adaptive=True, target_latency=0.01)
+        async with xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(api.slow(0.2)),
+            admission=admission, retries=0,
+        ) as client:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.get_invoice(1), 0.05)
+        gate = admission.gates[KEY]
+        return gate.estimate, len(gate.window), gate.limit.in_flight
+
+    assert asyncio.run(main()) == (10, 0, 0)
@@ -0,0 +1,116 @@
+import asyncio
+import gc
+
+import pytest
+
+from aiorocket2 import (
+    BatchLoader,
+    DeadlineExceeded,
+    InMemoryTransport,
+    xRocketAPIError,
+)
+
+
+def test_recent_ids_share_one_scan(api, make_client):
+    async def main():
+        loader = BatchLoader()
+        async with make_client(batching=loader) as client:
+            invoices = await asyncio.gather(
+                *(client.get_invoice(i) for i in range(100, 90, -1)),
+                client.get_invoice(100),
+            )
+        return invoices, loader.stats()
+
+    invoices, stats = asyncio.run(main())
+    assert [invoice.id for invoice in invoices] == [*range(100, 90, -1), 100]
+    assert api.sent("GET", "tg-invoices") == 1
+    assert len(api.calls) == 1
+    assert (stats.lookups, stats.batches, stats.scans) == (11, 1, 1)
+    assert (stats.scan_hits, stats.fallbacks) == (10, 0)
+
+
+def test_missing_id_fails_only_its_caller(api, make_client):
+    async def main():
+        async with make_client(batching=BatchLoader()) as client:
+            return await asyncio.gather(
+                client.get_invoice(100),
+                client.get_invoice(500),
+                return_exceptions=True,
+            )
+
+    found, missing = asyncio.run(main())
+    assert found.id == 100
+    assert isinstance(missing, xRocketAPIError) and missing.status == 404
+    assert api.sent("GET", "tg-invoices/500") == 1
+
+
+def test_ids_older_than_the_scan_skip_it(api, make_client):
+    async def main():
+        loader = BatchLoader(page_size=10)
+        async with make_client(batching=loader) as client:
+            await asyncio.gather(*(client.get_invoice(i) for i in (100, 99, 5)))
+            await asyncio.gather(*(client.get_invoice(i) for i in (3, 4)))
+        return loader.stats()
+
+    stats = asyncio.run(main())
+    assert (stats.scans, stats.scan_hits, stats.fallbacks) == (1, 2, 3)
+    assert api.sent("GET", "tg-invoices") == 1
+    assert [api.sent("GET", f"tg-invoices/{i}") for i in (3, 4, 5)] == [1, 1, 1]
+
+
+def test_scan_floor_does_not_keep_the_client_alive(api, make_client):
+    loader = BatchLoader(page_size=10)
+
+    async def main():
+        async with make_client(batching=loader) as client:
+            await asyncio.gather(*(client.get_invoice(i) for i in (100, 99, 5)))
+            return dict(loader._floor[client])
+
+    assert asyncio.run(main()) == {"tg-invoices": 91}
+    gc.collect()
+    assert len(loader._floor) == 0
+
+
+def test_single_lookup_is_fetched_directly(api, make_client):
+    async def main():
+        async with make_client(batching=BatchLoader()) as client:
+            return await client.get_invoice(100)
+
+    assert asyncio.run(main()).id == 100
+    assert api.calls == [("GET", "tg-invoices/100", None)]
+
+
+def test_full_batch_is_sent_without_waiting(make_client):
+    async def main():
+        loader = BatchLoader(window=10, max_batch=3)
+        async with make_client(batching=loader) as client:
+            lookups = (client.get_invoice(i) for i in (100, 99, 98))
+            return await asyncio.wait_for(asyncio.gather(*lookups), 1)
+
+    assert [invoice.id for invoice in asyncio.run(main())] == [100, 99, 98]
+
+
+def test_caller_deadline_leaves_the_batch_running(api, make_client):
+    async def main():
+        transport = InMemoryTransport(api.slow(0.1))
+        async with make_client(transport=transport, batching=BatchLoader()) as client:
+            async def impatient():
+                with client.deadline(0.02):
+                    return await client.get_invoice(99)
+
+            return await asyncio.gather(
+                impatient(), client.get_invoice(100), return_exceptions=True
+            )
+
+    gave_up, patient = asyncio.run(main())
+    assert isinstance(gave_up, DeadlineExceeded)
+    assert patient.id == 100
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        BatchLoader(window=-1)
+    with pytest.raises(ValueError):
+        BatchLoader(page_size=1001)
+    with pytest.raises(ValueError):
+        BatchLoader(max_batch=0)
@@ -0,0 +1,51 @@
+import asyncio
+
+from aiorocket2 import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    InMemoryTransport,
+    xRocketClient,
+)
+
+
+def open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(open_timeout=0.0)
+    breaker._transition(CircuitState.OPEN)
+    return breaker
+
+
+def test_probe_closes_breaker(api, make_client):
+    async def main():
+        breaker = open_breaker()
+        async with make_client(circuit_breaker=breaker) as client:
+            try:
+                await client.get_invoice(1)
+            except CircuitOpenError:
+                pass
+            await breaker._probe
+            return breaker.state, await client.get_invoice(1)
+
+    state, invoice = asyncio.run(main())
+    assert state is CircuitState.CLOSED
+    assert invoice.id == 1
+
+
+def test_probe_ignores_callers_deadline_and_call_log(api):
+    async def main():
+        breaker = open_breaker()
+        transport = InMemoryTransport(api.slow(0.03))
+        async with xRocketClient(
+            api_key="TEST", transport=transport, circuit_breaker=breaker
+        ) as client:
+            with client.call_info() as calls, client.deadline(0.01):
+                try:
+                    await client.get_invoice(1)
+                except CircuitOpenError:
+                    pass
+            await breaker._probe
+            return breaker.state, [info.endpoint for info in calls]
+
+    state, endpoints = asyncio.run(main())
+    assert state is CircuitState.CLOSED
+    assert endpoints == ["GET tg-invoices/{id}"]
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import Bulkheads, ConcurrencyLimit, InMemoryTransport, xRocketClient
+
+
+def test_limit_is_fifo_and_releases_cancelled_waiters():
+    async def main():
+        limit = ConcurrencyLimit(1)
+        order = []
+        await limit.acquire()
+
+        async def worker(name):
+            await limit.acquire()
+            order.append(name)
+            limit.release()
+
+        tasks = [asyncio.ensure_future(worker(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        limit.release()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return order, limit.stats()
+
+    order, stats = asyncio.run(main())
+    assert order == [0, 2]
+    assert (stats.in_flight, stats.waiting, stats.max_waiting) == (0, 0, 3)
+
+
+def test_release_right_after_cancelling_the_next_waiter():
+    async def main():
+        limit = ConcurrencyLimit(1)
+        await limit.acquire()
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        limit.release()  # pops the cancelled waiter before it can run
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return limit.stats()
+
+    stats = asyncio.run(main())
+    assert (stats.in_flight, stats.waiting) == (0, 0)
+
+
+def test_slow_listing_does_not_block_other_tags(api):
+    async def handler(method, url, *args):
+        if url.endswith("/tg-invoices"):
+            await asyncio.sleep(0.2)
+        return api(method, url, *args)
+
+    async def main():
+        bulkheads = Bulkheads(per_endpoint={"GET tg-invoices": 1}, default_tag_limit=5)
+        client = xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(handler), bulkheads=bulkheads
+        )
+        async with client:
+            listings = [asyncio.ensure_future(client.get_invoices()) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            stats = bulkheads.stats()
+            invoice = await asyncio.wait_for(client.get_invoice(1), 0.1)
+            await asyncio.gather(*listings)
+        return stats, invoice
+
+    stats, invoice = asyncio.run(main())
+    assert invoice.id == 1
+    assert stats["GET tg-invoices"].in_flight == 1
+    assert stats["GET tg-invoices"].waiting == 2
+    assert stats["TgInvoices"].in_flight == 1
+
+
+def test_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        ConcurrencyLimit(0)
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import BatchLoader, CacheEntry, ResponseCache, xRocketAPIError
+
+
+def test_repeated_get_is_cached(api, make_client):
+    async def main():
+        cache = ResponseCache()
+        async with make_client(cache=cache) as client:
+            first = await client.get_invoice(5)
+            second = await client.get_invoice(5)
+        return first, second, cache.stats()
+
+    first, second, stats = asyncio.run(main())
+    assert first.id == second.id == 5
+    assert api.sent("GET", "tg-invoices/5") == 1
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_mutation_without_cached_ancestor_invalidates(api, make_client):
+    # tg-invoices (the ancestor) has no entry: invalidation must not fail
+    async def main():
+        cache = ResponseCache()
+        async with make_client(cache=cache) as client:
+            await client.get_invoice(5)
+            await client.get_invoice(5)
+            deleted = await client.delete_invoice(5)
+            await client.get_invoice(5)
+        return deleted, cache.stats()
+
+    deleted, stats = asyncio.run(main())
+    assert deleted is True
+    assert stats.invalidations == 1
+    assert api.sent("GET", "tg-invoices/5") == 2
+
+
+def test_mutation_on_empty_cache(api, make_client):
+    async def main():
+        async with make_client(cache=ResponseCache()) as client:
+            return await client.create_invoice(currency="TON", amount=1)
+
+    assert asyncio.run(main()).id == api.total + 1
+
+
+def test_mutation_evicts_list_pages(api, make_client):
+    async def main():
+        cache = ResponseCache({"GET tg-invoices": 60.0, "GET tg-invoices/{id}": 60.0})
+        async with make_client(cache=cache) as client:
+            await client.get_invoices(limit=10)
+            await client.delete_invoice(7)
+            await client.get_invoices(limit=10)
+
+    asyncio.run(main())
+    assert api.sent("GET", "tg-invoices") == 2
+
+
+def test_negative_caching(api, make_client):
+    async def main():
+        cache = ResponseCache(negative_ttl=60.0)
+        async with make_client(cache=cache, retries=0) as client:
+            for _ in range(2):
+                with pytest.raises(xRocketAPIError) as error:
+                    await client.get_invoice(api.total + 1)
+                assert error.value.status == 404
+
+    asyncio.run(main())
+    assert api.sent("GET", f"tg-invoices/{api.total + 1}") == 1
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    for i in range(3):
+        cache.put((i,), CacheEntry(f"p/{i}", {}, None, float("inf")), cache.generation)
+    assert cache.get((0,)) is None
+    assert cache.get((2,)) is not None
+    assert cache.stats().evictions == 1
+
+
+def test_batched_lookups_check_cache_first(api, make_client):
+    async def main():
+        cache = ResponseCache(negative_ttl=60.0)
+        loader = BatchLoader()
+        async with make_client(cache=cache, batching=loader, retries=0) as client:
+            await client.get_invoice(99)
+            await client.get_invoice(98)
+            with pytest.raises(xRocketAPIError):
+                await client.get_invoice(api.total + 1)
+            calls = len(api.calls)
+            invoices = await asyncio.gather(
+                client.get_invoice(99), client.get_invoice(98)
+            )
+            with pytest.raises(xRocketAPIError):
+                await client.get_invoice(api.total + 1)
+        return calls, invoices, loader.stats()
+
+    calls, invoices, stats = asyncio.run(main())
+    assert [i.id for i in invoices] == [99, 98]
+    assert len(api.calls) == calls
+    assert stats.lookups == 3
+
+
+def test_cached_batched_lookup_gets_its_own_call_info(make_client):
+    async def main():
+        async with make_client(cache=ResponseCache(), batching=BatchLoader()) as client:
+            await client.get_invoice(5)
+            with client.call_info() as calls:
+                await client.get_invoices(limit=3)
+                await client.get_invoice(5)
+        return calls
+
+    page, lookup = asyncio.run(main())
+    assert (page.endpoint, page.cached) == ("GET tg-invoices", False)
+    assert page.convert > 0
+    assert (lookup.endpoint, lookup.cached) == ("GET tg-invoices/{id}", True)
+    assert lookup.convert > 0
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import (
+    InMemoryTransport,
+    ResponseCache,
+    RetryPolicy,
+    xRocketAPIError,
+    xRocketClient,
+)
+
+
+def test_nothing_is_collected_outside_the_block(make_client):
+    async def main():
+        async with make_client() as client:
+            await client.get_invoice(1)
+            with client.call_info() as calls:
+                invoice = await client.get_invoice(2)
+            await client.get_invoice(3)
+        return invoice, calls
+
+    invoice, calls = asyncio.run(main())
+    assert invoice.id == 2
+    assert [info.endpoint for info in calls] == ["GET tg-invoices/{id}"]
+    info = calls[0]
+    assert (info.status, info.attempts, info.cached) == (200, 1, False)
+    assert info.body_size == info.decoded_size > 0
+    assert 0 <= info.queued <= info.total
+    assert 0 <= info.ttfb <= info.total
+    assert info.decode >= 0 and info.convert > 0
+
+
+def test_retries_are_counted(api):
+    def flaky(*args):
+        if not api.calls:
+            api(*args)
+            return 503, {"success": False, "message": "Unavailable"}
+        return api(*args)
+
+    async def main():
+        policy = RetryPolicy(retries=2, base=0.01, cap=0.01, jitter="none")
+        transport = InMemoryTransport(flaky)
+        client = xRocketClient(api_key="TEST", transport=transport, retry_policy=policy)
+        async with client:
+            with client.call_info() as calls:
+                await client.get_invoice(1)
+        return calls
+
+    (info,) = asyncio.run(main())
+    assert (info.status, info.attempts) == (200, 2)
+    assert info.backoff == pytest.approx(0.01, abs=0.005)
+    assert info.total >= info.backoff
+
+
+def test_failed_call_keeps_its_status(make_client):
+    async def main():
+        async with make_client() as client:
+            with client.call_info() as calls:
+                with pytest.raises(xRocketAPIError):
+                    await client.get_invoice(500)
+        return calls
+
+    (info,) = asyncio.run(main())
+    assert (info.status, info.attempts) == (404, 1)
+
+
+def test_cache_hits_are_marked(make_client):
+    async def main():
+        async with make_client(cache=ResponseCache()) as client:
+            with client.call_info() as calls:
+                await client.get_invoice(5)
+                await client.get_invoice(5)
+        return calls
+
+    first, second = asyncio.run(main())
+    assert (first.cached, first.attempts) == (False, 1)
+    assert (second.cached, second.attempts) == (True, 0)
+
+
+def test_calls_from_child_tasks_are_collected(make_client):
+    async def main():
+        async with make_client() as client:
+            with client.call_info() as calls:
+                await asyncio.gather(*(client.get_invoice(i) for i in (1, 2, 3)))
+        return calls
+
+    calls = asyncio.run(main())
+    assert len(calls) == 3
+    assert all(info.status == 200 for info in calls)
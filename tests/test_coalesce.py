@@ -0,0 +1,63 @@
+import asyncio
+
+from aiorocket2 import DeadlineExceeded, InMemoryTransport, xRocketClient
+
+
+def test_identical_gets_share_one_request(api):
+    async def main():
+        transport = InMemoryTransport(api.slow(0.01))
+        client = xRocketClient(api_key="TEST", transport=transport, coalesce_gets=True)
+        async with client:
+            return await asyncio.gather(*(client.get_invoice(3) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert [r.id for r in results] == [3] * 5
+    assert api.sent("GET", "tg-invoices/3") == 1
+
+
+def test_first_callers_deadline_does_not_cut_shared_request(api):
+    async def main():
+        transport = InMemoryTransport(api.slow(0.05))
+        client = xRocketClient(api_key="TEST", transport=transport, coalesce_gets=True)
+        async with client:
+            async def hurried():
+                with client.deadline(0.01):
+                    return await client.get_invoice(3)
+
+            return await asyncio.gather(
+                hurried(), client.get_invoice(3), return_exceptions=True
+            )
+
+    hurried, patient = asyncio.run(main())
+    assert isinstance(hurried, DeadlineExceeded)
+    assert patient.id == 3
+    assert api.sent("GET", "tg-invoices/3") == 1
+
+
+def test_shared_request_stops_when_every_caller_gave_up(api):
+    async def unavailable(*args):
+        api(*args)
+        await asyncio.sleep(0.01)
+        return 503, {"success": False, "message": "Unavailable"}
+
+    async def main():
+        client = xRocketClient(
+            api_key="TEST", transport=InMemoryTransport(unavailable),
+            coalesce_gets=True, retries=3, backoff_base=0.02,
+        )
+        async with client:
+            async def hurried():
+                with client.deadline(0.03):
+                    return await client.get_invoice(3)
+
+            results = await asyncio.gather(
+                hurried(), hurried(), return_exceptions=True
+            )
+            sent = len(api.calls)
+            await asyncio.sleep(0.3)
+            return results, sent, client.coalescer.stats()
+
+    results, sent, stats = asyncio.run(main())
+    assert all(isinstance(r, DeadlineExceeded) for r in results)
+    assert len(api.calls) == sent
+    assert (stats.misses, stats.in_flight) == (1, 0)
@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+
+from aiorocket2 import (
+    InMemoryTransport,
+    JSONCodec,
+    StdlibCodec,
+    get_codec,
+    xRocketAPIError,
+    xRocketClient,
+)
+
+PAYLOAD = {"success": True, "data": {"id": 1, "name": "Заказ", "items": [1.5, None]}}
+
+
+def installed(name: str) -> JSONCodec:
+    try:
+        return get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_round_trip(name):
+    codec = installed(name)
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    envelope = codec.loads_envelope(encoded)
+    assert json.loads(envelope["data"]) == PAYLOAD["data"]
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_codec_resolution():
+    codec = StdlibCodec()
+    assert get_codec(codec) is codec
+    assert get_codec().name == "json"
+    assert get_codec("auto").name in ("orjson", "msgspec", "json")
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_client_encodes_and_decodes_with_codec(api, name):
+    installed(name)
+    bodies = []
+
+    def handler(method, url, params, data, headers):
+        bodies.append(data)
+        return api(method, url, params, data, headers)
+
+    async def main():
+        transport = InMemoryTransport(handler)
+        client = xRocketClient(api_key="TEST", transport=transport, json_codec=name)
+        async with client:
+            return await client.create_invoice(currency="TON", amount=1)
+
+    assert asyncio.run(main()).id == api.total + 1
+    assert json.loads(bodies[0])["currency"] == "TON"
+
+
+def test_malformed_response_is_an_api_error():
+    async def main():
+        transport = InMemoryTransport(lambda *args: (502, b"<html>Bad gateway</html>"))
+        client = xRocketClient(api_key="TEST", transport=transport, retries=0)
+        async with client:
+            await client.get_invoice(1)
+
+    with pytest.raises(xRocketAPIError, match="Non-JSON response"):
+        asyncio.run(main())
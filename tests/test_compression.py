@@ -0,0 +1,87 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+
+from aiorocket2 import (
+    ACCEPT_ENCODING,
+    InMemoryTransport,
+    TransportResponse,
+    decompress,
+    xRocketAPIError,
+    xRocketClient,
+)
+
+BODY = json.dumps({"success": True, "data": {"version": "1.0" * 100}}).encode()
+
+
+def test_decompress_encodings():
+    deflater = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw_deflate = deflater.compress(BODY) + deflater.flush()
+    assert decompress(gzip.compress(BODY), "gzip") == BODY
+    assert decompress(zlib.compress(BODY), "deflate") == BODY
+    assert decompress(raw_deflate, "deflate") == BODY
+    assert decompress(gzip.compress(zlib.compress(BODY)), "deflate, gzip") == BODY
+    assert decompress(BODY, "identity") == BODY
+    with pytest.raises(ValueError):
+        decompress(BODY, "compress")
+    with pytest.raises(ValueError):
+        decompress(b"not gzip", "gzip")
+
+
+def test_brotli_is_negotiated_when_installed():
+    brotli = pytest.importorskip("brotli")
+    assert "br" in ACCEPT_ENCODING
+    assert decompress(brotli.compress(BODY), "br") == BODY
+
+
+def gzip_handler(method, url, params, data, headers):
+    assert "gzip" in headers["Accept-Encoding"]
+    return TransportResponse(200, {"Content-Encoding": "gzip"}, gzip.compress(BODY))
+
+
+def test_compressed_responses_are_counted():
+    async def main():
+        transport = InMemoryTransport(gzip_handler)
+        async with xRocketClient(api_key="TEST", transport=transport) as client:
+            await client.get_version()
+            await client.get_version()
+            return client.compression_stats()["GET version"]
+
+    stats = asyncio.run(main())
+    assert (stats.responses, stats.compressed) == (2, 2)
+    assert stats.decoded_bytes == 2 * len(BODY)
+    assert stats.wire_bytes < stats.decoded_bytes
+    assert stats.saved_bytes == stats.decoded_bytes - stats.wire_bytes
+
+
+def test_compression_can_be_disabled(api):
+    seen = []
+
+    def handler(method, url, params, data, headers):
+        seen.append(headers["Accept-Encoding"])
+        return api(method, url, params, data, headers)
+
+    async def main():
+        transport = InMemoryTransport(handler)
+        client = xRocketClient(api_key="TEST", transport=transport, compression=False)
+        async with client:
+            await client.get_version()
+
+    asyncio.run(main())
+    assert seen == ["identity"]
+
+
+def test_corrupt_body_is_an_api_error():
+    def handler(*args):
+        return TransportResponse(200, {"Content-Encoding": "gzip"}, b"garbage")
+
+    async def main():
+        transport = InMemoryTransport(handler)
+        async with xRocketClient(api_key="TEST", transport=transport) as client:
+            await client.get_invoice(1)
+
+    with pytest.raises(xRocketAPIError, match="Corrupt gzip"):
+        asyncio.run(main())
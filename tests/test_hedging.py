@@ -0,0 +1,53 @@
+import asyncio
+import random
+
+from aiorocket2 import HedgePolicy, InMemoryTransport, LatencyWindow, xRocketClient
+
+
+def test_window_stays_sorted_after_eviction():
+    window = LatencyWindow(50)
+    values = [random.random() for _ in range(200)]
+    for value in values:
+        window.add(value)
+    assert window._sorted == sorted(values[-50:])
+    assert window.percentile(0.0) == min(values[-50:])
+    assert window.percentile(1.0) == max(values[-50:])
+    assert LatencyWindow().percentile(0.5) is None
+
+
+def test_slow_get_is_hedged(api):
+    started = []
+
+    async def handler(*args):
+        started.append(args)
+        await asyncio.sleep(1.0 if len(started) == 1 else 0.0)
+        return api(*args)
+
+    async def main():
+        policy = HedgePolicy(delay=0.01, budget=1.0)
+        transport = InMemoryTransport(handler)
+        client = xRocketClient(api_key="TEST", transport=transport, hedging=policy)
+        async with client:
+            invoice = await asyncio.wait_for(client.get_invoice(1), 0.5)
+        return invoice, policy.stats()
+
+    invoice, stats = asyncio.run(main())
+    assert invoice.id == 1
+    assert (stats.requests, stats.hedges, stats.wins) == (1, 1, 1)
+    assert len(started) == 2
+
+
+def test_budget_limits_hedges(api):
+    async def main():
+        policy = HedgePolicy(delay=0.0, budget=0.25)
+        transport = InMemoryTransport(api.slow(0.01))
+        client = xRocketClient(api_key="TEST", transport=transport, hedging=policy)
+        async with client:
+            for _ in range(8):
+                await client.get_invoice(1)
+        return policy.stats()
+
+    stats = asyncio.run(main())
+    assert stats.hedges == 2
+    assert stats.denied == 6
+    assert api.sent("GET", "tg-invoices/1") == 10
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import (
+    InMemoryTransport,
+    TransportConnectError,
+    xRocketAPIError,
+    xRocketClient,
+)
+
+
+def flaky(api, error):
+    """Handler failing the first request with ``error``, a status or an exception."""
+    def handler(*args):
+        first = not api.calls
+        response = api(*args)
+        if not first:
+            return response
+        if isinstance(error, int):
+            return error, {"success": False, "message": "Unavailable"}
+        raise error
+    return handler
+
+
+def client_for(handler) -> xRocketClient:
+    return xRocketClient(
+        api_key="TEST", transport=InMemoryTransport(handler), backoff_base=0
+    )
+
+
+def test_unsafe_create_is_not_retried_after_5xx(api):
+    async def main():
+        async with client_for(flaky(api, 503)) as client:
+            with pytest.raises(xRocketAPIError) as error:
+                await client.create_invoice(currency="TON", amount=1)
+        return error.value.status
+
+    assert asyncio.run(main()) == 503
+    assert api.sent("POST", "tg-invoices") == 1
+
+
+def test_unsafe_create_is_retried_when_never_sent(api):
+    async def main():
+        handler = flaky(api, TransportConnectError("refused"))
+        async with client_for(handler) as client:
+            return await client.create_invoice(currency="TON", amount=1)
+
+    assert asyncio.run(main()).id == api.total + 1
+    assert api.sent("POST", "tg-invoices") == 2
+
+
+@pytest.mark.parametrize("error", [503, asyncio.TimeoutError()])
+def test_safe_requests_are_retried(api, error):
+    async def main():
+        async with client_for(flaky(api, error)) as client:
+            return await client.delete_invoice(3)
+
+    assert asyncio.run(main()) is True
+    assert api.sent("DELETE", "tg-invoices/3") == 2
@@ -0,0 +1,65 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiorocket2 import AiohttpTransport, PoolConfig, xRocketClient
+
+
+async def version_server() -> TestServer:
+    async def version(request: web.Request) -> web.Response:
+        return web.json_response({"success": True, "version": "1.0"})
+
+    app = web.Application()
+    app.router.add_get("/version", version)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def test_session_is_created_lazily():
+    async def main():
+        server = await version_server()
+        transport = AiohttpTransport(pool=PoolConfig(limit=5))
+        base_url = str(server.make_url(""))
+        client = xRocketClient(api_key="TEST", base_url=base_url, transport=transport)
+        async with client:
+            before = transport._session
+            await client.get_version()
+            session = transport._session
+            limit = session.connector.limit
+        await server.close()
+        return before, session, limit
+
+    before, session, limit = asyncio.run(main())
+    assert before is None
+    assert session.closed
+    assert limit == 5
+
+
+def test_pool_stats_count_reused_connections():
+    async def main():
+        server = await version_server()
+        base_url = str(server.make_url(""))
+        async with xRocketClient(api_key="TEST", base_url=base_url) as client:
+            for _ in range(3):
+                await client.get_version()
+            stats = client.pool_stats()
+        await server.close()
+        return stats
+
+    stats = asyncio.run(main())
+    assert (stats.acquired, stats.created) == (3, 1)
+    assert stats.idle == stats.open == 1
+    assert stats.in_use == 0
+
+
+def test_force_close_drops_keepalive():
+    connector = asyncio.run(_build(PoolConfig(force_close=True)))
+    assert connector.force_close
+
+
+async def _build(config: PoolConfig):
+    connector = config.build_connector()
+    await connector.close()
+    return connector
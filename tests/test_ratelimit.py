@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from aiorocket2 import (
+    InMemoryTransport,
+    RateLimiter,
+    SharedRateLimiter,
+    TokenBucket,
+    xRocketClient,
+)
+from aiorocket2.transport import TransportResponse
+
+
+def test_bucket_waits_for_refill():
+    bucket = TokenBucket(rate=10, capacity=2)
+    now = time.monotonic()
+    for _ in range(2):
+        assert bucket.delay(now) == 0
+        bucket.take()
+    assert 0.09 <= bucket.delay(now) <= 0.11
+
+
+def test_throttle_halves_rate_and_success_recovers():
+    limiter = RateLimiter(rate=10, per_endpoint={"GET version": (4, 4)})
+    limiter.throttle("GET version", retry_after=0.5)
+    assert limiter.global_bucket.rate == 5
+    assert limiter.buckets["GET version"].rate == 2
+    assert limiter.buckets["GET version"].delay(time.monotonic()) > 0.4
+    for _ in range(20):
+        limiter.record_success("GET version")
+    assert limiter.global_bucket.rate == 10
+    assert limiter.buckets["GET version"].rate == 4
+
+
+def test_requests_wait_for_tokens(make_client):
+    async def main():
+        limiter = RateLimiter(rate=50, burst=1)
+        async with make_client(rate_limiter=limiter) as client:
+            started = time.monotonic()
+            await asyncio.gather(*(client.get_version() for _ in range(4)))
+            return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.05
+
+
+def test_429_is_retried_after_retry_after(api):
+    def handler(method, url, params, data, headers):
+        if api.sent("GET", "tg-invoices/1") == 0:
+            api(method, url, params, data, headers)
+            return TransportResponse(
+                429, {"Retry-After": "0.05"}, b'{"success": false, "message": "slow"}'
+            )
+        return api(method, url, params, data, headers)
+
+    async def main():
+        limiter = RateLimiter(rate=1000)
+        transport = InMemoryTransport(handler)
+        async with xRocketClient(
+            api_key="TEST", transport=transport, rate_limiter=limiter
+        ) as client:
+            started = time.monotonic()
+            invoice = await client.get_invoice(1)
+            return invoice, time.monotonic() - started
+
+    invoice, elapsed = asyncio.run(main())
+    assert invoice.id == 1
+    assert elapsed >= 0.05
+    assert api.sent("GET", "tg-invoices/1") == 2
+
+
+def test_shared_limiter_spans_instances(tmp_path):
+    path = str(tmp_path / "bucket")
+    first = SharedRateLimiter(path, rate=1, burst=3)
+    second = SharedRateLimiter(path, rate=1, burst=3)
+
+    async def main():
+        for limiter in (first, second, first):
+            await asyncio.wait_for(limiter.acquire("GET version"), 0.05)
+        return second._try_take([0])
+
+    try:
+        assert asyncio.run(main()) > 0.9
+        assert second.fill_levels()["*"] < 0.1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_shared_throttle_reaches_every_instance(tmp_path):
+    path = str(tmp_path / "bucket")
+    endpoints = {"POST app/transfer": (4, 4)}
+    first = SharedRateLimiter(path, rate=10, per_endpoint=endpoints)
+    second = SharedRateLimiter(path, rate=10, per_endpoint=endpoints)
+    try:
+        first.throttle("POST app/transfer", retry_after=1.0)
+        assert second._read(0)[2] == 5
+        assert second._read(1)[2] == 2
+        assert second._try_take(second._slots_for("GET version")) > 0.9
+        for _ in range(20):
+            second.record_success("POST app/transfer")
+        assert first._read(1)[2] == 4
+    finally:
+        first.close()
+        second.close()
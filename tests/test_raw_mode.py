@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+import pytest
+
+from aiorocket2 import RawMode, xRocketAPIError
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgspec"])
+def test_raw_modes(make_client, codec):
+    pytest.importorskip(codec)
+
+    async def main():
+        async with make_client(json_codec=codec) as client:
+            typed = await client.get_invoice(3)
+            with client.raw():
+                as_dict = await client.get_invoice(3)
+            with client.raw(RawMode.BYTES):
+                as_bytes = await client.get_invoice(3)
+                with client.raw(RawMode.OFF):
+                    nested = await client.get_invoice(3)
+        return typed, as_dict, as_bytes, nested
+
+    typed, as_dict, as_bytes, nested = asyncio.run(main())
+    assert typed.id == nested.id == 3
+    assert isinstance(as_dict, dict) and as_dict["id"] == 3
+    assert isinstance(as_bytes, bytes)
+    assert json.loads(as_bytes) == as_dict
+
+
+def test_client_wide_raw_mode(make_client):
+    async def main():
+        async with make_client(raw_mode=RawMode.DICT) as client:
+            page = await client.get_invoices(limit=2)
+            version = await client.get_version()
+        return page, version
+
+    page, version = asyncio.run(main())
+    assert [i["id"] for i in page["results"]] == [100, 99]
+    assert version == "1.0"
+
+
+@pytest.mark.parametrize("codec", ["json", "msgspec"])
+def test_raw_bytes_keep_api_errors(make_client, codec):
+    pytest.importorskip(codec)
+
+    async def main():
+        async with make_client(raw_mode=RawMode.BYTES, json_codec=codec) as client:
+            await client.get_invoice(1000)
+
+    with pytest.raises(xRocketAPIError) as error:
+        asyncio.run(main())
+    assert error.value.status == 404
+    assert error.value.message == "Invoice not found"
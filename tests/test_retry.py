@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import InMemoryTransport, RetryPolicy, xRocketAPIError, xRocketClient
+
+
+def failing(api, failures: int):
+    """Handler answering 503 to the first ``failures`` requests."""
+    def handler(*args):
+        if len(api.calls) < failures:
+            api(*args)
+            return 503, {"success": False, "message": "Unavailable"}
+        return api(*args)
+    return handler
+
+
+def test_full_jitter_stays_within_exponential_cap():
+    policy = RetryPolicy(base=0.1, cap=0.5)
+    for attempt in range(6):
+        for _ in range(50):
+            assert 0 <= policy.backoff(attempt, 0.0) <= min(0.5, 0.1 * 2 ** attempt)
+
+
+def test_decorrelated_jitter_and_retry_after():
+    policy = RetryPolicy(base=0.1, cap=1.0, jitter="decorrelated")
+    for _ in range(50):
+        assert 0.1 <= policy.backoff(3, 0.2) <= 0.6
+    assert policy.backoff(0, 0.0, retry_after=2.0) == 2.0
+    assert RetryPolicy(respect_retry_after=False, cap=0.5).backoff(0, 0, 2.0) <= 0.5
+
+
+def test_no_budget_by_default(api):
+    async def main():
+        policy = RetryPolicy(retries=1, base=0.0)
+        transport = InMemoryTransport(failing(api, 30))
+        client = xRocketClient(api_key="TEST", transport=transport, retry_policy=policy)
+        async with client:
+            for _ in range(15):
+                with pytest.raises(xRocketAPIError):
+                    await client.get_invoice(1)
+        return policy.stats()["GET tg-invoices/{id}"]
+
+    stats = asyncio.run(main())
+    assert (stats.retries, stats.denied) == (15, 0)
+    assert len(api.calls) == 30
+
+
+def test_budget_caps_retries(api):
+    async def main():
+        policy = RetryPolicy(retries=3, base=0.0, budget_ratio=0.1, budget_reserve=2)
+        transport = InMemoryTransport(failing(api, 100))
+        client = xRocketClient(api_key="TEST", transport=transport, retry_policy=policy)
+        async with client:
+            for _ in range(5):
+                with pytest.raises(xRocketAPIError) as error:
+                    await client.get_invoice(1)
+                assert error.value.status == 503
+        return policy.stats()["GET tg-invoices/{id}"]
+
+    stats = asyncio.run(main())
+    assert stats.retries == 2
+    assert stats.denied == 5
+    assert len(api.calls) == 7
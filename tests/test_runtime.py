@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import SyncClient, runtime
+
+
+def test_stock_loop_without_uvloop():
+    loop = runtime.new_event_loop(use_uvloop=False)
+    try:
+        assert type(loop).__module__.startswith("asyncio")
+        factory = loop.get_task_factory()
+        if runtime.HAS_EAGER_TASKS:
+            assert factory is asyncio.eager_task_factory
+        else:
+            assert factory is None
+    finally:
+        loop.close()
+
+
+def test_eager_tasks_can_be_turned_off():
+    loop = runtime.new_event_loop(use_uvloop=False, eager_tasks=False)
+    try:
+        assert loop.get_task_factory() is None
+    finally:
+        loop.close()
+
+
+def test_uvloop_is_used_when_installed():
+    uvloop = pytest.importorskip("uvloop")
+    loop = runtime.new_event_loop()
+    try:
+        assert isinstance(loop, uvloop.Loop)
+        assert loop.get_task_factory() is None
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("use_uvloop", [False, True])
+def test_run_returns_the_result_and_closes_the_loop(make_client, use_uvloop):
+    if use_uvloop:
+        pytest.importorskip("uvloop")
+
+    async def main():
+        async with make_client() as client:
+            invoice = await client.get_invoice(7)
+        return invoice, asyncio.get_running_loop()
+
+    invoice, loop = runtime.run(main(), use_uvloop=use_uvloop)
+    assert invoice.id == 7
+    assert loop.is_closed()
+
+
+def test_sync_client_on_fast_loop(make_client):
+    with SyncClient(client=make_client(), fast_loop=True) as client:
+        assert client.get_invoice(3).id == 3
+        loop = client.loop
+    if runtime.HAS_UVLOOP:
+        assert type(loop).__module__.startswith("uvloop")
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import Priority, PriorityScheduler
+
+
+async def dispatch_order(scheduler, priorities, before_release=None):
+    """Queue one waiter per priority behind a held slot; return dispatch order."""
+    order = []
+    await scheduler.acquire(Priority.NORMAL)
+
+    async def request(i, priority):
+        await scheduler.acquire(priority)
+        order.append(i)
+        scheduler.release()
+
+    tasks = [asyncio.ensure_future(request(i, p)) for i, p in enumerate(priorities)]
+    await asyncio.sleep(0)
+    if before_release is not None:
+        before_release(scheduler)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_most_urgent_waiter_goes_first():
+    priorities = [Priority.LOW, Priority.NORMAL, Priority.HIGH, Priority.HIGH]
+    order = asyncio.run(dispatch_order(PriorityScheduler(1), priorities))
+    assert order == [2, 3, 1, 0]
+
+
+def test_waiting_requests_age_up():
+    def age_low(scheduler):
+        scheduler._waiters[0].enqueued -= 3.0
+
+    priorities = [Priority.LOW, Priority.HIGH]
+    scheduler = PriorityScheduler(1, aging=1.0)
+    order = asyncio.run(dispatch_order(scheduler, priorities, age_low))
+    assert order == [0, 1]
+    stats = scheduler.stats()
+    assert stats[Priority.LOW].wait_max >= 3.0
+    assert stats[Priority.HIGH].dispatched == 1
+
+
+def test_release_right_after_cancelling_the_only_waiter():
+    async def main():
+        scheduler = PriorityScheduler(1)
+        await scheduler.acquire(Priority.NORMAL)
+        waiter = asyncio.ensure_future(scheduler.acquire(Priority.HIGH))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        scheduler.release()  # drops the cancelled waiter before it can run
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    assert scheduler.in_flight == 0
+    assert not scheduler._waiters
+
+
+def test_client_priority_overrides_endpoint(make_client):
+    scheduler = PriorityScheduler(4)
+    client = make_client(scheduler=scheduler)
+    assert scheduler.priority_for("GET tg-invoices") is Priority.LOW
+    with client.priority(Priority.HIGH):
+        assert scheduler.priority_for("GET tg-invoices") is Priority.HIGH
+    assert scheduler.priority_for("POST tg-invoices") is Priority.HIGH
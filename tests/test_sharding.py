@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import InMemoryTransport, RetryPolicy, ShardedClient, xRocketAPIError
+
+
+def owned(api, owners):
+    """Handler where invoice ``id`` only exists for the key ``owners(id)``.
+
+    Created invoices can be read back afterwards.
+    """
+    def handler(method, url, params, data, headers):
+        path = url.split("/", 3)[3]
+        if method == "POST":
+            created = api(method, url, params, data, headers)
+            api.total += 1
+            return created
+        if path.startswith("tg-invoices/"):
+            if owners(int(path.split("/")[1])) != headers["Rocket-Pay-Key"]:
+                api.calls.append((method, path, None))
+                return 404, {"success": False, "message": "Invoice not found"}
+        return api(method, url, params, data, headers)
+    return handler
+
+
+def sharded(handler, **kwargs):
+    return ShardedClient(
+        ["KEY_A", "KEY_B"], names=["a", "b"],
+        transport=InMemoryTransport(handler), **kwargs,
+    )
+
+
+def test_created_resources_stick_to_their_key(api):
+    async def main():
+        async with sharded(owned(api, lambda i: "KEY_B")) as pool:
+            await pool.shard("a").get_version()  # "a" is now the busier key
+            invoice = await pool.create_invoice(currency="TON", amount=1)
+            await pool.get_invoice(invoice.id)
+            return pool.stats()
+
+    stats = asyncio.run(main())
+    assert (stats["a"].requests, stats["b"].requests) == (1, 2)
+    assert stats["b"].sticky == 1
+
+
+def test_reads_probe_for_the_owner_once(api):
+    async def main():
+        async with sharded(owned(api, lambda i: "KEY_B")) as pool:
+            await pool.get_invoice(5)
+            await pool.get_invoice(5)
+            deleted = await pool.delete_invoice(5)
+            return deleted, pool.stats()
+
+    deleted, stats = asyncio.run(main())
+    assert deleted is True
+    assert (stats["a"].requests, stats["b"].requests) == (1, 3)
+    assert stats["b"].sticky == 0
+
+
+def test_unknown_owner_is_not_guessed_for_writes(api):
+    async def main():
+        async with sharded(owned(api, lambda i: "KEY_B")) as pool:
+            with pytest.raises(ValueError, match="assign"):
+                await pool.delete_invoice(5)
+            pool.assign("tg-invoices/5", "b")
+            return await pool.delete_invoice(5)
+
+    assert asyncio.run(main()) is True
+    assert api.sent("DELETE", "tg-invoices/5") == 1
+    assert len(api.calls) == 1
+
+
+def test_failing_key_does_not_abort_the_probe(api):
+    def handler(method, url, params, data, headers):
+        if headers["Rocket-Pay-Key"] == "KEY_A":
+            return 503, {"success": False, "message": "Unavailable"}
+        return api(method, url, params, data, headers)
+
+    async def main():
+        async with sharded(handler, retry_policy=RetryPolicy(retries=0)) as pool:
+            invoice = await pool.get_invoice(5)
+            return invoice, pool._sticky
+
+    invoice, sticky = asyncio.run(main())
+    assert invoice.id == 5
+    assert sticky[("tg-invoices/{id}", "5")].client.name == "b"
+
+
+def test_owner_error_beats_not_found(api):
+    def handler(method, url, params, data, headers):
+        if headers["Rocket-Pay-Key"] == "KEY_A":
+            return 503, {"success": False, "message": "Unavailable"}
+        return 404, {"success": False, "message": "Invoice not found"}
+
+    async def main():
+        async with sharded(handler, retry_policy=RetryPolicy(retries=0)) as pool:
+            with pytest.raises(xRocketAPIError) as error:
+                await pool.get_invoice(5)
+            return error.value.status
+
+    assert asyncio.run(main()) == 503
+
+
+def test_app_scoped_reads_need_a_shard(api):
+    async def main():
+        async with sharded(api) as pool:
+            with pytest.raises(ValueError):
+                await pool.get_invoices()
+            return await pool.shard("a").get_invoices(limit=1)
+
+    page = asyncio.run(main())
+    assert len(page.results) == 1
@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from aiorocket2 import DeadlineExceeded, InMemoryTransport, SyncClient
+
+
+def test_blocking_calls_share_one_client(api, make_client):
+    results = []
+
+    with SyncClient(client=make_client()) as client:
+        assert client.get_invoice(1).id == 1
+        workers = [
+            threading.Thread(target=lambda i=i: results.append(client.get_invoice(i)))
+            for i in range(2, 6)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert client.api_key == "TEST"
+
+    assert sorted(invoice.id for invoice in results) == [2, 3, 4, 5]
+    assert api.sent("GET", "tg-invoices/1") == 1
+
+
+def test_context_managers_apply_to_the_calling_thread(api, make_client):
+    slow = make_client(transport=InMemoryTransport(api.slow(0.2)))
+    with SyncClient(client=slow) as client:
+        with pytest.raises(DeadlineExceeded):
+            with client.deadline(0.02):
+                client.get_invoice(1)
+        with client.call_info() as calls:
+            client.get_version()
+
+    assert [info.endpoint for info in calls] == ["GET version"]
+
+
+def test_run_rejects_calls_from_its_own_loop(make_client):
+    async def nested():
+        return client.run(client.client.get_version())
+
+    with SyncClient(client=make_client()) as client:
+        with pytest.raises(RuntimeError, match="own event loop"):
+            client.run(nested())
+
+
+def test_closed_client_refuses_calls(make_client):
+    client = SyncClient(client=make_client())
+    client.close()
+    client.close()  # idempotent
+    assert not client._thread.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.get_version()
+
+
+def test_api_key_or_client_is_required():
+    with pytest.raises(ValueError):
+        SyncClient()
+
+
+def test_missing_client_raises_attribute_error():
+    client = SyncClient.__new__(SyncClient)  # as before __init__ or when unpickling
+    with pytest.raises(AttributeError):
+        client.get_invoice
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from aiorocket2 import (
+    AdmissionControl,
+    DeadlineExceeded,
+    InMemoryTransport,
+    RateLimiter,
+    RetryPolicy,
+    TenantLimits,
+    TenantManager,
+    xRocketAPIError,
+)
+
+
+def test_latency_percentiles(api):
+    async def main():
+        async with TenantManager(transport=InMemoryTransport(api)) as manager:
+            view = manager.client("KEY", name="shop")
+            await view.get_invoice(1)
+            for i in range(100):
+                view._tenant.latency.add(i / 100)
+            return manager.stats()["shop"]
+
+    stats = asyncio.run(main())
+    assert stats.requests == 1
+    assert 0.45 <= stats.latency_p50 <= 0.55
+    assert 0.95 <= stats.latency_p99 < 1.0
+
+
+def test_slot_wait_is_bounded_by_deadline(api):
+    async def main():
+        transport = InMemoryTransport(api.slow(0.2))
+        limits = TenantLimits(max_in_flight=1)
+        async with TenantManager(transport=transport, default_limits=limits) as manager:
+            view = manager.client("KEY")
+            busy = asyncio.ensure_future(view.get_invoice(1))
+            await asyncio.sleep(0)
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                with view.deadline(0.02):
+                    await view.get_invoice(2)
+            waited = time.monotonic() - started
+            await busy
+            return waited, view._tenant.limit.in_flight
+
+    waited, in_flight = asyncio.run(main())
+    assert waited < 0.1
+    assert in_flight == 0
+
+
+def test_retry_budget_and_latency_are_per_tenant(api):
+    def handler(method, url, params, data, headers):
+        if headers["Rocket-Pay-Key"] == "NOISY":
+            return 503, {"success": False, "message": "Unavailable"}
+        return api(method, url, params, data, headers)
+
+    async def main():
+        policy = RetryPolicy(retries=3, base=0.0, budget_ratio=0.1, budget_reserve=2)
+        transport = InMemoryTransport(handler)
+        async with TenantManager(transport=transport, retry_policy=policy) as manager:
+            noisy, quiet = manager.client("NOISY"), manager.client("QUIET")
+            for _ in range(3):
+                with pytest.raises(xRocketAPIError):
+                    await noisy.get_invoice(1)
+            await quiet.get_invoice(1)
+            return noisy, quiet, policy
+
+    noisy, quiet, policy = asyncio.run(main())
+    assert noisy.retry_policy.tokens < 1
+    assert quiet.retry_policy.tokens >= 1
+    assert policy.tokens == 2 and not policy.stats()
+    assert quiet.latency.count("GET tg-invoices/{id}") == 1
+    assert noisy.latency.count("GET tg-invoices/{id}") == 0
+
+
+def test_admission_is_per_tenant(api):
+    async def main():
+        admission = AdmissionControl(default=(1, 0))
+        transport = InMemoryTransport(api.slow(0.05))
+        async with TenantManager(transport=transport, admission=admission) as manager:
+            first, second = manager.client("FIRST"), manager.client("SECOND")
+            return await asyncio.gather(first.get_invoice(1), second.get_invoice(2))
+
+    invoices = asyncio.run(main())
+    assert [invoice.id for invoice in invoices] == [1, 2]
+
+
+def test_tenant_rate_is_chained_with_the_shared_limiter(api):
+    async def main():
+        shared = RateLimiter(1000, 2)
+        limits = TenantLimits(rate=1000, burst=10)
+        async with TenantManager(
+            transport=InMemoryTransport(api), rate_limiter=shared, default_limits=limits
+        ) as manager:
+            view = manager.client("KEY")
+            for i in range(2):
+                await view.get_invoice(i + 1)
+            return view.rate_limiter.fill_levels()["*"], shared.fill_levels()["*"]
+
+    view_fill, shared_fill = asyncio.run(main())
+    # the shared bucket (burst 2) is drained although the tenant's is not
+    assert shared_fill < 0.5
+    assert view_fill == pytest.approx(shared_fill, abs=0.1)
+
+
+def test_remove_stops_the_view(api):
+    async def main():
+        async with TenantManager(transport=InMemoryTransport(api)) as manager:
+            view = manager.client("KEY")
+            view.start_heartbeat(interval=60)
+            heartbeat = view._heartbeat
+            await manager.remove("KEY")
+            await manager.remove("KEY")  # already gone: nothing to do
+            views = len(manager)
+            # the shared transport stays open for the other tenants
+            invoice = await manager.client("OTHER").get_invoice(1)
+            return heartbeat, view._heartbeat, views, invoice
+
+    heartbeat, current, views, invoice = asyncio.run(main())
+    assert heartbeat.cancelled()
+    assert current is None
+    assert views == 0
+    assert invoice.id == 1
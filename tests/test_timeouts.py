@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from aiorocket2 import (
+    AdaptiveTimeout,
+    InMemoryTransport,
+    LatencyRecorder,
+    xRocketAPIError,
+)
+
+
+def recorder(key: str, samples: int, value: float) -> LatencyRecorder:
+    latency = LatencyRecorder()
+    for _ in range(samples):
+        latency.record(key, value)
+    return latency
+
+
+def test_read_timeout_follows_observed_latency():
+    timeouts = AdaptiveTimeout(multiplier=3, min_timeout=0.1, max_timeout=10)
+    key = "GET tg-invoices/{id}"
+    assert timeouts.read_timeout(key, recorder(key, 5, 0.2)) == 10
+    assert abs(timeouts.read_timeout(key, recorder(key, 50, 0.2)) - 0.6) < 1e-9
+    assert timeouts.read_timeout(key, recorder(key, 50, 0.001)) == 0.1
+    assert timeouts.read_timeout(key, recorder(key, 50, 60)) == 10
+
+
+def test_timeout_splits_connect_and_read():
+    timeouts = AdaptiveTimeout(
+        connect_timeout=2, max_timeout=10, overrides={"GET tg-invoices": 30}
+    )
+    timeout = timeouts.timeout_for("GET tg-invoices", LatencyRecorder())
+    assert (timeout.connect, timeout.sock_read, timeout.total) == (2, 30, 12)
+
+
+def test_timed_out_attempts_are_counted(api, make_client):
+    async def main():
+        timeouts = AdaptiveTimeout(max_timeout=0.02, connect_timeout=0.0)
+        transport = InMemoryTransport(api.slow(0.2))
+        client = make_client(
+            transport=transport, adaptive_timeout=timeouts, retries=1, backoff_base=0
+        )
+        async with client:
+            with pytest.raises(xRocketAPIError) as error:
+                await client.get_invoice(1)
+        return error.value, timeouts.stats()["GET tg-invoices/{id}"]
+
+    error, stats = asyncio.run(main())
+    assert error.status is None
+    assert (stats.requests, stats.timeouts, stats.timeout_rate) == (2, 2, 1.0)
@@ -0,0 +1,114 @@
+import asyncio
+import socket
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiorocket2 import (
+    AiohttpTransport,
+    HttpxTransport,
+    InMemoryTransport,
+    TransportResponse,
+    xRocketClient,
+)
+
+TIMEOUT = aiohttp.ClientTimeout(total=1.0)
+
+
+async def request(transport, url="http://api/version"):
+    return await transport.request(
+        "GET", url, params=None, data=None, headers={}, timeout=TIMEOUT
+    )
+
+
+def test_in_memory_handler_results():
+    async def main():
+        responses = [
+            (200, {"ok": True}),
+            (404, b"{}"),
+            TransportResponse(204, {}, b""),
+        ]
+
+        async def handler(*args):
+            return responses.pop(0)
+
+        transport = InMemoryTransport(handler)
+        return [await request(transport) for _ in range(3)], transport.requests
+
+    (first, second, third), requests = asyncio.run(main())
+    assert (first.status, first.body) == (200, b'{"ok": true}')
+    assert (second.status, second.body) == (404, b"{}")
+    assert third.status == 204
+    assert requests == 3
+
+
+def test_in_memory_honours_total_timeout(api):
+    transport = InMemoryTransport(api.slow(0.5))
+    timeout = aiohttp.ClientTimeout(total=0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(transport.request(
+            "GET", "http://api/version", params=None, data=None, headers={},
+            timeout=timeout,
+        ))
+
+
+async def serve() -> TestServer:
+    async def version(request: web.Request) -> web.Response:
+        return web.json_response({"version": request.query.get("v", "1.0")})
+
+    app = web.Application()
+    app.router.add_get("/version", version)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def httpx_transport() -> HttpxTransport:
+    pytest.importorskip("httpx")
+    return HttpxTransport(http2=False)
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize("make_transport", [AiohttpTransport, httpx_transport])
+def test_network_transports(make_transport):
+    async def main():
+        server = await serve()
+        transport = make_transport()
+        base_url = str(server.make_url("")).rstrip("/")
+        async with xRocketClient(
+            api_key="TEST", base_url=base_url, transport=transport
+        ) as client:
+            version = await client.get_version()
+            response = await transport.request(
+                "GET", f"{base_url}/version", params={"v": "2"}, data=None,
+                headers={}, timeout=TIMEOUT,
+            )
+        await server.close()
+        return version, response
+
+    version, response = asyncio.run(main())
+    assert version == "1.0"
+    assert response.status == 200
+    assert b'"2"' in response.body
+
+
+@pytest.mark.parametrize("make_transport", [AiohttpTransport, httpx_transport])
+def test_refused_connection_is_a_client_error(make_transport):
+    port = unused_port()
+
+    async def main():
+        transport = make_transport()
+        try:
+            await request(transport, f"http://127.0.0.1:{port}/version")
+        finally:
+            await transport.aclose()
+
+    with pytest.raises(aiohttp.ClientError):
+        asyncio.run(main())
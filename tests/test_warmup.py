@@ -0,0 +1,51 @@
+import asyncio
+
+from aiorocket2 import InMemoryTransport, PoolConfig, ResponseCache, xRocketClient
+
+
+def test_warmup_sends_every_request_with_coalescing(api):
+    async def main():
+        transport = InMemoryTransport(api.slow(0.01))
+        client = xRocketClient(api_key="TEST", transport=transport, coalesce_gets=True)
+        async with client:
+            return await client.warmup(8)
+
+    assert asyncio.run(main()) == 8
+    assert api.sent("GET", "version") == 8
+
+
+def test_warmup_bypasses_cache(api, make_client):
+    async def main():
+        async with make_client(cache=ResponseCache({"GET version": 60.0})) as client:
+            await client.warmup(2)
+            await client.warmup(2)
+
+    asyncio.run(main())
+    assert api.sent("GET", "version") == 4
+
+
+def test_heartbeat_rewarms_until_stopped(api, make_client):
+    async def main():
+        async with make_client() as client:
+            client.start_heartbeat(interval=0.01, n_connections=2)
+            await asyncio.sleep(0.035)
+            await client.stop_heartbeat()
+            sent = api.sent("GET", "version")
+            await asyncio.sleep(0.02)
+        return sent
+
+    sent = asyncio.run(main())
+    assert sent >= 4
+    assert api.sent("GET", "version") == sent
+
+
+def test_warmup_is_capped_by_pool_limit(api):
+    transport = InMemoryTransport(api)
+    transport.pool = PoolConfig(limit=3)
+
+    async def main():
+        async with xRocketClient(api_key="TEST", transport=transport) as client:
+            return await client.warmup(10)
+
+    assert asyncio.run(main()) == 3
+    assert api.sent("GET", "version") == 3